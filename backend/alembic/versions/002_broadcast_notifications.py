@@ -0,0 +1,58 @@
+"""broadcast notifications and read cursors
+
+Revision ID: 002_broadcast_notifications
+Revises: 001_initial
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "002_broadcast_notifications"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # === broadcast_notifications ===
+    op.create_table(
+        "broadcast_notifications",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("type", sa.String(30), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("challenge_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_broadcast_notifications_created_at",
+        "broadcast_notifications",
+        ["created_at"],
+    )
+
+    # === notification_read_cursors ===
+    op.create_table(
+        "notification_read_cursors",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "last_read_broadcast_id", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_read_cursors")
+    op.drop_table("broadcast_notifications")
@@ -0,0 +1,43 @@
+"""notification composite indexes
+
+단일 컬럼 인덱스(user_id, is_read)를 목록/미읽음 조회용 복합 인덱스로 교체한다.
+is_read 단독 인덱스는 선택도가 낮아 사용되지 않고, user_id 단독 인덱스는
+복합 인덱스의 선두 컬럼으로 대체된다.
+
+Revision ID: 003_notification_indexes
+Revises: 002_broadcast_notifications
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "003_notification_indexes"
+down_revision: Union[str, None] = "002_broadcast_notifications"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notifications_user_created",
+        "notifications",
+        ["user_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_notifications_user_read_created",
+        "notifications",
+        ["user_id", "is_read", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_notifications_is_read", table_name="notifications")
+    op.drop_index("ix_notifications_user_id", table_name="notifications")
+
+
+def downgrade() -> None:
+    op.create_index("ix_notifications_user_id", "notifications", ["user_id"])
+    op.create_index("ix_notifications_is_read", "notifications", ["is_read"])
+    op.drop_index("ix_notifications_user_read_created", table_name="notifications")
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
@@ -0,0 +1,49 @@
+"""writeup keyset pagination indexes
+
+공개 Write-up 목록의 정렬별 keyset 조회를 위한 부분 인덱스.
+
+Revision ID: 004_writeup_keyset_indexes
+Revises: 003_notification_indexes
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "004_writeup_keyset_indexes"
+down_revision: Union[str, None] = "003_notification_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # newest / oldest (같은 인덱스를 양방향으로 스캔)
+    op.create_index(
+        "ix_writeups_public_created",
+        "writeups",
+        ["created_at", "id"],
+        postgresql_where=sa.text("is_public"),
+    )
+    # most_upvoted
+    op.create_index(
+        "ix_writeups_public_upvotes",
+        "writeups",
+        ["upvotes", "created_at", "id"],
+        postgresql_where=sa.text("is_public"),
+    )
+    # 챌린지별 목록
+    op.create_index(
+        "ix_writeups_public_challenge_created",
+        "writeups",
+        ["challenge_id", "created_at", "id"],
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_writeups_public_challenge_created", table_name="writeups")
+    op.drop_index("ix_writeups_public_upvotes", table_name="writeups")
+    op.drop_index("ix_writeups_public_created", table_name="writeups")
@@ -0,0 +1,39 @@
+"""writeup votes
+
+Revision ID: 005_writeup_votes
+Revises: 004_writeup_keyset_indexes
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "005_writeup_votes"
+down_revision: Union[str, None] = "004_writeup_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # === writeup_votes ===
+    op.create_table(
+        "writeup_votes",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("writeup_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["writeup_id"], ["writeups.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "writeup_id"),
+    )
+    op.create_index("ix_writeup_votes_writeup_id", "writeup_votes", ["writeup_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("writeup_votes")
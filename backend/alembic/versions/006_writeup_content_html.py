@@ -0,0 +1,28 @@
+"""writeup content html
+
+Revision ID: 006_writeup_content_html
+Revises: 005_writeup_votes
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "006_writeup_content_html"
+down_revision: Union[str, None] = "005_writeup_votes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 Write-up의 HTML은 마이그레이션에서 렌더링하지 않는다 (content_html이 NULL이면
+    # 클라이언트가 렌더링한다). 앱 코드(sanitizer)가 바뀌어도 이 리비전의 결과가 달라지지
+    # 않도록 백필은 python -m scripts.backfill_writeup_html로 따로 실행한다.
+    op.add_column("writeups", sa.Column("content_html", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("writeups", "content_html")
@@ -0,0 +1,94 @@
+"""full-text search vectors
+
+챌린지(제목/태그/설명)와 Write-up 본문에 전문 검색용 생성 컬럼(tsvector)과
+GIN 인덱스를 추가하고, 챌린지 제목 유사도 검색용 pg_trgm 인덱스를 만든다.
+
+array_to_string은 STABLE 함수라 생성 컬럼에 쓸 수 없으므로 IMMUTABLE 래퍼를 둔다.
+생성 컬럼 식은 이 시점의 값을 그대로 적어 두며, 모델의 SEARCH_VECTOR_SQL과 같아야 한다.
+
+Revision ID: 007_search_vectors
+Revises: 006_writeup_content_html
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision: str = "007_search_vectors"
+down_revision: Union[str, None] = "006_writeup_content_html"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 제목 A, 태그 B, 설명 C 가중치
+CHALLENGE_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', "
+    "coalesce(immutable_array_to_string(tags::text[], ' '), '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+WRITEUP_SEARCH_VECTOR_SQL = "to_tsvector('simple', left(content, 100000))"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION immutable_array_to_string(text[], text)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$ SELECT array_to_string($1, $2) $$
+        """
+    )
+
+    # === challenges ===
+    op.add_column(
+        "challenges",
+        sa.Column(
+            "search_vector",
+            TSVECTOR(),
+            sa.Computed(CHALLENGE_SEARCH_VECTOR_SQL, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_challenges_search_vector",
+        "challenges",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_challenges_title_trgm",
+        "challenges",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+    # === writeups ===
+    op.add_column(
+        "writeups",
+        sa.Column(
+            "search_vector",
+            TSVECTOR(),
+            sa.Computed(WRITEUP_SEARCH_VECTOR_SQL, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_writeups_search_vector",
+        "writeups",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_writeups_search_vector", table_name="writeups")
+    op.drop_column("writeups", "search_vector")
+    op.drop_index("ix_challenges_title_trgm", table_name="challenges")
+    op.drop_index("ix_challenges_search_vector", table_name="challenges")
+    op.drop_column("challenges", "search_vector")
+    op.execute("DROP FUNCTION IF EXISTS immutable_array_to_string(text[], text)")
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 남겨 둔다
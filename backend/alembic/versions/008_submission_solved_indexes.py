@@ -0,0 +1,47 @@
+"""submission solved partial indexes
+
+정답 제출만 대상으로 하는 부분 인덱스.
+풀이 목록/최근 활동/스트릭/히트맵/주력 카테고리 조회는 모두
+`user_id = ? AND is_correct` 조건에 submitted_at 정렬/그룹을 사용하므로
+정답 행만 담은 (user_id, submitted_at) 인덱스로 읽는다.
+challenge_id를 INCLUDE 하여 풀이 ID 조회는 index-only scan으로 처리된다.
+
+Revision ID: 008_submission_solved_indexes
+Revises: 007_search_vectors
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008_submission_solved_indexes"
+down_revision: Union[str, None] = "007_search_vectors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 유저별 풀이 (풀이 ID, 최근 활동, 스트릭, 히트맵)
+    op.create_index(
+        "ix_submissions_user_solved_at",
+        "submissions",
+        ["user_id", "submitted_at"],
+        postgresql_include=["challenge_id"],
+        postgresql_where=sa.text("is_correct"),
+    )
+    # 챌린지별 풀이 순서 (최초 풀이자, 풀이자 목록)
+    op.create_index(
+        "ix_submissions_challenge_solved_at",
+        "submissions",
+        ["challenge_id", "submitted_at"],
+        postgresql_include=["user_id"],
+        postgresql_where=sa.text("is_correct"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_challenge_solved_at", table_name="submissions")
+    op.drop_index("ix_submissions_user_solved_at", table_name="submissions")
@@ -0,0 +1,113 @@
+"""solves table
+
+정답 제출을 별도의 좁은 solves 테이블로 분리한다.
+기존 정답 제출을 (유저, 챌린지)별 최초 제출 시각으로 옮기며,
+지급 점수는 기록이 없으므로 현재 챌린지 점수로 채운다.
+
+풀이 중복 방지는 solves 기본 키가 맡으므로 submissions의 정답 유니크 인덱스는 삭제한다
+(submissions는 시도 로그로만 사용). 008의 정답 부분 인덱스도 같은 구성으로 solves에 다시 만들고
+submissions에서는 삭제한다.
+- ix_submissions_user_solved_at → ix_solves_user_solved_at (최근 활동, 스트릭, 히트맵)
+- ix_submissions_challenge_solved_at → ix_solves_challenge_solved_at (챌린지별 풀이 순서)
+
+Revision ID: 009_solves_table
+Revises: 008_submission_solved_indexes
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "009_solves_table"
+down_revision: Union[str, None] = "008_submission_solved_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # === solves ===
+    op.create_table(
+        "solves",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("challenge_id", sa.Integer(), nullable=False),
+        sa.Column("points_awarded", sa.Integer(), nullable=False),
+        sa.Column(
+            "solved_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["challenge_id"], ["challenges.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "challenge_id"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO solves (user_id, challenge_id, points_awarded, solved_at)
+        SELECT DISTINCT ON (s.user_id, s.challenge_id)
+               s.user_id, s.challenge_id, c.points, coalesce(s.submitted_at, now())
+        FROM submissions s
+        JOIN challenges c ON c.id = s.challenge_id
+        WHERE s.is_correct
+        ORDER BY s.user_id, s.challenge_id, s.submitted_at
+        """
+    )
+    op.create_index(
+        "ix_solves_user_solved_at",
+        "solves",
+        ["user_id", "solved_at"],
+        postgresql_include=["challenge_id"],
+    )
+    op.create_index(
+        "ix_solves_challenge_solved_at", "solves", ["challenge_id", "solved_at"]
+    )
+
+    op.drop_index("ix_submissions_challenge_solved_at", table_name="submissions")
+    op.drop_index("ix_submissions_user_solved_at", table_name="submissions")
+    op.drop_index("uq_submissions_user_challenge_correct", table_name="submissions")
+
+
+def downgrade() -> None:
+    # 009 이후에는 동시에 들어온 중복 정답 시도도 기록되므로, 유니크 인덱스를 다시 만들기 전에
+    # (유저, 챌린지)별 최초 정답만 남기고 나머지는 오답 시도로 바꾼다
+    op.execute(
+        """
+        UPDATE submissions AS s
+        SET is_correct = false
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY user_id, challenge_id ORDER BY submitted_at, id
+                   ) AS rn
+            FROM submissions
+            WHERE is_correct
+        ) AS d
+        WHERE s.id = d.id AND d.rn > 1
+        """
+    )
+    op.create_index(
+        "uq_submissions_user_challenge_correct",
+        "submissions",
+        ["user_id", "challenge_id"],
+        unique=True,
+        postgresql_where=sa.text("is_correct = true"),
+    )
+    op.create_index(
+        "ix_submissions_user_solved_at",
+        "submissions",
+        ["user_id", "submitted_at"],
+        postgresql_include=["challenge_id"],
+        postgresql_where=sa.text("is_correct"),
+    )
+    op.create_index(
+        "ix_submissions_challenge_solved_at",
+        "submissions",
+        ["challenge_id", "submitted_at"],
+        postgresql_include=["user_id"],
+        postgresql_where=sa.text("is_correct"),
+    )
+    op.drop_table("solves")
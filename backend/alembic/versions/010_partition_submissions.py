@@ -0,0 +1,134 @@
+"""partition submissions by month
+
+submissions를 submitted_at 기준 월별 범위 파티션 테이블로 바꾼다.
+기존 행이 있는 달부터 3개월 뒤까지 파티션을 만들고, 범위 밖의 행을 받을
+기본 파티션(submissions_default)을 둔다. 이후 파티션은 Celery beat 태스크가
+미리 만들고, 보존 기간이 지난 파티션은 압축 파일로 내보낸 뒤 삭제한다.
+
+파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, submitted_at)이 된다.
+id는 기존 시퀀스를 그대로 사용한다.
+파티션 이름 규칙은 app.services.partition_service와 같다 (submissions_pYYYYMM).
+
+Revision ID: 010_partition_submissions
+Revises: 009_solves_table
+Create Date: 2026-10-19
+
+"""
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010_partition_submissions"
+down_revision: Union[str, None] = "009_solves_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition(month: date) -> None:
+    op.execute(
+        f"CREATE TABLE submissions_p{month:%Y%m} PARTITION OF submissions "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE submissions RENAME TO submissions_legacy")
+    op.execute(
+        "ALTER TABLE submissions_legacy RENAME CONSTRAINT submissions_pkey "
+        "TO submissions_legacy_pkey"
+    )
+    op.drop_index("ix_submissions_user_id", table_name="submissions_legacy")
+    op.drop_index("ix_submissions_challenge_id", table_name="submissions_legacy")
+
+    op.execute(
+        """
+        CREATE TABLE submissions (
+            id integer NOT NULL DEFAULT nextval('submissions_id_seq'),
+            user_id integer NOT NULL,
+            challenge_id integer NOT NULL,
+            submitted_flag varchar(500) NOT NULL,
+            is_correct boolean NOT NULL DEFAULT false,
+            submitted_at timestamptz NOT NULL DEFAULT now(),
+            CONSTRAINT submissions_pkey PRIMARY KEY (id, submitted_at),
+            CONSTRAINT submissions_user_id_fkey FOREIGN KEY (user_id)
+                REFERENCES users (id) ON DELETE CASCADE,
+            CONSTRAINT submissions_challenge_id_fkey FOREIGN KEY (challenge_id)
+                REFERENCES challenges (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (submitted_at)
+        """
+    )
+
+    oldest = op.get_bind().execute(
+        sa.text("SELECT min(submitted_at) FROM submissions_legacy")
+    ).scalar()
+    current = datetime.now(UTC).date().replace(day=1)
+    month = oldest.astimezone(UTC).date().replace(day=1) if oldest else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        _create_partition(month)
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE submissions_default PARTITION OF submissions DEFAULT")
+
+    op.execute(
+        """
+        INSERT INTO submissions
+            (id, user_id, challenge_id, submitted_flag, is_correct, submitted_at)
+        SELECT id, user_id, challenge_id, submitted_flag, is_correct,
+               coalesce(submitted_at, now())
+        FROM submissions_legacy
+        """
+    )
+    # 시퀀스가 기존 테이블과 함께 삭제되지 않도록 소유 컬럼을 옮긴다
+    op.execute("ALTER SEQUENCE submissions_id_seq OWNED BY submissions.id")
+    op.drop_table("submissions_legacy")
+
+    op.create_index("ix_submissions_user_id", "submissions", ["user_id"])
+    op.create_index("ix_submissions_challenge_id", "submissions", ["challenge_id"])
+    # 시간순으로 쌓이는 로그이므로 일별 통계용으로는 BRIN이면 충분하다
+    op.create_index(
+        "ix_submissions_submitted_at",
+        "submissions",
+        ["submitted_at"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE submissions RENAME TO submissions_partitioned")
+    op.execute(
+        "ALTER TABLE submissions_partitioned RENAME CONSTRAINT submissions_pkey "
+        "TO submissions_partitioned_pkey"
+    )
+    op.drop_index("ix_submissions_user_id", table_name="submissions_partitioned")
+    op.drop_index("ix_submissions_challenge_id", table_name="submissions_partitioned")
+    op.drop_index("ix_submissions_submitted_at", table_name="submissions_partitioned")
+
+    op.execute(
+        """
+        CREATE TABLE submissions (
+            id integer NOT NULL DEFAULT nextval('submissions_id_seq'),
+            user_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            challenge_id integer NOT NULL REFERENCES challenges (id) ON DELETE CASCADE,
+            submitted_flag varchar(500) NOT NULL,
+            is_correct boolean NOT NULL DEFAULT false,
+            submitted_at timestamptz DEFAULT now(),
+            CONSTRAINT submissions_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("INSERT INTO submissions SELECT * FROM submissions_partitioned")
+    op.execute("ALTER SEQUENCE submissions_id_seq OWNED BY submissions.id")
+    op.execute("DROP TABLE submissions_partitioned")
+
+    op.create_index("ix_submissions_user_id", "submissions", ["user_id"])
+    op.create_index("ix_submissions_challenge_id", "submissions", ["challenge_id"])
@@ -0,0 +1,51 @@
+"""writeup legacy upvotes
+
+writeups.upvotes를 writeup_votes 행 수로 다시 계산할 수 있도록,
+005 이전에 투표자 기록 없이 쌓인 추천 수를 legacy_upvotes로 분리해 둔다.
+이후 추천 수는 항상 legacy_upvotes + writeup_votes 행 수로 계산된다.
+
+Redis에 미반영 추천 증가분이 남아 있으면 그만큼 legacy_upvotes가 작게 잡히므로,
+flush_writeup_upvotes 태스크를 한 번 실행한 뒤 적용한다.
+
+Revision ID: 011_writeup_legacy_upvotes
+Revises: 010_partition_submissions
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "011_writeup_legacy_upvotes"
+down_revision: Union[str, None] = "010_partition_submissions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "writeups",
+        sa.Column("legacy_upvotes", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE writeups AS w
+        SET legacy_upvotes = greatest(w.upvotes - c.votes, 0)
+        FROM (
+            SELECT writeup_id, count(*) AS votes FROM writeup_votes GROUP BY writeup_id
+        ) AS c
+        WHERE c.writeup_id = w.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE writeups SET legacy_upvotes = upvotes
+        WHERE NOT EXISTS (SELECT 1 FROM writeup_votes v WHERE v.writeup_id = writeups.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("writeups", "legacy_upvotes")
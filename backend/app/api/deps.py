@@ -3,22 +3,48 @@
 인증, DB 세션, Redis 등 공통 의존성을 정의한다.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from ipaddress import ip_address
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
+from app.core import token_store
 from app.core.exceptions import UnauthorizedException
-from app.core.security import decode_token
-from app.database import get_db
+from app.core.rate_limit import (
+    RateLimitAlgorithm,
+    check_local_rate_limit,
+    check_rate_limit,
+)
+from app.core.redis import get_redis_client
+from app.core.security import decode_token_cached
+from app.database import get_db, get_read_db
+
+_TRUSTED_PROXIES = get_settings().trusted_proxy_networks
 
 security_scheme = HTTPBearer()
 optional_security_scheme = HTTPBearer(auto_error=False)
 
-_redis_client: Redis | None = None
+
+async def get_user_id_from_token(token: str) -> int | None:
+    """access 토큰에서 유저 ID를 추출한다 (WebSocket 등 헤더 인증이 없는 경로용).
+
+    Args:
+        token: JWT access 토큰.
+
+    Returns:
+        유저 ID 또는 인증 실패 시 None.
+    """
+    payload = decode_token_cached(token)
+    if payload is None or payload.get("type") != "access":
+        return None
+    if await token_store.is_revoked(payload):
+        return None
+    user_id = payload.get("sub")
+    return int(user_id) if user_id else None
 
 
 async def get_current_user_id(
@@ -35,9 +61,11 @@ async def get_current_user_id(
     Raises:
         UnauthorizedException: 토큰이 유효하지 않을 때.
     """
-    payload = decode_token(credentials.credentials)
+    payload = decode_token_cached(credentials.credentials)
     if payload is None or payload.get("type") != "access":
         raise UnauthorizedException("유효하지 않은 토큰입니다.")
+    if await token_store.is_revoked(payload):
+        raise UnauthorizedException("폐기된 세션입니다.")
     user_id = payload.get("sub")
     if user_id is None:
         raise UnauthorizedException("토큰에 유저 정보가 없습니다.")
@@ -59,9 +87,11 @@ async def get_optional_user_id(
     """
     if credentials is None:
         return None
-    payload = decode_token(credentials.credentials)
+    payload = decode_token_cached(credentials.credentials)
     if payload is None or payload.get("type") != "access":
         return None
+    if await token_store.is_revoked(payload):
+        return None
     user_id = payload.get("sub")
     if user_id is None:
         return None
@@ -78,6 +108,21 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 DB 세션 의존성 래퍼 (읽기 풀/복제본).
+
+    쓰기가 없고 캐시되지 않는 조회 라우트(라이트업 상세, 공개 프로필)에서 사용한다.
+    복제본 지연이 있을 수 있으므로 방금 쓴 데이터를 읽어야 하는 경로나,
+    커밋 후 버전을 올리는 캐시(응답 캐시, 카탈로그 캐시, HTTP ETag 캐시)를 채우는 경로에는
+    쓰지 않는다. 지연된 복제본에서 읽은 결과가 새 버전으로 저장되기 때문이다.
+
+    Yields:
+        AsyncSession: 읽기 풀의 데이터베이스 세션.
+    """
+    async for session in get_read_db():
+        yield session
+
+
 async def get_redis() -> AsyncGenerator[Redis, None]:
     """Redis 비동기 클라이언트를 제공하는 의존성 함수.
 
@@ -87,14 +132,113 @@ async def get_redis() -> AsyncGenerator[Redis, None]:
     Yields:
         Redis 비동기 클라이언트 또는 None.
     """
-    global _redis_client
-    settings = get_settings()
-    if not settings.REDIS_URL:
-        yield None  # type: ignore[arg-type]
-        return
-    if _redis_client is None:
-        _redis_client = Redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
+    yield get_redis_client()  # type: ignore[misc]
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    """소켓 주소가 TRUSTED_PROXIES에 속하는지 확인한다."""
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> str:
+    """요청 클라이언트 IP를 반환한다.
+
+    X-Real-IP는 신뢰 프록시(TRUSTED_PROXIES)를 거친 요청에서만 사용한다.
+    그 외에는 클라이언트가 헤더를 위조해 IP별 제한을 우회할 수 있으므로 소켓 주소를 쓴다.
+
+    Args:
+        request: 요청 객체.
+
+    Returns:
+        클라이언트 IP 문자열.
+    """
+    if request.client is None:
+        return "unknown"
+    peer = request.client.host
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip and _is_trusted_proxy(peer):
+        return real_ip.strip()
+    return peer
+
+
+def rate_limit_by_ip(
+    scope: str,
+    max_requests: int,
+    window_seconds: int,
+    algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+) -> Callable[..., Coroutine[None, None, None]]:
+    """클라이언트 IP 기준 rate limit 의존성을 생성한다 (비로그인 엔드포인트용).
+
+    워커 로컬 토큰 버킷을 먼저 검사하고, 통과한 요청만 Redis로 전역 검사한다.
+
+    Args:
+        scope: 제한 범위 이름 (e.g., "login").
+        max_requests: 윈도우 내 최대 요청 수.
+        window_seconds: 윈도우 크기 (초).
+        algorithm: 사용할 알고리즘.
+
+    Returns:
+        FastAPI 의존성 함수.
+    """
+
+    async def dependency(
+        request: Request,
+        redis: Redis | None = Depends(get_redis),
+    ) -> None:
+        key = f"{scope}:ip:{client_ip(request)}"
+        check_local_rate_limit(key, max_requests, window_seconds)
+        if redis is None:
+            return
+        await check_rate_limit(
+            redis,
+            key,
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            algorithm=algorithm,
         )
-    yield _redis_client
+
+    return dependency
+
+
+def rate_limit_by_user(
+    scope: str,
+    max_requests: int,
+    window_seconds: int,
+    algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+) -> Callable[..., Coroutine[None, None, None]]:
+    """로그인 유저 기준 rate limit 의존성을 생성한다.
+
+    워커 로컬 토큰 버킷을 먼저 검사하고, 통과한 요청만 Redis로 전역 검사한다.
+    의존성 단계에서 실행되므로 라우트 본문의 DB 작업보다 먼저 검사된다.
+
+    Args:
+        scope: 제한 범위 이름 (e.g., "flag_submit").
+        max_requests: 윈도우 내 최대 요청 수.
+        window_seconds: 윈도우 크기 (초).
+        algorithm: 사용할 알고리즘.
+
+    Returns:
+        FastAPI 의존성 함수.
+    """
+
+    async def dependency(
+        user_id: int = Depends(get_current_user_id),
+        redis: Redis | None = Depends(get_redis),
+    ) -> None:
+        key = f"{scope}:{user_id}"
+        check_local_rate_limit(key, max_requests, window_seconds)
+        if redis is None:
+            return
+        await check_rate_limit(
+            redis,
+            key,
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            algorithm=algorithm,
+        )
+
+    return dependency
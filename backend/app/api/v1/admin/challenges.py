@@ -12,7 +12,7 @@ from app.schemas.challenge import (
     ChallengeCreate,
     ChallengeUpdate,
 )
-from app.services import challenge_service, file_service
+from app.services import challenge_service, file_service, notification_service
 
 router = APIRouter()
 
@@ -28,6 +28,10 @@ async def create_challenge(
 
     await require_author(db, user_id)
     challenge = await challenge_service.create_challenge(db, data, user_id)
+    if challenge.is_active:
+        await notification_service.notify_new_challenge(
+            db, challenge_title=challenge.title, challenge_id=challenge.id
+        )
     return ChallengeAdminResponse.model_validate(challenge)
 
 
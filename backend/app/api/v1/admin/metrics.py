@@ -0,0 +1,27 @@
+"""관리자 런타임 지표 라우터."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user_id, get_db_session
+from app.core import hashing
+from app.database import get_pool_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_runtime_metrics(
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+) -> dict:
+    """현재 워커 프로세스의 런타임 지표를 반환한다."""
+    from . import require_author
+
+    await require_author(db, user_id)
+    return {
+        "password_hashing": hashing.get_metrics(),
+        "db_pools": get_pool_metrics(),
+    }
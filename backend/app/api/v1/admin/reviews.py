@@ -6,23 +6,26 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user_id, get_db_session
-from app.schemas.challenge import CommunitySubmissionResponse, ReviewAction
+from app.schemas.challenge import (
+    CommunitySubmissionResponse,
+    CommunitySubmissionSummary,
+    ReviewAction,
+)
 from app.services import challenge_review_service, notification_service
 
 router = APIRouter()
 
 
-@router.get("/reviews/pending", response_model=list[CommunitySubmissionResponse])
+@router.get("/reviews/pending", response_model=list[CommunitySubmissionSummary])
 async def list_pending_reviews(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[CommunitySubmissionResponse]:
+) -> list[CommunitySubmissionSummary]:
     """심사 대기 중인 커뮤니티 챌린지를 조회한다."""
     from . import require_author
 
     await require_author(db, user_id)
-    challenges = await challenge_review_service.list_pending(db)
-    return [CommunitySubmissionResponse.model_validate(c) for c in challenges]
+    return await challenge_review_service.list_pending(db)
 
 
 @router.post(
@@ -55,5 +58,10 @@ async def review_challenge(
             challenge_id=challenge.id,
             approved=(data.action == "approve"),
         )
+    # 승인된 문제는 전체 유저에게 공개 알림
+    if data.action == "approve":
+        await notification_service.notify_new_challenge(
+            db, challenge_title=challenge.title, challenge_id=challenge.id
+        )
     await db.commit()
     return CommunitySubmissionResponse.model_validate(challenge)
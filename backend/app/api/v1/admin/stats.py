@@ -2,7 +2,7 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user_id, get_db_session
@@ -15,9 +15,13 @@ router = APIRouter()
 async def get_dashboard_stats(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
+    fresh: bool = Query(default=False, description="스냅샷 대신 즉시 집계 (?fresh=1)"),
 ) -> dict:
-    """관리자 대시보드 통계를 반환한다."""
+    """관리자 대시보드 통계를 반환한다.
+
+    주기적으로 갱신되는 스냅샷을 읽으며, fresh이면 즉시 집계해 스냅샷을 교체한다.
+    """
     from . import require_author
 
     await require_author(db, user_id)
-    return await admin_service.get_dashboard_stats(db)
+    return await admin_service.get_stats_snapshot(db, fresh=fresh)
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_user_id, get_db_session
 from app.core.exceptions import ForbiddenException, NotFoundException
 from app.core.permissions import UserRole
+from app.core.principal_cache import invalidate_principal
 from app.models.user import User
 
 router = APIRouter()
@@ -78,4 +79,5 @@ async def update_user_role(
 
     target.role = role
     await db.commit()
+    await invalidate_principal(target.id)
     return {"id": target.id, "username": target.username, "role": target.role}
@@ -1,6 +1,6 @@
 """인증 API 라우터.
 
-회원가입, 로그인, 토큰 갱신 엔드포인트를 제공한다.
+회원가입, 로그인, 토큰 갱신, 로그아웃 엔드포인트를 제공한다.
 """
 
 from typing import Annotated
@@ -8,7 +8,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session
+from app.api.deps import get_db_session, rate_limit_by_ip
 from app.schemas.user import (
     LoginRequest,
     RefreshRequest,
@@ -21,7 +21,12 @@ from app.services import auth_service
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/register", response_model=UserResponse, status_code=201)
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=201,
+    dependencies=[Depends(rate_limit_by_ip("register", max_requests=5, window_seconds=3600))],
+)
 async def register(
     data: UserCreate,
     db: Annotated[AsyncSession, Depends(get_db_session)],
@@ -37,7 +42,11 @@ async def register(
     return UserResponse.model_validate(user)
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit_by_ip("login", max_requests=10, window_seconds=60))],
+)
 async def login(
     data: LoginRequest,
     db: Annotated[AsyncSession, Depends(get_db_session)],
@@ -69,3 +78,9 @@ async def refresh(
         access_token=access_token,
         refresh_token=refresh_token,
     )
+
+
+@router.post("/logout", status_code=204)
+async def logout(data: RefreshRequest) -> None:
+    """리프레시 토큰이 속한 세션을 폐기한다."""
+    await auth_service.logout(data.refresh_token)
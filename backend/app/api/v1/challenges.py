@@ -3,34 +3,37 @@
 챌린지 목록 조회, 상세 조회, 플래그 제출, 파일 다운로드 기능을 제공한다.
 """
 
-import os
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
-from redis.asyncio import Redis
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_id, get_db_session, get_optional_user_id, get_redis
-from app.core.rate_limit import check_rate_limit
+from app.api.deps import (
+    get_current_user_id,
+    get_db_session,
+    get_optional_user_id,
+    rate_limit_by_user,
+)
+from app.core.exceptions import ConflictException
 from app.models.submission import Submission
 from app.schemas.challenge import (
     ChallengeListResponse,
     ChallengeResponse,
+    ChallengeSearchResponse,
     CategoryEnum,
 )
 from app.schemas.submission import FlagSubmit, SubmissionResult
-from app.services import challenge_service, file_service, notification_service, scoring_service
-
-router = APIRouter(prefix="/challenges", tags=["challenges"])
-
-LEGACY_PUBLIC_FILES_DIR = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-    "public_files",
+from app.services import (
+    catalog_service,
+    challenge_service,
+    file_service,
+    notification_service,
+    scoring_service,
 )
 
+router = APIRouter(prefix="/challenges", tags=["challenges"])
 
 @router.get("", response_model=ChallengeListResponse)
 async def list_challenges(
@@ -41,31 +44,59 @@ async def list_challenges(
     cursor: int | None = Query(default=None, ge=1),
     limit: int = Query(default=20, ge=1, le=100),
     user_id: int | None = Depends(get_optional_user_id),
-) -> ChallengeListResponse:
-    """챌린지 목록을 조회한다 (커서 기반 페이지네이션)."""
-    challenges, next_cursor, total = await challenge_service.list_challenges(
+) -> ORJSONResponse:
+    """챌린지 목록을 조회한다 (커서 기반 페이지네이션).
+
+    목록은 카탈로그 캐시에서 읽고, 요청마다 유저의 풀이 여부만 확인한다.
+    캐시된 dict를 그대로 인코딩해 응답 모델 검증을 거치지 않는다.
+    """
+    page = await catalog_service.get_catalog_page(
         db,
         category=category.value if category else None,
         difficulty=difficulty,
         search=search,
         cursor=cursor,
         limit=limit,
-        user_id=user_id,
+    )
+
+    if user_id:
+        solved_ids = await catalog_service.get_solved_flags(
+            db, user_id, [item["id"] for item in page["items"]]
+        )
+        for item in page["items"]:
+            item["is_solved"] = item["id"] in solved_ids
+
+    return ORJSONResponse(page)
+
+
+@router.get("/search", response_model=ChallengeSearchResponse)
+async def search_challenges(
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    q: str = Query(..., min_length=1, max_length=100),
+    category: CategoryEnum | None = None,
+    cursor: str | None = Query(default=None, max_length=512),
+    limit: int = Query(default=20, ge=1, le=100),
+    user_id: int | None = Depends(get_optional_user_id),
+) -> ChallengeSearchResponse:
+    """챌린지를 제목/태그/설명으로 검색한다 (관련도 순, 커서 기반 페이지네이션)."""
+    challenges, next_cursor = await challenge_service.search_challenges(
+        db,
+        q,
+        category=category.value if category else None,
+        cursor=cursor,
+        limit=limit,
     )
 
     solved_ids: set[int] = set()
     if user_id:
-        solved_ids = await challenge_service.get_solved_challenge_ids(db, user_id)
+        solved_ids = await catalog_service.get_solved_flags(
+            db, user_id, [c.id for c in challenges]
+        )
 
-    items = []
     for c in challenges:
-        resp = ChallengeResponse.model_validate(c)
-        resp.is_solved = c.id in solved_ids
-        items.append(resp)
+        c.is_solved = c.id in solved_ids
 
-    return ChallengeListResponse(
-        items=items, next_cursor=next_cursor, total=total
-    )
+    return ChallengeSearchResponse(items=challenges, next_cursor=next_cursor)
 
 
 @router.get("/{challenge_id}", response_model=ChallengeResponse)
@@ -78,15 +109,23 @@ async def get_challenge(
     return ChallengeResponse.model_validate(challenge)
 
 
-@router.post("/{challenge_id}/submit", response_model=SubmissionResult)
+@router.post(
+    "/{challenge_id}/submit",
+    response_model=SubmissionResult,
+    # Rate limiting: 분당 10회 제한 (Redis가 사용 가능한 경우)
+    dependencies=[Depends(rate_limit_by_user("flag_submit", max_requests=10, window_seconds=60))],
+)
 async def submit_flag(
     challenge_id: int,
     data: FlagSubmit,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
-    redis: Annotated[Redis | None, Depends(get_redis)],
 ) -> SubmissionResult:
-    """플래그를 제출한다."""
+    """플래그를 제출한다.
+
+    rate limit(워커 로컬 → Redis)은 의존성 단계에서 먼저 검사되므로
+    폭주 요청은 아래의 DB 작업에 도달하지 않는다.
+    """
     # 이미 풀었는지 확인
     already = await challenge_service.check_already_solved(db, user_id, challenge_id)
     if already:
@@ -96,22 +135,13 @@ async def submit_flag(
             points_earned=0,
         )
 
-    # Rate limiting: 분당 10회 제한 (Redis가 사용 가능한 경우)
-    if redis is not None:
-        await check_rate_limit(
-            redis,
-            f"flag_submit:{user_id}",
-            max_requests=10,
-            window_seconds=60,
-        )
-
     # 챌린지 존재 확인
     challenge = await challenge_service.get_public_challenge_by_id(db, challenge_id)
 
-    # 플래그 검증
-    is_correct = await challenge_service.verify_flag(db, challenge_id, data.flag)
+    # 플래그 검증 (이미 로드한 챌린지의 해시와 비교 — 추가 조회 없음)
+    is_correct = challenge.flag_hash == challenge_service.hash_flag(data.flag)
 
-    # Submission 기록
+    # 시도 로그 기록 (정답/오답 모두)
     submission = Submission(
         user_id=user_id,
         challenge_id=challenge_id,
@@ -122,35 +152,29 @@ async def submit_flag(
 
     points_earned = 0
     if is_correct:
-        challenge.solve_count += 1
-        points_earned = challenge_service.calculate_dynamic_points(
-            challenge.max_points,
-            challenge.min_points,
-            challenge.decay,
-            challenge.solve_count,
-        )
-        challenge.points = points_earned
-
-        # 유저 점수 업데이트
-        await scoring_service.update_user_score_on_solve(db, user_id, points_earned)
-
-        # First Blood 알림 (최초 풀이자)
-        if challenge.solve_count == 1:
-            await notification_service.notify_first_blood(
-                db, user_id, challenge.title, challenge.id
+        # 풀이 수/점수/풀이 기록/유저 점수를 한 문장으로 갱신 (동시 풀이에도 순번이 정확함)
+        # 동시에 같은 유저가 제출한 경우 풀이 기록만 롤백되고 시도 로그는 남긴다
+        try:
+            points_earned, first_blood = await challenge_service.record_correct_solve(
+                db, user_id, challenge_id
             )
-
-    try:
-        await db.commit()
-    except IntegrityError as exc:
-        await db.rollback()
-        if is_correct and "uq_submissions_user_challenge_correct" in str(exc.orig):
+        except ConflictException:
+            await db.commit()
             return SubmissionResult(
                 is_correct=True,
                 message="이미 풀이한 문제입니다.",
                 points_earned=0,
             )
-        raise
+        catalog_service.record_solve(db, user_id, challenge_id)
+        scoring_service.invalidate_score_caches(db, user_id)
+
+        # First Blood 알림 (최초 풀이자)
+        if first_blood:
+            await notification_service.notify_first_blood(
+                db, user_id, challenge.title, challenge.id
+            )
+
+    await db.commit()
 
     return SubmissionResult(
         is_correct=is_correct,
@@ -159,11 +183,35 @@ async def submit_flag(
     )
 
 
+@router.get("/{challenge_id}/bundle")
+async def download_challenge_bundle(
+    challenge_id: int,
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    format: str = Query(default="zip", pattern=r"^(zip|tar\.gz)$"),
+) -> FileResponse:
+    """챌린지 첨부파일 전체를 하나의 번들(.zip/.tar.gz)로 다운로드한다."""
+    challenge = await challenge_service.get_challenge_by_id(db, challenge_id)
+    if not challenge.files:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    # 등록된 파일만 담는다 (업로드/레거시 디렉토리). 파일 구성이 바뀌었으면 이때 생성된다
+    bundle_path = await file_service.get_bundle(challenge_id, challenge.files, format)
+    if bundle_path is None:
+        raise HTTPException(status_code=404, detail="파일이 서버에 존재하지 않습니다.")
+
+    return FileResponse(
+        str(bundle_path),
+        filename=file_service.bundle_name(challenge_id, format),
+        media_type="application/zip" if format == "zip" else "application/gzip",
+    )
+
+
 @router.get("/{challenge_id}/files/{filename}")
 async def download_challenge_file(
     challenge_id: int,
     filename: str,
     db: Annotated[AsyncSession, Depends(get_db_session)],
+    accept_encoding: Annotated[str | None, Header()] = None,
 ) -> FileResponse:
     """챌린지 첨부파일을 다운로드한다."""
     # 챌린지 존재 확인
@@ -178,18 +226,21 @@ async def download_challenge_file(
     if not challenge.files or safe_filename not in challenge.files:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
 
-    upload_file_path = file_service.UPLOAD_DIR / str(challenge_id) / safe_filename
-    legacy_file_path = Path(LEGACY_PUBLIC_FILES_DIR) / str(challenge_id) / safe_filename
-
-    if upload_file_path.is_file():
-        serve_path = upload_file_path
-    elif legacy_file_path.is_file():
-        serve_path = legacy_file_path
-    else:
+    serve_path = file_service.resolve_challenge_file(challenge_id, safe_filename)
+    if serve_path is None:
         raise HTTPException(status_code=404, detail="파일이 서버에 존재하지 않습니다.")
 
+    # 사전 압축본이 있으면 Accept-Encoding에 맞춰 그대로 전송한다
+    serve_path, encoding = file_service.select_encoded_variant(
+        serve_path, accept_encoding
+    )
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
     return FileResponse(
         str(serve_path),
         filename=safe_filename,
         media_type="application/octet-stream",
+        headers=headers,
     )
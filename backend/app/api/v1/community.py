@@ -9,12 +9,14 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user_id, get_db_session
+from app.core.principal_cache import get_principal
 from app.schemas.challenge import (
     CommunitySubmissionResponse,
+    CommunitySubmissionSummary,
     CommunitySubmitCreate,
     CommunitySubmitUpdate,
 )
-from app.services import challenge_review_service
+from app.services import challenge_review_service, notification_service
 
 router = APIRouter(prefix="/challenges/community", tags=["community"])
 
@@ -41,6 +43,14 @@ async def submit_challenge(
         hints=data.hints,
         tags=data.tags,
     )
+    # 관리자들에게 심사 요청 알림
+    author = await get_principal(db, user_id)
+    await notification_service.notify_admins_new_submission(
+        db,
+        challenge_title=challenge.title,
+        challenge_id=challenge.id,
+        author_name=author.username if author else "unknown",
+    )
     await db.commit()
     return CommunitySubmissionResponse.model_validate(challenge)
 
@@ -74,11 +84,10 @@ async def delete_submission(
     await db.commit()
 
 
-@router.get("/my-submissions", response_model=list[CommunitySubmissionResponse])
+@router.get("/my-submissions", response_model=list[CommunitySubmissionSummary])
 async def get_my_submissions(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
-) -> list[CommunitySubmissionResponse]:
+) -> list[CommunitySubmissionSummary]:
     """내 출제 목록을 조회한다."""
-    challenges = await challenge_review_service.get_my_submissions(db, user_id)
-    return [CommunitySubmissionResponse.model_validate(c) for c in challenges]
+    return await challenge_review_service.get_my_submissions(db, user_id)
@@ -8,14 +8,30 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_id, get_db_session
+from app.api.deps import get_current_user_id, get_db_session, rate_limit_by_user
+from app.core.rate_limit import RateLimitAlgorithm
 from app.schemas.container import ContainerCreate, ContainerResponse
 from app.services import container_service
 
 router = APIRouter(prefix="/containers", tags=["containers"])
 
 
-@router.post("", response_model=ContainerResponse, status_code=201)
+@router.post(
+    "",
+    response_model=ContainerResponse,
+    status_code=201,
+    # 컨테이너 생성은 비용이 크므로 토큰 버킷으로 분당 5회까지 허용
+    dependencies=[
+        Depends(
+            rate_limit_by_user(
+                "container_create",
+                max_requests=5,
+                window_seconds=60,
+                algorithm=RateLimitAlgorithm.GCRA,
+            )
+        )
+    ],
+)
 async def create_instance(
     data: ContainerCreate,
     user_id: Annotated[int, Depends(get_current_user_id)],
@@ -2,11 +2,11 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user_id, get_db_session
-from app.schemas.notification import NotificationListResponse, NotificationResponse
+from app.schemas.notification import NotificationListResponse
 from app.services import notification_service
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
@@ -14,19 +14,39 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("", response_model=NotificationListResponse)
 async def get_notifications(
+    request: Request,
+    response: Response,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
     limit: int = Query(20, ge=1, le=50),
     unread_only: bool = Query(False),
-) -> NotificationListResponse:
-    """내 알림 목록을 조회한다."""
+) -> NotificationListResponse | Response:
+    """내 알림 목록을 조회한다.
+
+    알림 목록 버전으로 ETag를 계산하여, 변경이 없으면 DB 조회 없이 304를 반환한다.
+    """
+    version = await notification_service.get_list_version(user_id)
+    if version is not None:
+        etag = f'W/"n{user_id}-{version}-{limit}-{int(unread_only)}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+
     notifications, unread_count = await notification_service.get_user_notifications(
         db, user_id, limit=limit, unread_only=unread_only
     )
-    return NotificationListResponse(
-        items=[NotificationResponse.model_validate(n) for n in notifications],
-        unread_count=unread_count,
-    )
+    return NotificationListResponse(items=notifications, unread_count=unread_count)
+
+
+@router.put("/broadcasts/{broadcast_id}/read", status_code=204)
+async def mark_broadcast_read(
+    broadcast_id: int,
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+) -> None:
+    """브로드캐스트 알림을 읽음 처리한다 (이전 브로드캐스트 포함)."""
+    await notification_service.mark_broadcast_read(db, broadcast_id, user_id)
 
 
 @router.put("/{notification_id}/read", status_code=204)
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db_session
+from app.core.response_cache import cached_response
 from app.services import scoring_service
 
 router = APIRouter(prefix="/scoreboards", tags=["scoreboards"])
@@ -33,6 +34,7 @@ class ScoreboardResponse(BaseModel):
 
 
 @router.get("", response_model=ScoreboardResponse)
+@cached_response(scoring_service.SCOREBOARD_CACHE)
 async def get_scoreboard(
     db: Annotated[AsyncSession, Depends(get_db_session)],
     category: str | None = Query(default=None),
@@ -9,8 +9,9 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_id, get_db_session
+from app.api.deps import get_current_user_id, get_db_session, get_read_db_session
 from app.core.exceptions import NotFoundException
+from app.core.response_cache import cached_response
 from app.schemas.dashboard import (
     DashboardResponse,
     HeatmapResponse,
@@ -36,6 +37,7 @@ async def get_my_profile(
 
 
 @router.get("/me/stats", response_model=UserStatsResponse)
+@cached_response(dashboard_service.DASHBOARD_CACHE)
 async def get_my_stats(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
@@ -46,6 +48,7 @@ async def get_my_stats(
 
 
 @router.get("/me/heatmap", response_model=HeatmapResponse)
+@cached_response(dashboard_service.DASHBOARD_CACHE)
 async def get_my_heatmap(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
@@ -63,6 +66,7 @@ async def get_my_heatmap(
 
 
 @router.get("/me/dashboard", response_model=DashboardResponse)
+@cached_response(dashboard_service.DASHBOARD_CACHE)
 async def get_my_dashboard(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
@@ -90,7 +94,7 @@ async def get_my_dashboard(
 @router.get("/{user_id}", response_model=UserPublicResponse)
 async def get_user_profile(
     user_id: int,
-    db: Annotated[AsyncSession, Depends(get_db_session)],
+    db: Annotated[AsyncSession, Depends(get_read_db_session)],
 ) -> UserPublicResponse:
     """특정 유저의 공개 프로필을 조회한다."""
     user = await auth_service.get_user_by_id(db, user_id)
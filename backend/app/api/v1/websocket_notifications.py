@@ -0,0 +1,154 @@
+"""WebSocket 알림 푸시 핸들러.
+
+클라이언트가 주기적으로 알림 목록을 폴링하는 대신, 새 알림이 생기면
+서버가 즉시 밀어준다. 워커 프로세스마다 Redis pub/sub 구독을 하나만 두고
+(`notifications:*` 패턴) 접속 중인 유저별 큐로 분배한다.
+"""
+
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from redis.exceptions import RedisError
+
+from app.api.deps import get_user_id_from_token
+from app.core.redis import get_redis_client
+from app.database import background_session_factory
+from app.services import notification_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+_QUEUE_MAX_SIZE = 100
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+class NotificationHub:
+    """워커 내 알림 구독 허브.
+
+    Redis 채널 패턴 하나를 구독해 유저 ID별 큐로 메시지를 분배한다.
+    브로드캐스트 채널 메시지는 접속 중인 모든 유저에게 보낸다.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[int, set[asyncio.Queue]] = {}
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """유저의 메시지 큐를 등록하고, 필요하면 구독 태스크를 시작한다."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAX_SIZE)
+        self._queues.setdefault(user_id, set()).add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        """유저의 메시지 큐를 제거한다."""
+        queues = self._queues.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[user_id]
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        """채널 메시지를 해당 유저의 큐들에 넣는다 (브로드캐스트는 전체)."""
+        target = channel.rsplit(":", 1)[-1]
+        if target == notification_service.BROADCAST:
+            queues = [q for user_queues in self._queues.values() for q in user_queues]
+        elif target.isdigit():
+            queues = list(self._queues.get(int(target), ()))
+        else:
+            return
+        for queue in queues:
+            if queue.full():
+                # 느린 클라이언트: 가장 오래된 메시지를 버린다
+                queue.get_nowait()
+            queue.put_nowait(data)
+
+    async def _listen(self) -> None:
+        """Redis 패턴 구독을 유지하며 메시지를 분배한다."""
+        while self._queues:
+            redis = get_redis_client()
+            if redis is None:
+                return
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.psubscribe(notification_service.CHANNEL_PATTERN)
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+                    if not self._queues:
+                        break
+            except RedisError:
+                logger.warning("알림 구독 연결 끊김 — 재연결 대기")
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+
+hub = NotificationHub()
+
+
+async def _receive_until_disconnect(websocket: WebSocket) -> None:
+    """클라이언트 메시지를 버리며 연결 종료를 기다린다."""
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+async def _forward(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """큐에 들어온 알림을 클라이언트로 전송한다."""
+    while True:
+        data = await queue.get()
+        await websocket.send_text(data)
+
+
+@router.websocket("/ws/notifications")
+async def websocket_notifications(
+    websocket: WebSocket,
+    token: str = Query(...),
+) -> None:
+    """WebSocket으로 새 알림을 실시간 전달한다.
+
+    클라이언트는 `wss://domain/ws/notifications?token=<jwt>` 로 접속한다.
+    접속 직후 `{"type": "unread_count", ...}`를, 이후 새 알림마다
+    `{"type": "notification", "item": {...}}`를 받는다.
+    """
+    user_id = await get_user_id_from_token(token)
+    if user_id is None:
+        await websocket.close(code=4001, reason="인증 실패")
+        return
+
+    if get_redis_client() is None:
+        # 푸시를 사용할 수 없으면 클라이언트는 폴링으로 동작한다
+        await websocket.close(code=1013, reason="알림 푸시 비활성화")
+        return
+
+    await websocket.accept()
+    queue = hub.subscribe(user_id)
+    try:
+        async with background_session_factory() as db:
+            unread_count = await notification_service.get_unread_count(db, user_id)
+        await websocket.send_text(
+            json.dumps({"type": "unread_count", "unread_count": unread_count})
+        )
+
+        tasks = [
+            asyncio.create_task(_receive_until_disconnect(websocket)),
+            asyncio.create_task(_forward(websocket, queue)),
+        ]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                logger.debug("알림 WebSocket 종료: %s", task.exception())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.unsubscribe(user_id, queue)
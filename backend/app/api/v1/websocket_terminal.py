@@ -12,9 +12,9 @@ from docker.errors import APIError, NotFound
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy import select
 
+from app.api.deps import get_user_id_from_token
 from app.core.docker import get_docker_client
-from app.core.security import decode_token
-from app.database import async_session_factory
+from app.database import background_session_factory
 from app.models.container_instance import ContainerInstance
 
 logger = logging.getLogger(__name__)
@@ -22,22 +22,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-async def _authenticate(token: str) -> int | None:
-    """WebSocket 토큰에서 유저 ID를 추출한다.
-
-    Args:
-        token: JWT access 토큰.
-
-    Returns:
-        유저 ID 또는 인증 실패 시 None.
-    """
-    payload = decode_token(token)
-    if payload is None or payload.get("type") != "access":
-        return None
-    user_id = payload.get("sub")
-    return int(user_id) if user_id else None
-
-
 async def _verify_instance_ownership(
     instance_id: int, user_id: int
 ) -> ContainerInstance | None:
@@ -50,7 +34,7 @@ async def _verify_instance_ownership(
     Returns:
         ContainerInstance 또는 권한 없으면 None.
     """
-    async with async_session_factory() as db:
+    async with background_session_factory() as db:
         result = await db.execute(
             select(ContainerInstance).where(
                 ContainerInstance.id == instance_id,
@@ -72,7 +56,7 @@ async def websocket_terminal(
     클라이언트는 `wss://domain/ws/terminal/{instance_id}?token=<jwt>` 로 접속한다.
     """
     # 인증
-    user_id = await _authenticate(token)
+    user_id = await get_user_id_from_token(token)
     if user_id is None:
         await websocket.close(code=4001, reason="인증 실패")
         return
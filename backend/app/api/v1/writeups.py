@@ -8,11 +8,13 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_id, get_db_session
+from app.api.deps import get_current_user_id, get_db_session, get_read_db_session
 from app.schemas.writeup import (
     WriteupCreate,
     WriteupListResponse,
     WriteupResponse,
+    WriteupSearchResponse,
+    WriteupSummary,
     WriteupUpdate,
 )
 from app.services import writeup_service
@@ -20,20 +22,9 @@ from app.services import writeup_service
 router = APIRouter(prefix="/writeups", tags=["writeups"])
 
 
-def _to_response(writeup) -> WriteupResponse:
-    """Writeup 모델을 응답 스키마로 변환한다."""
-    return WriteupResponse(
-        id=writeup.id,
-        user_id=writeup.user_id,
-        username=writeup.user.username if writeup.user else "Unknown",
-        challenge_id=writeup.challenge_id,
-        challenge_title=writeup.challenge.title if writeup.challenge else "Unknown",
-        content=writeup.content,
-        is_public=writeup.is_public,
-        upvotes=writeup.upvotes,
-        created_at=writeup.created_at,
-        updated_at=writeup.updated_at,
-    )
+def _to_response(data: dict) -> WriteupResponse:
+    """Write-up projection 데이터를 응답 스키마로 변환한다."""
+    return WriteupResponse.model_validate(data)
 
 
 @router.post("", response_model=WriteupResponse, status_code=201)
@@ -51,8 +42,7 @@ async def create_writeup(
         is_public=data.is_public,
     )
     await db.commit()
-    await db.refresh(writeup)
-    return _to_response(writeup)
+    return _to_response(await writeup_service.get_writeup_view(db, writeup.id))
 
 
 @router.get("", response_model=WriteupListResponse)
@@ -62,25 +52,52 @@ async def list_writeups(
     sort: str = Query(default="newest", pattern="^(newest|oldest|most_upvoted)$"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=512),
 ) -> WriteupListResponse:
-    """Write-up 목록을 조회한다."""
-    writeups, total = await writeup_service.list_writeups(
-        db, challenge_id=challenge_id, sort=sort, limit=limit, offset=offset
+    """Write-up 목록을 조회한다 (본문은 앞부분만, 전체는 상세 조회).
+
+    다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회한다 (offset은 호환용).
+    """
+    rows, total, next_cursor = await writeup_service.list_writeups(
+        db,
+        challenge_id=challenge_id,
+        sort=sort,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
     return WriteupListResponse(
-        items=[_to_response(w) for w in writeups],
+        items=[WriteupSummary.model_validate(row) for row in rows],
         total=total,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/search", response_model=WriteupSearchResponse)
+async def search_writeups(
+    db: Annotated[AsyncSession, Depends(get_db_session)],
+    q: str = Query(..., min_length=1, max_length=100),
+    challenge_id: int | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, max_length=512),
+) -> WriteupSearchResponse:
+    """공개 Write-up 본문을 검색한다 (관련도 순, 커서 기반 페이지네이션)."""
+    rows, next_cursor = await writeup_service.search_writeups(
+        db, q, challenge_id=challenge_id, limit=limit, cursor=cursor
+    )
+    return WriteupSearchResponse(
+        items=[WriteupSummary.model_validate(row) for row in rows],
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{writeup_id}", response_model=WriteupResponse)
 async def get_writeup(
     writeup_id: int,
-    db: Annotated[AsyncSession, Depends(get_db_session)],
+    db: Annotated[AsyncSession, Depends(get_read_db_session)],
 ) -> WriteupResponse:
     """Write-up을 조회한다."""
-    writeup = await writeup_service.get_writeup(db, writeup_id)
-    return _to_response(writeup)
+    return _to_response(await writeup_service.get_writeup_view(db, writeup_id))
 
 
 @router.put("/{writeup_id}", response_model=WriteupResponse)
@@ -99,8 +116,7 @@ async def update_writeup(
         is_public=data.is_public,
     )
     await db.commit()
-    await db.refresh(writeup)
-    return _to_response(writeup)
+    return _to_response(await writeup_service.get_writeup_view(db, writeup.id))
 
 
 @router.delete("/{writeup_id}", status_code=204)
@@ -120,8 +136,9 @@ async def upvote_writeup(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> WriteupResponse:
-    """Write-up을 추천한다."""
-    writeup = await writeup_service.upvote_writeup(db, writeup_id)
+    """Write-up을 추천한다 (유저당 한 번, 중복 추천은 무시)."""
+    voted = await writeup_service.upvote_writeup(db, writeup_id, user_id)
     await db.commit()
-    await db.refresh(writeup)
-    return _to_response(writeup)
+    if voted:
+        await writeup_service.record_upvote(db, writeup_id)
+    return _to_response(await writeup_service.get_writeup_view(db, writeup_id))
@@ -8,6 +8,52 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# 워커가 시작할 때 import해 태스크를 등록할 모듈
+# (autodiscover_tasks(["app.tasks"])는 app.tasks.tasks 모듈만 찾으므로 명시한다)
+TASK_MODULES = [
+    "app.tasks.admin_tasks",
+    "app.tasks.container_tasks",
+    "app.tasks.notification_tasks",
+    "app.tasks.partition_tasks",
+    "app.tasks.scoring_tasks",
+    "app.tasks.writeup_tasks",
+]
+
+BEAT_SCHEDULE = {
+    "cleanup-expired-containers": {
+        "task": "app.tasks.container_tasks.cleanup_expired_containers",
+        "schedule": 300.0,  # 5분마다
+    },
+    "recalculate-dynamic-scores": {
+        "task": "app.tasks.scoring_tasks.recalculate_dynamic_scores",
+        "schedule": 600.0,  # 10분마다
+    },
+    "recalculate-all-user-scores": {
+        "task": "app.tasks.scoring_tasks.recalculate_all_user_scores",
+        "schedule": 3600.0,  # 1시간마다
+    },
+    "compact-notifications": {
+        "task": "app.tasks.notification_tasks.compact_notifications",
+        "schedule": 86400.0,  # 하루마다
+    },
+    "flush-writeup-upvotes": {
+        "task": "app.tasks.writeup_tasks.flush_writeup_upvotes",
+        "schedule": 30.0,  # 30초마다
+    },
+    "recount-writeup-upvotes": {
+        "task": "app.tasks.writeup_tasks.recount_writeup_upvotes",
+        "schedule": 3600.0,  # 1시간마다
+    },
+    "refresh-admin-stats": {
+        "task": "app.tasks.admin_tasks.refresh_admin_stats",
+        "schedule": float(settings.ADMIN_STATS_SNAPSHOT_SECONDS),
+    },
+    "maintain-submission-partitions": {
+        "task": "app.tasks.partition_tasks.maintain_submission_partitions",
+        "schedule": 86400.0,  # 하루마다
+    },
+}
+
 celery_app = None
 
 if settings.REDIS_URL and settings.CELERY_ENABLED:
@@ -17,6 +63,7 @@ if settings.REDIS_URL and settings.CELERY_ENABLED:
         "wargame_bandits",
         broker=settings.REDIS_URL,
         backend=settings.REDIS_URL,
+        include=TASK_MODULES,
     )
 
     celery_app.conf.update(
@@ -26,20 +73,5 @@ if settings.REDIS_URL and settings.CELERY_ENABLED:
         timezone="UTC",
         enable_utc=True,
         task_track_started=True,
-        beat_schedule={
-            "cleanup-expired-containers": {
-                "task": "app.tasks.container_tasks.cleanup_expired_containers",
-                "schedule": 300.0,  # 5분마다
-            },
-            "recalculate-dynamic-scores": {
-                "task": "app.tasks.scoring_tasks.recalculate_dynamic_scores",
-                "schedule": 600.0,  # 10분마다
-            },
-            "recalculate-all-user-scores": {
-                "task": "app.tasks.scoring_tasks.recalculate_all_user_scores",
-                "schedule": 3600.0,  # 1시간마다
-            },
-        },
+        beat_schedule=BEAT_SCHEDULE,
     )
-
-    celery_app.autodiscover_tasks(["app.tasks"])
@@ -5,6 +5,8 @@ pydantic-settings 기반으로 .env 파일에서 설정값을 로드한다.
 
 import json
 from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_network
+from typing import Literal
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from pydantic import field_validator
@@ -28,12 +30,74 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "change-me-to-random-string"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_SIZE: int = 10000  # 검증된 토큰 claims LRU 캐시 크기 (0이면 비활성화)
+    JWT_BACKEND: Literal["jose", "pyjwt"] = "jose"  # 그 외 값은 시작 시 설정 검증에서 거부
+
+    # Principal Cache (권한 검사용 id/username/role 캐시)
+    PRINCIPAL_LOCAL_TTL_SECONDS: int = 10
+    PRINCIPAL_REDIS_TTL_SECONDS: int = 300
+
+    # Token Revocation (폐기 토큰 bloom filter 크기와 Redis 동기화 주기)
+    REVOCATION_BLOOM_BITS: int = 1 << 20
+    REVOCATION_BLOOM_HASHES: int = 7
+    REVOCATION_SYNC_SECONDS: int = 5
+
+    # Notification Retention (읽은 알림 보존 기간, 유저당 최대 보관 수)
+    NOTIFICATION_RETENTION_DAYS: int = 90
+    NOTIFICATION_MAX_PER_USER: int = 200
+
+    # Submission Partitions (월별 파티션을 미리 만들 개월 수, 시도 로그 보존 개월 수,
+    # 보존 기간이 지난 파티션을 내보낼 디렉토리). 보존 개월 수가 0이면 보관/삭제하지 않는다 (기본).
+    SUBMISSION_PARTITION_MONTHS_AHEAD: int = 3
+    SUBMISSION_RETENTION_MONTHS: int = 0
+    SUBMISSION_ARCHIVE_DIR: str = "/var/lib/wargame/archive/submissions"
+
+    # Challenge Catalog Cache (공개 목록 응답 캐시 TTL, 풀이 수/동적 점수의 최대 지연)
+    CATALOG_CACHE_TTL_SECONDS: int = 30
+
+    # Response Cache (스코어보드/대시보드 등 인코딩된 응답 캐시 기본 TTL)
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+
+    # Admin Stats Snapshot (관리자 대시보드 통계 스냅샷 갱신 주기, 초)
+    ADMIN_STATS_SNAPSHOT_SECONDS: int = 60
+
+    # HTTP Cache (공개 GET 응답의 앞단 캐시 유지/백그라운드 갱신 시간)
+    HTTP_CACHE_S_MAXAGE_SECONDS: int = 10
+    HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = 30
+
+    # Write-up 사전 렌더링 (이보다 긴 본문은 HTML을 저장하지 않고 클라이언트가 렌더링)
+    # 렌더링 시간은 길이에 비례한다 (병적 입력 기준 50K ≈ 0.3초, 200K ≈ 1.5초)
+    WRITEUP_RENDER_MAX_CHARS: int = 50_000
+
+    # Password Hashing (bcrypt cost가 바뀌면 다음 로그인 시 재해싱)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 8
 
     # Database
     POSTGRES_USER: str = "wargame"
     POSTGRES_PASSWORD: str = "change-me"
     POSTGRES_DB: str = "wargame"
     DATABASE_URL: str = "postgresql+asyncpg://wargame:change-me@db:5432/wargame"
+    # 캐시되지 않는 읽기 전용 조회(Write-up 상세, 공개 프로필)용 복제본 URL
+    # (없으면 DATABASE_URL의 별도 풀). 캐시를 채우는 조회는 주 DB에서 읽는다
+    DATABASE_READ_URL: str | None = None
+    DB_ECHO: bool = False
+
+    # DB Connection Pools (None이면 관리형 DB 여부에 따라 기본값 사용)
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_READ_POOL_SIZE: int | None = None
+    DB_READ_MAX_OVERFLOW: int | None = None
+    DB_BACKGROUND_POOL_SIZE: int = 2
+    DB_BACKGROUND_MAX_OVERFLOW: int = 3
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+
+    # Prepared Statements / SQL 컴파일 캐시
+    # PgBouncer ≥1.21 (max_prepared_statements > 0)이면 풀러 URL에서도 prepared statement 사용
+    DB_POOLER_PREPARED_STATEMENTS: bool = False
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+    DB_QUERY_CACHE_SIZE: int = 1200
 
     # Redis (None이면 Celery 비활성화 — Render 배포 시)
     REDIS_URL: str | None = None
@@ -53,6 +117,9 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: str = '["http://localhost:3000","http://localhost:80"]'
 
+    # Trusted Proxies (X-Real-IP를 신뢰할 프록시 주소/CIDR JSON 목록, 비어 있으면 헤더 무시)
+    TRUSTED_PROXIES: str = "[]"
+
     @field_validator("CONTAINER_PORT_RANGE_END")
     @classmethod
     def validate_port_range(cls, v: int, info) -> int:
@@ -80,6 +147,22 @@ class Settings(BaseSettings):
             raise ValueError("JWT_REFRESH_TOKEN_EXPIRE_DAYS는 양수여야 합니다.")
         return v
 
+    @field_validator("ADMIN_STATS_SNAPSHOT_SECONDS")
+    @classmethod
+    def validate_admin_stats_snapshot(cls, v: int) -> int:
+        """통계 스냅샷 갱신 주기가 양수인지 검증한다 (스냅샷 TTL이 0이 되지 않도록)."""
+        if v <= 0:
+            raise ValueError("ADMIN_STATS_SNAPSHOT_SECONDS는 양수여야 합니다.")
+        return v
+
+    @field_validator("BCRYPT_ROUNDS")
+    @classmethod
+    def validate_bcrypt_rounds(cls, v: int) -> int:
+        """bcrypt cost factor가 유효한 범위인지 검증한다."""
+        if not (4 <= v <= 31):
+            raise ValueError("BCRYPT_ROUNDS는 4 이상 31 이하여야 합니다.")
+        return v
+
     @field_validator("CONTAINER_CPU_LIMIT")
     @classmethod
     def validate_cpu_limit(cls, v: float) -> float:
@@ -88,20 +171,47 @@ class Settings(BaseSettings):
             raise ValueError("CONTAINER_CPU_LIMIT는 0 초과 4 이하여야 합니다.")
         return v
 
+    @field_validator("TRUSTED_PROXIES")
+    @classmethod
+    def validate_trusted_proxies(cls, v: str) -> str:
+        """신뢰 프록시 목록이 주소/CIDR의 JSON 배열인지 검증한다."""
+        try:
+            for network in json.loads(v):
+                ip_network(network, strict=False)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("TRUSTED_PROXIES는 주소/CIDR 문자열의 JSON 배열이어야 합니다.") from exc
+        return v
+
     @property
     def cors_origins_list(self) -> list[str]:
         """CORS 허용 오리진 목록을 리스트로 반환한다."""
         return json.loads(self.CORS_ORIGINS)
 
+    @property
+    def trusted_proxy_networks(self) -> list[IPv4Network | IPv6Network]:
+        """X-Real-IP를 신뢰할 프록시 네트워크 목록을 반환한다."""
+        return [ip_network(network, strict=False) for network in json.loads(self.TRUSTED_PROXIES)]
+
     @property
     def async_database_url(self) -> str:
-        """asyncpg용 DATABASE_URL을 반환한다.
+        """asyncpg용 DATABASE_URL을 반환한다."""
+        return self._to_async_url(self.DATABASE_URL)
+
+    @property
+    def async_read_database_url(self) -> str | None:
+        """asyncpg용 DATABASE_READ_URL을 반환한다 (설정되지 않았으면 None)."""
+        if not self.DATABASE_READ_URL:
+            return None
+        return self._to_async_url(self.DATABASE_READ_URL)
+
+    @staticmethod
+    def _to_async_url(url: str) -> str:
+        """DB URL을 asyncpg 형식으로 변환한다.
 
         Neon/Render는 postgres:// 형식을 제공하지만 asyncpg는
         postgresql+asyncpg:// 형식이 필요하다.
         asyncpg가 지원하지 않는 쿼리 파라미터(sslmode, channel_binding 등)도 제거한다.
         """
-        url = self.DATABASE_URL
         if url.startswith("postgres://"):
             url = url.replace("postgres://", "postgresql+asyncpg://", 1)
         elif url.startswith("postgresql://"):
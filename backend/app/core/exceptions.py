@@ -48,7 +48,24 @@ class ConflictException(HTTPException):
 class RateLimitException(HTTPException):
     """요청 횟수 초과 시 발생하는 예외."""
 
-    def __init__(self, detail: str = "요청 횟수를 초과했습니다.") -> None:
+    def __init__(
+        self, detail: str = "요청 횟수를 초과했습니다.", retry_after: int | None = None
+    ) -> None:
         super().__init__(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)} if retry_after else None,
+        )
+
+
+class ServiceUnavailableException(HTTPException):
+    """의존 서비스(Redis 등)를 사용할 수 없을 때 발생하는 예외."""
+
+    def __init__(
+        self, detail: str = "일시적으로 서비스를 사용할 수 없습니다.", retry_after: int = 5
+    ) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
         )
@@ -0,0 +1,154 @@
+"""비동기 비밀번호 해싱 모듈.
+
+bcrypt는 CPU 바운드 작업이라 이벤트 루프에서 직접 호출하면 워커 전체가 멈춘다.
+프로세스 풀에서 해싱/검증을 수행하고, 동시 실행 수를 세마포어로 제한하며
+대기 시간 지표를 수집한다.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+_executor: ProcessPoolExecutor | None = None
+_semaphore: asyncio.Semaphore | None = None
+
+_metrics: dict[str, float] = {
+    "calls": 0,
+    "waiting": 0,
+    "in_flight": 0,
+    "queue_wait_total_ms": 0.0,
+    "queue_wait_max_ms": 0.0,
+    "rehashed": 0,
+}
+
+
+def _hash_sync(password: bytes, rounds: int) -> str:
+    """프로세스 풀 워커에서 실행되는 bcrypt 해싱."""
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def _verify_sync(password: bytes, hashed: bytes) -> bool:
+    """프로세스 풀 워커에서 실행되는 bcrypt 검증."""
+    return bcrypt.checkpw(password, hashed)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """bcrypt 전용 프로세스 풀 싱글턴을 반환한다."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+    return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """동시 해싱 수를 제한하는 세마포어 싱글턴을 반환한다."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_CONCURRENCY)
+    return _semaphore
+
+
+async def _run(func, *args):
+    """세마포어로 동시성을 제한하며 프로세스 풀에서 함수를 실행한다."""
+    semaphore = _get_semaphore()
+    _metrics["waiting"] += 1
+    started = time.perf_counter()
+    async with semaphore:
+        waited_ms = (time.perf_counter() - started) * 1000
+        _metrics["waiting"] -= 1
+        _metrics["calls"] += 1
+        _metrics["queue_wait_total_ms"] += waited_ms
+        _metrics["queue_wait_max_ms"] = max(_metrics["queue_wait_max_ms"], waited_ms)
+        _metrics["in_flight"] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_executor(), func, *args)
+        finally:
+            _metrics["in_flight"] -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호를 설정된 cost factor의 bcrypt로 해싱한다.
+
+    Args:
+        password: 평문 비밀번호.
+
+    Returns:
+        해싱된 비밀번호 문자열.
+    """
+    return await _run(_hash_sync, password.encode("utf-8"), settings.BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """평문 비밀번호와 해시를 비교 검증한다.
+
+    Args:
+        plain_password: 평문 비밀번호.
+        hashed_password: 해싱된 비밀번호.
+
+    Returns:
+        비밀번호 일치 여부.
+    """
+    return await _run(
+        _verify_sync,
+        plain_password.encode("utf-8"),
+        hashed_password.encode("utf-8"),
+    )
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """해시의 cost factor가 현재 설정과 다른지 확인한다.
+
+    bcrypt 해시 형식: `$2b$<cost>$<salt+hash>`.
+
+    Args:
+        hashed_password: 해싱된 비밀번호.
+
+    Returns:
+        재해싱이 필요하면 True.
+    """
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != settings.BCRYPT_ROUNDS
+
+
+def record_rehash() -> None:
+    """로그인 시 재해싱이 수행되었음을 기록한다."""
+    _metrics["rehashed"] += 1
+
+
+def get_metrics() -> dict:
+    """해싱 풀 지표를 반환한다.
+
+    Returns:
+        호출 수, 대기/실행 중 작업 수, 큐 대기 시간 통계 딕셔너리.
+    """
+    calls = _metrics["calls"]
+    return {
+        "calls": int(calls),
+        "waiting": int(_metrics["waiting"]),
+        "in_flight": int(_metrics["in_flight"]),
+        "rehashed": int(_metrics["rehashed"]),
+        "queue_wait_avg_ms": round(_metrics["queue_wait_total_ms"] / calls, 3) if calls else 0.0,
+        "queue_wait_max_ms": round(_metrics["queue_wait_max_ms"], 3),
+        "max_concurrency": settings.PASSWORD_HASH_MAX_CONCURRENCY,
+        "workers": settings.PASSWORD_HASH_WORKERS,
+    }
+
+
+def shutdown() -> None:
+    """프로세스 풀을 종료한다 (앱 종료 시 호출)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
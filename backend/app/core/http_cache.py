@@ -0,0 +1,161 @@
+"""HTTP 조건부 요청 / 캐시 헤더 미들웨어.
+
+공개 GET 엔드포인트에 대해 데이터 버전(Redis 버전 카운터)으로 약한 ETag를
+계산하고, If-None-Match가 일치하면 라우트(DB 작업)를 실행하지 않고 304를 반환한다.
+200 응답에는 ETag와 Cache-Control을 붙여 앞단 캐시(CDN/nginx)가
+`s-maxage` 동안 응답을 재사용하고 `stale-while-revalidate` 동안 백그라운드로 갱신하게 한다.
+
+규칙(CacheRule)마다 경로 정규식과 버전 키 목록을 지정한다.
+- per_user: 응답에 로그인 유저별 값이 섞이는 경로. 인증 헤더가 있으면
+  유저별 버전 키를 포함하고 `private, no-cache`로 응답한다.
+- bucket_seconds: 버전을 올리지 않는 값(풀이 수 등)이 바뀔 수 있는 최대 지연.
+  ETag에 이 주기의 시간 구간을 넣어 주기마다 다시 검증되게 한다.
+
+Redis를 사용할 수 없으면 헤더 없이 그대로 통과시킨다.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.core import token_store
+from app.core.redis import get_redis_client
+from app.core.security import decode_token_cached
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class CacheRule(NamedTuple):
+    """조건부 요청을 처리할 경로 규칙."""
+
+    name: str
+    path: str
+    version_keys: Callable[[int | None], list[str]]
+    per_user: bool = False
+    bucket_seconds: int = 0
+
+
+async def _user_id(headers: Headers) -> int | None:
+    """Authorization 헤더의 access 토큰에서 유저 ID를 구한다 (실패 시 None)."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_token_cached(token)
+    if payload is None or payload.get("type") != "access":
+        return None
+    if await token_store.is_revoked(payload):
+        return None
+    user_id = payload.get("sub")
+    return int(user_id) if user_id else None
+
+
+async def _versions(keys: list[str]) -> list[str] | None:
+    """버전 키 값을 읽는다. 없는 키는 현재 시각으로 초기화한다."""
+    redis = get_redis_client()
+    if redis is None:
+        return None
+    try:
+        versions = await redis.mget(keys)
+        if None in versions:
+            for key, version in zip(keys, versions):
+                if version is None:
+                    await redis.set(key, time.time_ns(), nx=True)
+            versions = await redis.mget(keys)
+    except RedisError:
+        return None
+    return versions
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 약한 비교로 확인한다."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+class HTTPCacheMiddleware:
+    """공개 GET 응답에 ETag/Cache-Control을 붙이고 304를 처리하는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp, rules: Sequence[CacheRule]) -> None:
+        self.app = app
+        self.rules = [(re.compile(rule.path), rule) for rule in rules]
+
+    def _match(self, path: str) -> CacheRule | None:
+        for pattern, rule in self.rules:
+            if pattern.fullmatch(path):
+                return rule
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        rule = self._match(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        authenticated = rule.per_user and "authorization" in request_headers
+        user_id = await _user_id(request_headers) if authenticated else None
+
+        versions = await _versions(rule.version_keys(user_id))
+        if versions is None:
+            await self.app(scope, receive, send)
+            return
+
+        bucket = int(time.time() // rule.bucket_seconds) if rule.bucket_seconds else 0
+        raw = "\x00".join(
+            [
+                *versions,
+                str(bucket),
+                scope["path"],
+                scope.get("query_string", b"").decode("latin-1"),
+                str(user_id),
+            ]
+        )
+        etag = f'W/"{rule.name}-{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20]}"'
+
+        if authenticated:
+            cache_control = "private, no-cache"
+        else:
+            cache_control = (
+                f"public, max-age=0, s-maxage={settings.HTTP_CACHE_S_MAXAGE_SECONDS}, "
+                f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+            )
+        cache_headers = {"ETag": etag, "Cache-Control": cache_control}
+        if rule.per_user:
+            cache_headers["Vary"] = "Authorization"
+
+        if _etag_matches(request_headers.get("if-none-match"), etag):
+            await Response(status_code=304, headers=cache_headers)(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                if "etag" not in headers:
+                    for name, value in cache_headers.items():
+                        if name == "Vary":
+                            headers.add_vary_header(value)
+                        else:
+                            headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
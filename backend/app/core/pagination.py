@@ -0,0 +1,63 @@
+"""Keyset(커서) 페이지네이션 유틸리티.
+
+OFFSET은 앞 페이지의 행을 모두 읽고 버리므로 뒤로 갈수록 느려진다.
+대신 마지막 행의 정렬 키를 불투명한 커서 문자열로 넘겨주고,
+다음 페이지는 `(정렬 키) < (커서 값)` 조건으로 인덱스에서 바로 이어 읽는다.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from app.core.exceptions import BadRequestException
+
+
+def _default(value: Any) -> Any:
+    """JSON으로 직렬화할 수 없는 정렬 키 값을 변환한다."""
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    raise TypeError(f"커서에 담을 수 없는 값: {type(value).__name__}")
+
+
+def _object_hook(obj: dict) -> Any:
+    if "$dt" in obj:
+        return datetime.fromisoformat(obj["$dt"])
+    return obj
+
+
+def encode_cursor(kind: str, values: list[Any]) -> str:
+    """정렬 종류와 마지막 행의 정렬 키로 커서 문자열을 만든다.
+
+    Args:
+        kind: 정렬 종류 (다른 정렬의 커서를 재사용하지 못하게 함께 저장).
+        values: 마지막 행의 정렬 키 값 목록 (tie-breaker id 포함).
+
+    Returns:
+        URL-safe base64 커서 문자열.
+    """
+    raw = json.dumps({"k": kind, "v": values}, default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str) -> list[Any]:
+    """커서 문자열을 정렬 키 값 목록으로 되돌린다.
+
+    Args:
+        cursor: encode_cursor로 만든 커서 문자열.
+        kind: 기대하는 정렬 종류.
+
+    Returns:
+        정렬 키 값 목록.
+
+    Raises:
+        BadRequestException: 커서가 손상되었거나 다른 정렬의 커서일 때.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded), object_hook=_object_hook)
+        if data["k"] != kind or not isinstance(data["v"], list):
+            raise ValueError
+        return data["v"]
+    except (ValueError, KeyError, TypeError):
+        raise BadRequestException("유효하지 않은 커서입니다.")
@@ -0,0 +1,93 @@
+"""트랜잭션 커밋 후 작업 큐.
+
+서비스는 커밋된 변경을 Redis 등 외부 저장소에 반영해야 할 때 값을 세션(session.info)에 쌓아두고,
+커밋되면 키별로 등록된 핸들러가 백그라운드 태스크로 실행된다. 롤백되면 쌓인 값은 버려진다.
+savepoint(begin_nested) 롤백은 바깥 트랜잭션이 계속되므로 쌓인 값을 유지한다.
+
+    post_commit.register("catalog", _apply_changes)
+    post_commit.pending(db.sync_session, "catalog", dict)["dirty"] = True
+
+이벤트 루프 밖(동기 스크립트 등)에서 커밋되면 핸들러를 실행하지 않는다.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+T = TypeVar("T")
+
+_INFO_KEY = "post_commit"
+
+_handlers: dict[str, Callable[[Any], Coroutine[Any, Any, None]]] = {}
+_background_tasks: set[asyncio.Task] = set()
+
+
+def register(key: str, handler: Callable[[Any], Coroutine[Any, Any, None]]) -> None:
+    """키에 쌓인 값을 커밋 후 처리할 핸들러를 등록한다.
+
+    Args:
+        key: 세션에 값을 쌓을 키 (모듈마다 고유).
+        handler: 쌓인 값을 받아 실행할 코루틴 함수.
+    """
+    _handlers[key] = handler
+
+
+def pending(session: Session, key: str, factory: Callable[[], T]) -> T:
+    """세션에 쌓인 키의 값을 반환한다. 없으면 factory()로 만들어 둔다.
+
+    Args:
+        session: 동기 세션 (AsyncSession이면 db.sync_session).
+        key: register()로 등록한 키.
+        factory: 값이 없을 때 만들 컨테이너 (list, set, dict 등).
+
+    Returns:
+        커밋 후 핸들러에 전달될 값. 호출자가 직접 변경한다.
+    """
+    queued = session.info.setdefault(_INFO_KEY, {})
+    if key not in queued:
+        queued[key] = factory()
+    return queued[key]
+
+
+def peek(session: Session, key: str) -> Any:
+    """세션에 쌓인 키의 값을 반환한다 (없으면 None)."""
+    return session.info.get(_INFO_KEY, {}).get(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    """커밋된 세션에 쌓인 값을 키별 핸들러로 비동기 실행한다.
+
+    after_commit은 savepoint 해제에도 호출되므로, 바깥 트랜잭션이 커밋될 때까지 기다린다.
+    """
+    if session.in_nested_transaction():
+        return
+    queued = session.info.pop(_INFO_KEY, None)
+    if not queued:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for key, value in queued.items():
+        if not value:
+            continue
+        task = loop.create_task(_handlers[key](value))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    """최상위 트랜잭션이 롤백되면 쌓인 값을 버린다.
+
+    after_rollback은 savepoint 롤백에도 호출되므로 쓰지 않는다. savepoint(begin_nested)
+    롤백은 바깥 트랜잭션이 계속되므로 쌓인 값을 유지한다. 커밋된 경우에는
+    after_commit에서 이미 꺼냈으므로 남은 값이 없다.
+    """
+    if transaction.nested or transaction.parent is not None:
+        return
+    session.info.pop(_INFO_KEY, None)
@@ -0,0 +1,113 @@
+"""인증 주체(principal) 캐시 모듈.
+
+권한 검사에 필요한 최소 정보(id, username, role)만 캐시하여
+관리자 라우트마다 users 테이블을 조회하지 않게 한다.
+
+조회 순서: 프로세스 내 TTL 캐시 → Redis 해시 → DB.
+역할이 바뀌면 invalidate_principal()로 Redis와 현재 워커의 캐시를 비운다.
+다른 워커의 프로세스 내 캐시는 PRINCIPAL_LOCAL_TTL_SECONDS 이내에 만료된다.
+"""
+
+import logging
+import time
+from typing import NamedTuple
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core.redis import get_redis_client
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class Principal(NamedTuple):
+    """권한 검사용 유저 정보."""
+
+    id: int
+    username: str
+    role: str
+
+
+_LOCAL_CACHE_MAX_ENTRIES = 10000
+
+_local_cache: dict[int, tuple[float, Principal]] = {}
+
+
+def _store_local(principal: Principal, now: float) -> None:
+    """principal을 프로세스 내 캐시에 저장한다."""
+    if len(_local_cache) >= _LOCAL_CACHE_MAX_ENTRIES:
+        _local_cache.clear()
+    _local_cache[principal.id] = (now + settings.PRINCIPAL_LOCAL_TTL_SECONDS, principal)
+
+
+def _redis_key(user_id: int) -> str:
+    """principal Redis 키를 반환한다."""
+    return f"principal:{user_id}"
+
+
+async def get_principal(db: AsyncSession, user_id: int) -> Principal | None:
+    """유저의 principal을 캐시에서 조회하고, 없으면 DB에서 로드한다.
+
+    Args:
+        db: DB 세션.
+        user_id: 유저 ID.
+
+    Returns:
+        Principal 또는 유저가 없으면 None.
+    """
+    now = time.monotonic()
+    cached = _local_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    redis = get_redis_client()
+    if redis is not None:
+        try:
+            data = await redis.hgetall(_redis_key(user_id))
+        except RedisError:
+            logger.warning("principal 캐시 조회 실패: user=%d", user_id)
+            data = None
+        if data:
+            principal = Principal(user_id, data["username"], data["role"])
+            _store_local(principal, now)
+            return principal
+
+    result = await db.execute(
+        select(User.id, User.username, User.role).where(User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    principal = Principal(row.id, row.username, row.role)
+    _store_local(principal, now)
+    if redis is not None:
+        try:
+            key = _redis_key(user_id)
+            pipe = redis.pipeline()
+            pipe.hset(key, mapping={"username": principal.username, "role": principal.role})
+            pipe.expire(key, settings.PRINCIPAL_REDIS_TTL_SECONDS)
+            await pipe.execute()
+        except RedisError:
+            logger.warning("principal 캐시 저장 실패: user=%d", user_id)
+    return principal
+
+
+async def invalidate_principal(user_id: int) -> None:
+    """유저의 principal 캐시를 무효화한다.
+
+    Args:
+        user_id: 유저 ID.
+    """
+    _local_cache.pop(user_id, None)
+    redis = get_redis_client()
+    if redis is not None:
+        try:
+            await redis.delete(_redis_key(user_id))
+        except RedisError:
+            logger.warning("principal 캐시 무효화 실패: user=%d", user_id)
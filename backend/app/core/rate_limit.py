@@ -1,48 +1,211 @@
-"""Redis 기반 슬라이딩 윈도우 Rate Limiter.
+"""Redis 기반 Rate Limiter.
 
-시간 윈도우 내 요청 횟수를 Redis Sorted Set으로 추적하여
-제한을 초과하면 RateLimitException을 발생시킨다.
+단일 Lua 스크립트(EVALSHA)로 검사와 기록을 원자적으로 수행하여
+요청당 Redis 왕복을 한 번으로 줄인다. 알고리즘은 키마다 선택할 수 있다.
+
+- sliding_window: 직전/현재 두 버킷 카운터를 가중 합산하는 슬라이딩 윈도우.
+  키당 메모리 O(1).
+- gcra: GCRA(Generic Cell Rate Algorithm) 방식의 토큰 버킷.
+  키당 TAT(theoretical arrival time) 값 하나만 저장한다.
+- log: Sorted Set에 요청 타임스탬프를 기록하는 정확한 슬라이딩 로그.
+  거부된 요청은 기록하지 않는다.
+
+제한을 초과하면 Retry-After 초를 담은 RateLimitException을 발생시킨다.
+
+Redis 앞단에는 워커 프로세스 내 토큰 버킷(LocalTokenBucket)을 두어
+명백한 폭주 요청은 I/O 없이 즉시 거부한다.
 """
 
+import logging
+import math
 import time
+import uuid
+from collections import OrderedDict
+from enum import StrEnum
 
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from app.core.exceptions import RateLimitException
 
+logger = logging.getLogger(__name__)
+
+
+class RateLimitAlgorithm(StrEnum):
+    """Rate limit 알고리즘."""
+
+    SLIDING_WINDOW = "sliding_window"
+    GCRA = "gcra"
+    LOG = "log"
+
+
+# KEYS[1]=기본 키
+# ARGV[1]=알고리즘, ARGV[2]=최대 요청 수, ARGV[3]=윈도우(ms), ARGV[4]=log 모드 멤버 ID
+# 반환: {허용 여부(1/0), 재시도까지 남은 시간(ms)}
+_RATE_LIMIT_SCRIPT = """
+local algorithm = ARGV[1]
+local limit = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+if algorithm == 'sliding_window' then
+  local index = math.floor(now / window)
+  local elapsed = now - index * window
+  local current_key = KEYS[1] .. ':' .. index
+  local previous_key = KEYS[1] .. ':' .. (index - 1)
+  local current = tonumber(redis.call('GET', current_key) or '0')
+  local previous = tonumber(redis.call('GET', previous_key) or '0')
+  local estimate = previous * (window - elapsed) / window + current
+  if estimate + 1 > limit then
+    local retry
+    if current + 1 > limit then
+      -- 다음 버킷에서도 현재 카운트가 가중치로 남으므로 감소분을 계산한다
+      retry = window - elapsed + math.ceil(window * (current + 1 - limit) / math.max(current, 1))
+    else
+      retry = math.ceil(window * (1 - (limit - 1 - current) / previous)) - elapsed
+    end
+    return {0, math.max(retry, 1)}
+  end
+  redis.call('INCR', current_key)
+  redis.call('PEXPIRE', current_key, window * 2)
+  return {1, 0}
+end
+
+if algorithm == 'gcra' then
+  local interval = window / limit
+  local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+  if tat < now then
+    tat = now
+  end
+  local new_tat = tat + interval
+  local allow_at = new_tat - window
+  if now < allow_at then
+    return {0, math.ceil(allow_at - now)}
+  end
+  redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+  return {1, 0}
+end
+
+-- log
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= limit then
+  local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+  return {0, math.max(tonumber(oldest[2]) + window - now, 1)}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, 0}
+"""
+
+_scripts: dict[int, object] = {}
+
+
+class LocalTokenBucket:
+    """워커 프로세스 내 토큰 버킷 사전 필터.
+
+    한 워커가 받은 요청은 전역(Redis) 요청의 부분집합이므로, 같은 한도로
+    로컬에서 거부된 요청은 전역에서도 거부된다. 키 수는 LRU로 제한한다.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def consume(self, key: str, max_requests: int, window_seconds: int) -> float:
+        """토큰 하나를 소비한다.
+
+        Args:
+            key: 버킷 키.
+            max_requests: 버킷 용량 (윈도우 내 최대 요청 수).
+            window_seconds: 용량이 가득 찰 때까지 걸리는 시간 (초).
+
+        Returns:
+            허용되면 0, 거부되면 다음 토큰까지 남은 시간 (초).
+        """
+        now = time.monotonic()
+        rate = max_requests / window_seconds
+        tokens, updated = self._buckets.pop(key, (float(max_requests), now))
+        tokens = min(float(max_requests), tokens + (now - updated) * rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / rate
+
+        self._buckets[key] = (tokens - 1, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+
+local_prefilter = LocalTokenBucket()
+
+
+def check_local_rate_limit(key: str, max_requests: int, window_seconds: int) -> None:
+    """워커 로컬 토큰 버킷으로 요청 빈도를 검사한다 (I/O 없음).
+
+    Args:
+        key: Rate limit 키.
+        max_requests: 윈도우 내 최대 요청 수.
+        window_seconds: 윈도우 크기 (초).
+
+    Raises:
+        RateLimitException: 로컬 버킷이 비었을 때.
+    """
+    wait = local_prefilter.consume(key, max_requests, window_seconds)
+    if wait > 0:
+        raise RateLimitException(
+            "요청 빈도 제한을 초과했습니다. 잠시 후 다시 시도해주세요.",
+            retry_after=max(1, math.ceil(wait)),
+        )
+
+
+def _get_script(redis: Redis):
+    """Redis 클라이언트별로 등록된 Lua 스크립트 객체를 반환한다.
+
+    redis-py Script는 EVALSHA를 먼저 시도하고 NOSCRIPT일 때만 스크립트를 전송한다.
+    """
+    script = _scripts.get(id(redis))
+    if script is None:
+        script = redis.register_script(_RATE_LIMIT_SCRIPT)
+        _scripts[id(redis)] = script
+    return script
+
 
 async def check_rate_limit(
     redis: Redis,
     key: str,
     max_requests: int,
     window_seconds: int,
+    algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
 ) -> None:
-    """슬라이딩 윈도우 방식으로 요청 빈도를 검사한다.
+    """요청 빈도를 검사하고, 허용되면 요청을 기록한다.
 
-    Redis Sorted Set에 타임스탬프를 score로 저장하고,
-    윈도우 밖의 오래된 항목을 제거한 뒤 현재 항목 수를 센다.
+    Redis 오류 시에는 요청을 막지 않는다 (fail-open).
 
     Args:
         redis: Redis 비동기 클라이언트.
         key: Rate limit 키 (e.g., "flag_submit:{user_id}").
         max_requests: 윈도우 내 최대 요청 수.
         window_seconds: 윈도우 크기 (초).
+        algorithm: 사용할 알고리즘.
 
     Raises:
-        RateLimitException: 제한을 초과했을 때.
+        RateLimitException: 제한을 초과했을 때 (retry_after 포함).
     """
-    now = time.time()
-    window_start = now - window_seconds
-
-    pipe = redis.pipeline()
-    pipe.zremrangebyscore(key, 0, window_start)
-    pipe.zadd(key, {str(now): now})
-    pipe.zcard(key)
-    pipe.expire(key, window_seconds)
-    results = await pipe.execute()
-
-    count = results[2]
-    if count > max_requests:
+    member = uuid.uuid4().hex if algorithm == RateLimitAlgorithm.LOG else ""
+    try:
+        allowed, retry_ms = await _get_script(redis)(
+            keys=[f"rl:{algorithm}:{key}"],
+            args=[str(algorithm), max_requests, window_seconds * 1000, member],
+        )
+    except RedisError:
+        logger.warning("rate limit 검사 실패 (허용 처리): key=%s", key)
+        return
+
+    if not int(allowed):
         raise RateLimitException(
-            "요청 빈도 제한을 초과했습니다. 잠시 후 다시 시도해주세요."
+            "요청 빈도 제한을 초과했습니다. 잠시 후 다시 시도해주세요.",
+            retry_after=max(1, math.ceil(int(retry_ms) / 1000)),
         )
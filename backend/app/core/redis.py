@@ -0,0 +1,29 @@
+"""Redis 클라이언트 싱글턴 모듈.
+
+API 의존성 주입 밖(서비스 계층, 캐시 모듈 등)에서도 같은 연결 풀을
+재사용할 수 있도록 비동기 클라이언트를 글로벌 싱글턴으로 관리한다.
+"""
+
+from redis.asyncio import Redis
+
+from app.config import get_settings
+
+_redis_client: Redis | None = None
+
+
+def get_redis_client() -> Redis | None:
+    """Redis 비동기 클라이언트 싱글턴을 반환한다.
+
+    Returns:
+        Redis 클라이언트. REDIS_URL이 설정되지 않았으면 None.
+    """
+    global _redis_client
+    settings = get_settings()
+    if not settings.REDIS_URL:
+        return None
+    if _redis_client is None:
+        _redis_client = Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+        )
+    return _redis_client
@@ -0,0 +1,188 @@
+"""응답 캐시 모듈.
+
+자주 조회되는 GET 응답을 인코딩된 JSON 바이트 그대로 저장해 두고,
+캐시 적중 시 pydantic 검증/직렬화 없이 바로 응답한다.
+
+- 키: 네임스페이스 + 라우트 + 요청 파라미터(스칼라 인자) 해시
+- 무효화: 네임스페이스 버전을 올린다. 데이터를 바꾸는 서비스가
+  `invalidate(db, ...)`로 세션에 표시하면 트랜잭션 커밋 후 반영된다.
+- 저장소: Redis (`rc:ver:{ns}` 버전, `rc:{ns}:{hash}` "버전\\n본문").
+  버전과 본문을 MGET 한 번으로 읽어 버전이 다르면 미스로 처리한다.
+  Redis가 없으면 프로세스 메모리에 저장한다 (워커 간 불일치는 TTL로 제한).
+
+네임스페이스에는 `dashboard:{user_id}`처럼 라우트 인자를 넣을 수 있다.
+"""
+
+import functools
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core import post_commit
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+LOCAL_MAX_ENTRIES = 1024
+_NAMESPACES_KEY = "response_cache_namespaces"
+_SCALAR_TYPES = (str, int, float, bool, Enum, type(None))
+
+_local_versions: dict[str, int] = {}
+_local_entries: OrderedDict[str, tuple[float, int, bytes]] = OrderedDict()
+
+
+def version_key(namespace: str) -> str:
+    """네임스페이스 버전 Redis 키를 반환한다 (HTTP ETag 계산에도 사용)."""
+    return f"rc:ver:{namespace}"
+
+
+def _entry_key(namespace: str, route: str, params: dict[str, Any]) -> str:
+    raw = orjson.dumps([route, params], option=orjson.OPT_SORT_KEYS)
+    return f"rc:{namespace}:{hashlib.sha256(raw).hexdigest()[:24]}"
+
+
+def encode(content: Any) -> bytes:
+    """응답 내용을 JSON 바이트로 인코딩한다."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode("utf-8")
+    return orjson.dumps(content, default=_default)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError
+
+
+async def _lookup(namespace: str, key: str) -> tuple[Any, bytes | None]:
+    """(현재 네임스페이스 버전, 캐시된 본문)을 반환한다.
+
+    버전은 저장 시 그대로 사용해, 조회 이후 무효화된 데이터가
+    새 버전으로 저장되지 않게 한다.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        version = _local_versions.get(namespace, 0)
+        entry = _local_entries.get(key)
+        if entry is None:
+            return version, None
+        expires_at, cached_version, body = entry
+        if expires_at < time.monotonic() or cached_version != version:
+            _local_entries.pop(key, None)
+            return version, None
+        return version, body
+
+    try:
+        version, cached = await redis.mget(version_key(namespace), key)
+        if version is None:
+            # 키가 사라진 뒤에도 이전 항목과 버전이 겹치지 않도록 현재 시각으로 초기화
+            await redis.set(version_key(namespace), time.time_ns(), nx=True)
+            return await redis.get(version_key(namespace)), None
+    except RedisError:
+        return None, None
+    if cached is None:
+        return version, None
+    cached_version, _, body = cached.partition("\n")
+    if cached_version != version:
+        return version, None
+    return version, body.encode("utf-8")
+
+
+async def _store(namespace: str, key: str, version: Any, body: bytes, ttl: int) -> None:
+    redis = get_redis_client()
+    if redis is None:
+        _local_entries[key] = (time.monotonic() + ttl, version, body)
+        _local_entries.move_to_end(key)
+        while len(_local_entries) > LOCAL_MAX_ENTRIES:
+            _local_entries.popitem(last=False)
+        return
+
+    try:
+        await redis.set(key, f"{version}\n".encode("utf-8") + body, ex=ttl)
+    except RedisError:
+        logger.warning("응답 캐시 저장 실패: %s", namespace)
+
+
+async def bump(*namespaces: str) -> None:
+    """네임스페이스 버전을 즉시 올려 캐시된 응답을 무효화한다."""
+    for namespace in namespaces:
+        _local_versions[namespace] = _local_versions.get(namespace, 0) + 1
+    redis = get_redis_client()
+    if redis is None or not namespaces:
+        return
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for namespace in namespaces:
+            pipe.incr(version_key(namespace))
+        await pipe.execute()
+    except RedisError:
+        logger.warning("응답 캐시 무효화 실패: %s", ", ".join(namespaces))
+
+
+def invalidate(db: AsyncSession, *namespaces: str) -> None:
+    """트랜잭션 커밋 후 무효화할 네임스페이스를 세션에 쌓아둔다."""
+    post_commit.pending(db.sync_session, _NAMESPACES_KEY, set).update(namespaces)
+
+
+async def _bump_committed(namespaces: set[str]) -> None:
+    await bump(*namespaces)
+
+
+post_commit.register(_NAMESPACES_KEY, _bump_committed)
+
+
+def cached_response(namespace: str, *, ttl: int | None = None) -> Callable:
+    """GET 라우트 응답을 인코딩된 바이트로 캐시하는 데코레이터.
+
+    라우트의 스칼라 인자(쿼리/경로 파라미터, user_id 등)가 캐시 키가 되며,
+    DB 세션 같은 객체 인자는 무시한다. 반환값은 인코딩된 Response이므로
+    response_model 검증을 거치지 않는다 (라우트는 응답 스키마 객체를 반환해야 한다).
+    무효화는 주 DB 커밋 직후 일어나므로, 라우트는 복제본이 아닌 주 DB 세션으로 읽어야 한다.
+
+    Args:
+        namespace: 무효화 단위. `{user_id}`처럼 라우트 인자를 포함할 수 있다.
+        ttl: 캐시 유지 시간(초). 기본값은 RESPONSE_CACHE_TTL_SECONDS.
+
+    Returns:
+        라우트 데코레이터.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        route = f"{func.__module__}.{func.__qualname__}"
+        expire = ttl or settings.RESPONSE_CACHE_TTL_SECONDS
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Response:
+            params = {
+                name: value.value if isinstance(value, Enum) else value
+                for name, value in kwargs.items()
+                if isinstance(value, _SCALAR_TYPES)
+            }
+            ns = namespace.format(**params)
+            key = _entry_key(ns, route, params)
+
+            version, body = await _lookup(ns, key)
+            if body is not None:
+                return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+            body = encode(await func(*args, **kwargs))
+            if version is not None:
+                await _store(ns, key, version, body, expire)
+            return Response(body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+        return wrapper
+
+    return decorator
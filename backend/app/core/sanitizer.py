@@ -0,0 +1,398 @@
+"""HTML 토크나이저 기반 sanitizer 모듈.
+
+입력을 앞에서부터 한 번만 훑으며 태그를 직접 파싱한다. 정규식 역추적이 없어
+입력 길이에 선형 시간으로 동작한다 (닫히지 않은 태그/따옴표가 있으면
+나머지를 텍스트로 처리하고 스캔을 끝낸다). 태그 이름/속성 경계는 브라우저의
+HTML 토크나이저 규칙을 따른다.
+
+- sanitize_markdown: 저장용 Markdown 원문 정리. script 요소 제거,
+  태그의 on* 속성 제거, `javascript:` 제거.
+- sanitize_html: 렌더링된 HTML 정리. 허용 목록에 있는 태그/속성만 남기고
+  URL 속성은 http/https/mailto/상대 경로만 허용한다.
+- render_markdown: Markdown을 HTML로 렌더링한 뒤 sanitize_html을 적용한다.
+  CommonMark + GFM 표/취소선이며, 프론트엔드(react-markdown)와 같이
+  원시 HTML은 렌더링하지 않고 텍스트로 이스케이프한다.
+"""
+
+import html
+import re
+from typing import NamedTuple
+
+from markdown_it import MarkdownIt
+
+_WS = re.compile(r"[ \t\n\r\f]*")
+_TAG_NAME = re.compile(r"[A-Za-z][^ \t\n\r\f/>]*")
+_ATTR_NAME = re.compile(r"[^ \t\n\r\f/>=]*")
+_UNQUOTED_VALUE = re.compile(r"[^ \t\n\r\f>]*")
+_JS_SCHEME = re.compile(r"javascript:", re.IGNORECASE)
+_COMMENT_END = re.compile(r"--!?>")
+_TAG_CLOSE = re.compile(r">")
+_URL_STRIP = re.compile(r"[\x00-\x20\x7f]+")
+_LANGUAGE_CLASS = re.compile(r"language-[\w+#.-]{1,32}")
+_TEXT_ALIGN_STYLE = re.compile(r"text-align:(left|right|center)")
+
+_JS_SCHEME_TEXT = "javascript:"
+
+# 내용까지 통째로 버리는 요소 (sanitize_html)
+_DROP_CONTENT_TAGS = frozenset(
+    {"script", "style", "iframe", "object", "embed", "template", "noscript",
+     "textarea", "title", "xmp", "noembed", "noframes", "frameset", "svg", "math"}
+)
+
+_ALLOWED_TAGS = frozenset(
+    {"p", "br", "hr", "h1", "h2", "h3", "h4", "h5", "h6", "strong", "em", "b", "i",
+     "u", "s", "del", "ins", "mark", "sup", "sub", "code", "pre", "kbd", "blockquote",
+     "ul", "ol", "li", "dl", "dt", "dd", "a", "img", "table", "thead", "tbody",
+     "tfoot", "tr", "th", "td", "span", "div", "details", "summary"}
+)
+
+_ALLOWED_ATTRS: dict[str, frozenset[str]] = {
+    "a": frozenset({"href", "title"}),
+    "img": frozenset({"src", "alt", "title", "width", "height"}),
+    "th": frozenset({"style", "colspan", "rowspan"}),
+    "td": frozenset({"style", "colspan", "rowspan"}),
+    "code": frozenset({"class"}),
+    "pre": frozenset({"class"}),
+    "ol": frozenset({"start"}),
+}
+
+_URL_ATTRS = frozenset({"href", "src"})
+_SAFE_SCHEMES = frozenset({"http", "https", "mailto"})
+
+# 중첩 깊이를 제한해 깊게 중첩된 인용/목록 입력의 렌더링 비용을 줄인다
+_markdown = MarkdownIt("js-default", {"maxNesting": 20})
+
+_end_tag_patterns: dict[str, re.Pattern] = {}
+
+
+class _Attr(NamedTuple):
+    """파싱된 속성. start/end는 원문에서 이름 시작~값 끝 위치."""
+
+    name: str
+    value: str | None
+    start: int
+    end: int
+
+
+class _Tag(NamedTuple):
+    """파싱된 태그."""
+
+    name: str
+    closing: bool
+    attrs: list[_Attr]
+    self_closing: bool
+    end: int
+
+
+# 닫히지 않은 태그 표시 (입력 끝까지 '>'나 닫는 따옴표가 없음)
+_UNTERMINATED = _Tag("", False, [], False, -1)
+
+
+def _parse_tag(text: str, start: int) -> _Tag | None:
+    """text[start]의 '<'부터 태그 하나를 파싱한다.
+
+    Returns:
+        파싱된 _Tag, 태그가 아니면 None, 입력 끝까지 닫히지 않으면 _UNTERMINATED.
+    """
+    n = len(text)
+    i = start + 1
+    closing = i < n and text[i] == "/"
+    if closing:
+        i += 1
+    match = _TAG_NAME.match(text, i)
+    if match is None:
+        return None
+    name = match.group().lower()
+    i = match.end()
+
+    attrs: list[_Attr] = []
+    while True:
+        i = _WS.match(text, i).end()
+        if i >= n:
+            return _UNTERMINATED
+        char = text[i]
+        if char == ">":
+            return _Tag(name, closing, attrs, False, i + 1)
+        if char == "/":
+            if i + 1 < n and text[i + 1] == ">":
+                return _Tag(name, closing, attrs, True, i + 2)
+            i += 1
+            continue
+
+        # 속성 이름 첫 글자의 '='는 이름에 포함된다 (브라우저 규칙)
+        name_end = _ATTR_NAME.match(text, i + 1 if char == "=" else i).end()
+        attr_start = i
+        attr = text[i:name_end].lower()
+        i = _WS.match(text, name_end).end()
+
+        value = None
+        attr_end = name_end
+        if i < n and text[i] == "=":
+            i = _WS.match(text, i + 1).end()
+            if i >= n:
+                return _UNTERMINATED
+            quote = text[i]
+            if quote in "\"'":
+                close = text.find(quote, i + 1)
+                if close < 0:
+                    return _UNTERMINATED
+                value = text[i + 1:close]
+                i = close + 1
+            else:
+                value_end = _UNQUOTED_VALUE.match(text, i).end()
+                value = text[i:value_end]
+                i = value_end
+            attr_end = i
+        else:
+            i = name_end
+        attrs.append(_Attr(attr, value, attr_start, attr_end))
+
+
+def _find_end_tag(text: str, name: str, start: int) -> int:
+    """start 이후 </name> 닫는 태그의 끝 위치를 반환한다 (없으면 입력 끝)."""
+    pattern = _end_tag_patterns.get(name)
+    if pattern is None:
+        pattern = re.compile(rf"</{re.escape(name)}[ \t\n\r\f]*>", re.IGNORECASE)
+        _end_tag_patterns[name] = pattern
+    match = pattern.search(text, start)
+    return match.end() if match else len(text)
+
+
+class _Finder:
+    """위치가 증가하는 방향으로 같은 패턴을 반복 검색할 때 이전 결과를 재사용한다.
+
+    '<'마다 뒤쪽을 끝까지 검색하면 "<!<!<!..."처럼 닫히지 않는 입력에서
+    제곱 시간이 걸리므로, 아직 지나치지 않은 이전 검색 결과를 그대로 돌려준다.
+    """
+
+    def __init__(self, text: str, pattern: re.Pattern) -> None:
+        self._text = text
+        self._pattern = pattern
+        self._searched_from = -1
+        self._match: re.Match | None = None
+
+    def search(self, pos: int) -> re.Match | None:
+        """pos 이후 첫 번째 매치를 반환한다."""
+        if (
+            self._searched_from < 0
+            or self._searched_from > pos
+            or (self._match is not None and self._match.start() < pos)
+        ):
+            self._match = self._pattern.search(self._text, pos)
+            self._searched_from = pos
+        return self._match
+
+
+class _Scanner:
+    """sanitize 한 번 동안 사용하는 검색 상태."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._tag_close = _Finder(text, _TAG_CLOSE)
+        self._comment_end = _Finder(text, _COMMENT_END)
+
+    def can_close(self, pos: int) -> bool:
+        """pos 이후에 '>'가 있는지 (없으면 더 이상 태그가 닫힐 수 없다)."""
+        return self._tag_close.search(pos) is not None
+
+    def skip_markup(self, start: int) -> int:
+        """text[start]의 '<'가 주석/선언/처리 지시문/잘못된 닫는 태그로 시작하면 끝 위치를 반환한다.
+
+        브라우저는 이 구간을 태그로 해석하지 않는다 (주석은 `-->`, 나머지는 `>`까지).
+
+        Returns:
+            구간 끝 위치. 해당하지 않거나 닫히지 않았으면 -1.
+        """
+        text = self.text
+        if text.startswith("<!--", start):
+            if text.startswith((">", "->"), start + 4):
+                return text.index(">", start + 4) + 1
+            match = self._comment_end.search(start + 4)
+            return match.end() if match else -1
+        next_char = text[start + 1:start + 2]
+        if next_char in ("!", "?") or (next_char == "/" and _TAG_NAME.match(text, start + 2) is None):
+            match = self._tag_close.search(start + 2)
+            return match.end() if match else -1
+        return -1
+
+
+def _strip_js_scheme(value: str) -> str:
+    """`javascript:`를 모두 제거한다 (제거 후 새로 생기는 경우 포함)."""
+    value = _JS_SCHEME.sub("", value)
+    if _JS_SCHEME.search(value) is None:
+        return value
+
+    # "javajavascript:script:"처럼 제거 후 다시 생기는 입력: 스택으로 선형 제거
+    size = len(_JS_SCHEME_TEXT)
+    stack: list[str] = []
+    for char in value:
+        stack.append(char)
+        if char == ":" and len(stack) >= size and "".join(stack[-size:]).lower() == _JS_SCHEME_TEXT:
+            del stack[-size:]
+    return "".join(stack)
+
+
+def _format_tag(tag: _Tag, attrs: list[tuple[str, str]]) -> str:
+    """태그를 문자열로 다시 조립한다."""
+    if tag.closing:
+        return f"</{tag.name}>"
+    parts = [tag.name]
+    for attr, value in attrs:
+        parts.append(f'{attr}="{html.escape(value, quote=True)}"')
+    return f"<{' '.join(parts)}{' /' if tag.self_closing else ''}>"
+
+
+def sanitize_markdown(content: str) -> str:
+    """저장용 Markdown 원문에서 위험한 HTML을 제거한다.
+
+    - `javascript:` 제거 (제거 후 새로 생기는 경우 포함)
+    - <script> 요소를 내용까지 제거 (닫히지 않으면 끝까지)
+    - 태그의 on* 이벤트 핸들러 속성 제거
+
+    남는 태그와 텍스트는 원문 그대로 두며, 제거한 구간 양쪽이 이어 붙어
+    새 태그나 `javascript:`가 만들어지지 않도록 필요하면 공백 하나를 남긴다.
+
+    Args:
+        content: 원본 콘텐츠.
+
+    Returns:
+        sanitize된 콘텐츠.
+    """
+    content = _strip_js_scheme(content)
+    scanner = _Scanner(content)
+    out: list[str] = []
+    n = len(content)
+    pos = 0  # 출력에 반영된 위치
+    scan = 0  # 다음 '<'를 찾을 위치
+    while True:
+        lt = content.find("<", scan)
+        if lt < 0 or not scanner.can_close(lt):
+            break
+        markup_end = scanner.skip_markup(lt)
+        if markup_end >= 0:
+            scan = markup_end
+            continue
+        tag = _parse_tag(content, lt)
+        if tag is None:
+            scan = lt + 1
+            continue
+        if tag is _UNTERMINATED:
+            break
+
+        if tag.name == "script":
+            end = tag.end if tag.closing else _find_end_tag(content, "script", tag.end)
+            out.append(content[pos:lt])
+            if 0 < lt and end < n and not content[lt - 1].isspace() and not content[end].isspace():
+                out.append(" ")
+            pos = scan = end
+            continue
+
+        for attr in tag.attrs:
+            if attr.name.startswith("on"):
+                # 앞의 공백은 남겨 양쪽 속성이 붙지 않게 한다
+                out.append(content[pos:attr.start])
+                pos = attr.end
+        scan = tag.end
+
+    out.append(content[pos:])
+    return "".join(out)
+
+
+def _is_safe_url(value: str) -> bool:
+    """URL 속성 값이 허용된 스킴(또는 상대 경로)인지 확인한다."""
+    url = _URL_STRIP.sub("", html.unescape(value))
+    colon = url.find(":")
+    if colon < 0:
+        return True
+    # ':' 앞에 경로/쿼리/프래그먼트 구분자가 있으면 상대 경로
+    if any(sep in url[:colon] for sep in "/?#"):
+        return True
+    return url[:colon].lower() in _SAFE_SCHEMES
+
+
+def _allowed_attrs(tag: _Tag) -> list[tuple[str, str]]:
+    """허용 목록에 있는 속성만 남긴다."""
+    allowed = _ALLOWED_ATTRS.get(tag.name)
+    if not allowed:
+        return []
+    attrs = []
+    for attr, value, _, _ in tag.attrs:
+        if attr not in allowed or value is None:
+            continue
+        value = html.unescape(value)
+        if attr in _URL_ATTRS and not _is_safe_url(value):
+            continue
+        if attr == "class":
+            value = " ".join(c for c in value.split() if _LANGUAGE_CLASS.fullmatch(c))
+            if not value:
+                continue
+        if attr == "style" and _TEXT_ALIGN_STYLE.fullmatch(value) is None:
+            # 표 정렬(text-align)만 허용
+            continue
+        attrs.append((attr, value))
+    if tag.name == "a" and any(attr == "href" for attr, _ in attrs):
+        attrs.append(("rel", "nofollow noopener noreferrer"))
+    return attrs
+
+
+def sanitize_html(content: str) -> str:
+    """렌더링된 HTML을 허용 목록 기준으로 정리한다.
+
+    허용되지 않은 태그는 태그만 제거하고 내용은 남기며, script/style 등
+    _DROP_CONTENT_TAGS는 내용까지 제거한다. 주석과 선언(<!...>, <?...>)은 제거하고
+    태그가 아닌 '<'는 `&lt;`로 바꾼다.
+
+    Args:
+        content: HTML 문자열.
+
+    Returns:
+        안전한 HTML 문자열.
+    """
+    scanner = _Scanner(content)
+    out: list[str] = []
+    n = len(content)
+    pos = 0
+    while pos < n:
+        lt = content.find("<", pos)
+        if lt < 0:
+            out.append(content[pos:])
+            break
+        out.append(content[pos:lt])
+        if not scanner.can_close(lt):
+            out.append(html.escape(content[lt:], quote=False))
+            break
+
+        markup_end = scanner.skip_markup(lt)
+        if markup_end >= 0:
+            pos = markup_end
+            continue
+
+        tag = _parse_tag(content, lt)
+        if tag is None:
+            out.append("&lt;")
+            pos = lt + 1
+            continue
+        if tag is _UNTERMINATED:
+            out.append(html.escape(content[lt:], quote=False))
+            break
+        pos = tag.end
+        if tag.name in _DROP_CONTENT_TAGS:
+            if not tag.closing and not tag.self_closing:
+                pos = _find_end_tag(content, tag.name, tag.end)
+            continue
+        if tag.name in _ALLOWED_TAGS:
+            out.append(_format_tag(tag, [] if tag.closing else _allowed_attrs(tag)))
+
+    return "".join(out)
+
+
+def render_markdown(content: str) -> str:
+    """Markdown을 안전한 HTML로 렌더링한다.
+
+    Args:
+        content: Markdown 원문.
+
+    Returns:
+        sanitize된 HTML 문자열.
+    """
+    return sanitize_html(_markdown.render(content))
@@ -1,11 +1,18 @@
 """보안 관련 유틸리티 모듈.
 
 비밀번호 해싱, JWT 토큰 생성/검증 기능을 제공한다.
+검증된 토큰의 claims는 토큰 digest 기준 LRU 캐시에 보관하여
+폴링 요청마다 서명 검증을 반복하지 않는다.
 """
 
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
+import jwt as pyjwt
 from jose import JWTError, jwt
 
 from app.config import get_settings
@@ -16,7 +23,9 @@ ALGORITHM = "HS256"
 
 
 def hash_password(password: str) -> str:
-    """비밀번호를 bcrypt로 해싱한다.
+    """비밀번호를 bcrypt로 해싱한다 (동기 — 스크립트용).
+
+    API 요청 경로에서는 app.core.hashing.hash_password_async를 사용한다.
 
     Args:
         password: 평문 비밀번호.
@@ -24,7 +33,9 @@ def hash_password(password: str) -> str:
     Returns:
         해싱된 비밀번호 문자열.
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -57,6 +68,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
         expires_delta
         or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     )
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     to_encode.update({"exp": expire, "type": "access"})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
@@ -74,10 +86,19 @@ def create_refresh_token(data: dict) -> str:
     expire = datetime.now(UTC) + timedelta(
         days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
     )
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     to_encode.update({"exp": expire, "type": "refresh"})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
+def _decode_pyjwt(token: str) -> dict | None:
+    """PyJWT 백엔드로 토큰을 디코딩한다 (JWT_BACKEND=pyjwt)."""
+    try:
+        return pyjwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    except pyjwt.PyJWTError:
+        return None
+
+
 def decode_token(token: str) -> dict | None:
     """JWT 토큰을 디코딩한다.
 
@@ -87,7 +108,51 @@ def decode_token(token: str) -> dict | None:
     Returns:
         디코딩된 페이로드 딕셔너리. 실패 시 None.
     """
+    if settings.JWT_BACKEND == "pyjwt":
+        return _decode_pyjwt(token)
     try:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
+
+
+_token_cache: OrderedDict[bytes, dict] = OrderedDict()
+
+
+def decode_token_cached(token: str) -> dict | None:
+    """검증된 토큰 claims를 LRU 캐시에서 조회하고, 없으면 디코딩 후 저장한다.
+
+    캐시 키는 토큰 원문이 아닌 SHA-256 digest이며, `exp`가 지난 항목은
+    조회 시점에 폐기한다. 검증에 실패한 토큰은 캐시하지 않는다.
+    반환된 딕셔너리는 캐시와 공유되므로 수정하면 안 된다.
+
+    Args:
+        token: JWT 토큰 문자열.
+
+    Returns:
+        디코딩된 페이로드 딕셔너리. 실패 시 None.
+    """
+    if settings.JWT_CACHE_SIZE <= 0:
+        return decode_token(token)
+
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            _token_cache.move_to_end(key)
+            return payload
+        del _token_cache[key]
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+
+    _token_cache[key] = payload
+    if len(_token_cache) > settings.JWT_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return payload
+
+
+def clear_token_cache() -> None:
+    """토큰 claims 캐시를 비운다."""
+    _token_cache.clear()
@@ -0,0 +1,266 @@
+"""Redis 기반 리프레시 토큰 패밀리 저장소.
+
+로그인마다 하나의 토큰 패밀리(세션)를 만들고, 패밀리별로 현재 유효한
+리프레시 토큰 jti 하나만 Redis에 보관한다.
+
+- 회전: 리프레시 시 저장된 jti와 일치하면 새 jti로 교체한다.
+- 재사용 탐지: 이미 교체된 jti가 다시 제출되면 패밀리 전체를 폐기한다.
+- 폐기 확인: 폐기된 패밀리/jti는 `revoked:tokens` Sorted Set(score=만료 시각)에
+  기록되고, 각 워커는 이를 메모리 내 bloom filter로 동기화하여
+  요청마다 네트워크 왕복 없이 검사한다. bloom filter 양성일 때만 Redis로 확인한다.
+
+REDIS_URL이 없으면 기존처럼 상태 없는(stateless) 토큰으로 동작한다.
+REDIS_URL이 설정되었는데 Redis에 접근할 수 없으면 세션을 기록/회전/폐기할 수 없으므로
+로그인/갱신/로그아웃은 503으로 실패한다 (추적되지 않는 토큰을 발급하지 않는다).
+폐기 여부 확인은 bloom filter로 계속 동작한다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+from app.core.exceptions import ServiceUnavailableException
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+REVOKED_KEY = "revoked:tokens"
+
+# 회전 결과 코드
+ROTATED = 1
+FAMILY_MISSING = 0
+REUSE_DETECTED = -1
+
+# KEYS[1]=패밀리 키, KEYS[2]=폐기 Sorted Set
+# ARGV[1]=제출된 jti, ARGV[2]=새 jti, ARGV[3]=TTL(초), ARGV[4]=패밀리 ID, ARGV[5]=폐기 만료 시각
+_ROTATE_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'jti')
+if not current then
+  return 0
+end
+if current ~= ARGV[1] then
+  redis.call('DEL', KEYS[1])
+  redis.call('ZADD', KEYS[2], ARGV[5], ARGV[4])
+  return -1
+end
+redis.call('HSET', KEYS[1], 'jti', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+_rotate_script = None
+
+
+def _family_key(family_id: str) -> str:
+    """토큰 패밀리 Redis 키를 반환한다."""
+    return f"rt:family:{family_id}"
+
+
+def _unavailable(action: str) -> ServiceUnavailableException:
+    """Redis 장애를 기록하고 503 예외를 만든다."""
+    logger.exception("세션 저장소(Redis) 오류: %s", action)
+    return ServiceUnavailableException("세션 저장소를 사용할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+
+def _refresh_ttl_seconds() -> int:
+    """리프레시 토큰 수명(초)을 반환한다."""
+    return settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 기반 bloom filter."""
+
+    def __init__(self, size_bits: int, num_hashes: int) -> None:
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        """항목의 비트 위치들을 생성한다 (double hashing)."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, item: str) -> None:
+        """항목을 추가한다."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationFilter:
+    """Redis의 폐기 목록을 주기적으로 동기화하는 워커 로컬 필터."""
+
+    def __init__(self) -> None:
+        self._bloom = BloomFilter(
+            settings.REVOCATION_BLOOM_BITS, settings.REVOCATION_BLOOM_HASHES
+        )
+        self._synced_at = 0.0
+        self._sync_task: asyncio.Task | None = None
+
+    async def sync(self) -> None:
+        """Redis에서 아직 유효한 폐기 항목을 읽어 bloom filter를 재구성한다."""
+        redis = get_redis_client()
+        if redis is None:
+            return
+        now = time.time()
+        try:
+            pipe = redis.pipeline()
+            pipe.zremrangebyscore(REVOKED_KEY, "-inf", now)
+            pipe.zrangebyscore(REVOKED_KEY, now, "+inf")
+            _, members = await pipe.execute()
+        except RedisError:
+            logger.warning("폐기 토큰 목록 동기화 실패")
+            return
+
+        bloom = BloomFilter(settings.REVOCATION_BLOOM_BITS, settings.REVOCATION_BLOOM_HASHES)
+        for member in members:
+            bloom.add(member)
+        self._bloom = bloom
+        self._synced_at = time.monotonic()
+
+    def schedule_sync(self) -> None:
+        """동기화 주기가 지났으면 백그라운드에서 동기화를 시작한다."""
+        if time.monotonic() - self._synced_at < settings.REVOCATION_SYNC_SECONDS:
+            return
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        self._sync_task = asyncio.get_running_loop().create_task(self.sync())
+
+    def add_local(self, item: str) -> None:
+        """현재 워커에 폐기 항목을 즉시 반영한다."""
+        self._bloom.add(item)
+
+    def might_be_revoked(self, *items: str | None) -> bool:
+        """항목 중 하나라도 폐기되었을 가능성이 있으면 True를 반환한다."""
+        return any(item is not None and item in self._bloom for item in items)
+
+
+revocation_filter = RevocationFilter()
+
+
+async def start_family(family_id: str, user_id: int, jti: str) -> None:
+    """새 토큰 패밀리를 등록한다.
+
+    Args:
+        family_id: 패밀리 ID.
+        user_id: 유저 ID.
+        jti: 최초 리프레시 토큰 jti.
+
+    Raises:
+        ServiceUnavailableException: Redis에 접근할 수 없을 때.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+    key = _family_key(family_id)
+    try:
+        pipe = redis.pipeline()
+        pipe.hset(key, mapping={"user_id": user_id, "jti": jti})
+        pipe.expire(key, _refresh_ttl_seconds())
+        await pipe.execute()
+    except RedisError as exc:
+        raise _unavailable("패밀리 등록") from exc
+
+
+async def rotate(family_id: str, presented_jti: str, new_jti: str) -> int:
+    """리프레시 토큰을 원자적으로 회전한다.
+
+    Args:
+        family_id: 패밀리 ID.
+        presented_jti: 제출된 리프레시 토큰 jti.
+        new_jti: 새로 발급할 리프레시 토큰 jti.
+
+    Returns:
+        ROTATED, FAMILY_MISSING, REUSE_DETECTED 중 하나.
+        Redis를 사용하지 않으면 항상 ROTATED.
+
+    Raises:
+        ServiceUnavailableException: Redis에 접근할 수 없을 때.
+    """
+    global _rotate_script
+    redis = get_redis_client()
+    if redis is None:
+        return ROTATED
+    if _rotate_script is None:
+        _rotate_script = redis.register_script(_ROTATE_SCRIPT)
+
+    revoke_until = time.time() + _refresh_ttl_seconds()
+    try:
+        result = int(
+            await _rotate_script(
+                keys=[_family_key(family_id), REVOKED_KEY],
+                args=[presented_jti, new_jti, _refresh_ttl_seconds(), family_id, revoke_until],
+            )
+        )
+    except RedisError as exc:
+        raise _unavailable("토큰 회전") from exc
+    if result == REUSE_DETECTED:
+        revocation_filter.add_local(family_id)
+        logger.warning("리프레시 토큰 재사용 탐지 — 패밀리 폐기: %s", family_id)
+    return result
+
+
+async def revoke_family(family_id: str) -> None:
+    """토큰 패밀리(세션)를 폐기한다.
+
+    Args:
+        family_id: 패밀리 ID.
+
+    Raises:
+        ServiceUnavailableException: Redis에 접근할 수 없을 때.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return
+    try:
+        pipe = redis.pipeline()
+        pipe.delete(_family_key(family_id))
+        pipe.zadd(REVOKED_KEY, {family_id: time.time() + _refresh_ttl_seconds()})
+        await pipe.execute()
+    except RedisError as exc:
+        raise _unavailable("패밀리 폐기") from exc
+    revocation_filter.add_local(family_id)
+
+
+async def is_revoked(payload: dict) -> bool:
+    """토큰이 폐기되었는지 확인한다.
+
+    bloom filter가 음성이면 네트워크 왕복 없이 False를 반환하고,
+    양성일 때만 Redis Sorted Set으로 오탐 여부를 확인한다.
+
+    Args:
+        payload: 디코딩된 토큰 페이로드.
+
+    Returns:
+        폐기되었으면 True.
+    """
+    revocation_filter.schedule_sync()
+    family_id = payload.get("fam")
+    jti = payload.get("jti")
+    if not revocation_filter.might_be_revoked(family_id, jti):
+        return False
+
+    redis = get_redis_client()
+    if redis is None:
+        return False
+    try:
+        pipe = redis.pipeline()
+        for item in (family_id, jti):
+            if item is not None:
+                pipe.zscore(REVOKED_KEY, item)
+        scores = await pipe.execute()
+    except RedisError:
+        # Redis 장애 시에는 bloom filter 결과를 그대로 신뢰한다
+        return True
+    return any(score is not None and score > time.time() for score in scores)
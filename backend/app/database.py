@@ -1,46 +1,155 @@
 """데이터베이스 연결 및 세션 관리 모듈.
 
 async SQLAlchemy 엔진과 세션 팩토리를 제공한다.
+
+워크로드별로 커넥션 풀을 분리한다.
+- write: API 요청의 OLTP 쓰기/일반 조회 (get_db)
+- read: 캐시되지 않는 읽기 전용 조회 (get_read_db). 지금은 Write-up 상세와 공개 프로필.
+  DATABASE_READ_URL이 있으면 읽기 복제본에 연결한다. 스코어보드/대시보드/목록/검색은
+  커밋 후 버전을 올리는 캐시를 채우므로 복제본 지연을 피해 write 풀에서 읽고,
+  읽기 부하는 그 캐시가 흡수한다.
+- background: Celery 태스크, WebSocket 등 요청 밖의 작업
+
+느린 백그라운드 작업이나 읽기 폭주가 쓰기 요청의 커넥션을 점유하지 않게 한다.
+풀마다 커넥션 대기 시간과 사용률을 기록한다 (get_pool_metrics).
+
+Prepared statement
+- 직접 연결: 커넥션마다 DB_PREPARED_STATEMENT_CACHE_SIZE개의 prepared statement를
+  재사용해 같은 SQL의 파싱/계획 비용을 아낀다.
+- 풀러(PgBouncer, URL에 "pooler" 포함): 서버 커넥션이 트랜잭션마다 바뀌므로
+  DB_POOLER_PREPARED_STATEMENTS가 꺼져 있으면 캐시를 끄고, 켜져 있으면
+  (PgBouncer 1.21+ 프로토콜 수준 prepared statement) 캐시를 유지한다.
+  두 경우 모두 서버 커넥션 간 이름 충돌을 막기 위해 문장 이름을 UUID로 만든다.
+SQLAlchemy 컴파일 캐시(DB_QUERY_CACHE_SIZE)는 모드와 무관하게 SQL 문자열 생성을 건너뛴다.
 """
 
 import ssl as _ssl
+import time
+import uuid
 from collections.abc import AsyncGenerator
 
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
 
 settings = get_settings()
 
 # Neon PostgreSQL 등 외부 관리형 DB는 SSL 필수
-_connect_args: dict = {}
 _is_managed_db = "neon.tech" in settings.async_database_url or settings.is_production
-if _is_managed_db:
-    _connect_args["ssl"] = _ssl.create_default_context()
 
-# Neon Pooler(PgBouncer) 사용 시 prepared statement 비활성화
-_connect_args.setdefault("statement_cache_size", 0) if "pooler" in settings.async_database_url else None
 
-engine = create_async_engine(
+class _PoolStats:
+    """커넥션 checkout 대기 시간 누적 통계."""
+
+    __slots__ = ("checkouts", "timeouts", "wait_total", "wait_max")
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """checkout 대기 시간과 타임아웃 횟수를 기록하는 커넥션 풀."""
+
+    def _do_get(self):
+        stats = self.__dict__.setdefault("_stats", _PoolStats())
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            stats.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        stats.checkouts += 1
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+        return connection
+
+
+def _prepared_statement_name() -> str:
+    """풀러 뒤의 서버 커넥션끼리 겹치지 않는 prepared statement 이름을 만든다."""
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def _connect_args(url: str) -> dict:
+    connect_args: dict = {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+    if _is_managed_db:
+        connect_args["ssl"] = _ssl.create_default_context()
+    if "pooler" in url:
+        # Neon Pooler(PgBouncer) 트랜잭션 풀링
+        connect_args["prepared_statement_name_func"] = _prepared_statement_name
+        if not settings.DB_POOLER_PREPARED_STATEMENTS:
+            # 프로토콜 수준 prepared statement를 지원하지 않는 풀러: 캐시 비활성화
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+    return connect_args
+
+
+def _create_engine(url: str, pool_size: int | None, max_overflow: int | None) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        poolclass=MeteredQueuePool,
+        pool_pre_ping=True,
+        pool_size=pool_size if pool_size is not None else (3 if _is_managed_db else 10),
+        max_overflow=max_overflow if max_overflow is not None else (5 if _is_managed_db else 20),
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args=_connect_args(url),
+    )
+
+
+engine = _create_engine(
+    settings.async_database_url, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+)
+read_engine = _create_engine(
+    settings.async_read_database_url or settings.async_database_url,
+    settings.DB_READ_POOL_SIZE,
+    settings.DB_READ_MAX_OVERFLOW,
+)
+background_engine = _create_engine(
     settings.async_database_url,
-    echo=not settings.is_production,
-    pool_pre_ping=True,
-    pool_size=3 if _is_managed_db else 10,
-    max_overflow=5 if _is_managed_db else 20,
-    connect_args=_connect_args,
+    settings.DB_BACKGROUND_POOL_SIZE,
+    settings.DB_BACKGROUND_MAX_OVERFLOW,
 )
 
+ENGINES: dict[str, AsyncEngine] = {
+    "write": engine,
+    "read": read_engine,
+    "background": background_engine,
+}
+
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+read_session_factory = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Celery 태스크와 WebSocket 핸들러용
+background_session_factory = async_sessionmaker(
+    background_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     """모든 SQLAlchemy 모델의 기본 클래스."""
@@ -61,3 +170,41 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 DB 세션을 제공하는 의존성 함수.
+
+    복제본일 수 있으므로 커밋하지 않으며, 세션 종료 시 트랜잭션을 롤백한다.
+
+    Yields:
+        AsyncSession: 읽기 풀의 데이터베이스 세션.
+    """
+    async with read_session_factory() as session:
+        yield session
+
+
+def get_pool_metrics() -> dict[str, dict]:
+    """풀별 사용률과 checkout 대기 시간 지표를 반환한다 (현재 워커 프로세스 기준)."""
+    metrics = {}
+    for name, pool_engine in ENGINES.items():
+        pool = pool_engine.pool
+        stats = getattr(pool, "_stats", None) or _PoolStats()
+        # max_overflow가 음수면 오버플로 무제한 (사용률 계산 불가)
+        capacity = pool.size() + pool._max_overflow if pool._max_overflow >= 0 else 0
+        checked_out = pool.checkedout()
+        metrics[name] = {
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": checked_out,
+            "idle": pool.checkedin(),
+            "saturation": round(checked_out / capacity, 3) if capacity > 0 else None,
+            "checkouts": stats.checkouts,
+            "timeouts": stats.timeouts,
+            "wait_avg_ms": round(stats.wait_total / stats.checkouts * 1000, 3)
+            if stats.checkouts
+            else 0.0,
+            "wait_max_ms": round(stats.wait_max * 1000, 3),
+            "compiled_cache_entries": len(pool_engine.sync_engine._compiled_cache or ()),
+        }
+    return metrics
@@ -8,6 +8,7 @@ from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.admin import router as admin_router
 from app.api.v1.auth import router as auth_router
@@ -17,11 +18,52 @@ from app.api.v1.scoreboards import router as scoreboards_router
 from app.api.v1.users import router as users_router
 from app.api.v1.writeups import router as writeups_router
 from app.api.v1.notifications import router as notifications_router
+from app.api.v1.websocket_notifications import router as ws_notifications_router
 from app.config import get_settings
+from app.core import hashing, token_store
+from app.core.http_cache import CacheRule, HTTPCacheMiddleware
+from app.core.response_cache import version_key
+from app.services import catalog_service, scoring_service, writeup_service
 
 settings = get_settings()
 
 
+def _catalog_versions(user_id: int | None) -> list[str]:
+    keys = [catalog_service.VERSION_KEY]
+    if user_id is not None:
+        keys.append(catalog_service.solved_version_key(user_id))
+    return keys
+
+
+# 조건부 요청(ETag/304)과 CDN 캐시 헤더를 적용할 공개 GET 엔드포인트
+HTTP_CACHE_RULES = [
+    CacheRule(
+        "challenges",
+        r"/api/v1/challenges(/search)?",
+        _catalog_versions,
+        per_user=True,
+        bucket_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+    ),
+    CacheRule(
+        "challenge",
+        r"/api/v1/challenges/\d+",
+        lambda _: [catalog_service.VERSION_KEY],
+        bucket_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+    ),
+    CacheRule(
+        "scoreboard",
+        r"/api/v1/scoreboards",
+        lambda _: [version_key(scoring_service.SCOREBOARD_CACHE)],
+    ),
+    # 상세 조회는 비공개 Write-up도 반환하므로 공개 캐시 대상에서 제외한다
+    CacheRule(
+        "writeups",
+        r"/api/v1/writeups(/search)?",
+        lambda _: [version_key(writeup_service.WRITEUP_CACHE)],
+    ),
+]
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """앱 시작/종료 시 실행되는 라이프사이클 핸들러.
@@ -30,8 +72,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app: FastAPI 앱 인스턴스.
     """
     # 시작 시
+    await token_store.revocation_filter.sync()
     yield
     # 종료 시
+    hashing.shutdown()
 
 
 app = FastAPI(
@@ -41,9 +85,13 @@ app = FastAPI(
     docs_url="/api/v1/docs" if not settings.is_production else None,
     redoc_url="/api/v1/redoc" if not settings.is_production else None,
     openapi_url="/api/v1/openapi.json" if not settings.is_production else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
+# 조건부 요청 처리 (CORS 헤더가 304 응답에도 붙도록 CORS 안쪽에 둔다)
+app.add_middleware(HTTPCacheMiddleware, rules=HTTP_CACHE_RULES)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -62,6 +110,7 @@ app.include_router(community_router, prefix="/api/v1")
 app.include_router(writeups_router, prefix="/api/v1")
 app.include_router(notifications_router, prefix="/api/v1")
 app.include_router(admin_router, prefix="/api/v1")
+app.include_router(ws_notifications_router)
 
 # Docker 의존 라우터 (DOCKER_ENABLED일 때만 등록)
 if settings.DOCKER_ENABLED:
@@ -6,8 +6,24 @@
 from app.models.user import User
 from app.models.challenge import Challenge
 from app.models.submission import Submission
+from app.models.solve import Solve
 from app.models.container_instance import ContainerInstance
-from app.models.writeup import Writeup
-from app.models.notification import Notification
+from app.models.writeup import Writeup, WriteupVote
+from app.models.notification import (
+    BroadcastNotification,
+    Notification,
+    NotificationReadCursor,
+)
 
-__all__ = ["User", "Challenge", "Submission", "ContainerInstance", "Writeup", "Notification"]
+__all__ = [
+    "User",
+    "Challenge",
+    "Submission",
+    "Solve",
+    "ContainerInstance",
+    "Writeup",
+    "WriteupVote",
+    "Notification",
+    "BroadcastNotification",
+    "NotificationReadCursor",
+]
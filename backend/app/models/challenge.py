@@ -2,12 +2,31 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+# 전문 검색 생성 컬럼 식 (제목 A, 태그 B, 설명 C 가중치). 마이그레이션 007의 식과 같아야 한다.
+# array_to_string은 STABLE이라 생성 컬럼에 쓸 수 없으므로 007이 만든 IMMUTABLE 래퍼를 쓴다
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', "
+    "coalesce(immutable_array_to_string(tags::text[], ' '), '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+
 
 class Challenge(Base):
     """챌린지 테이블 모델."""
@@ -73,7 +92,23 @@ class Challenge(Base):
         onupdate=lambda: datetime.now(UTC),
     )
 
+    # 전문 검색용 생성 컬럼 (제목 A, 태그 B, 설명 C 가중치). 조회 시 로드하지 않는다
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
+
     # Relationships
     submissions: Mapped[list["Submission"]] = relationship(
         "Submission", back_populates="challenge", lazy="select"
     )
+
+
+# 전문 검색 (search_vector @@ tsquery)
+Index("ix_challenges_search_vector", Challenge.search_vector, postgresql_using="gin")
+# 제목 유사도 검색 (title %> 검색어)
+Index(
+    "ix_challenges_title_trgm",
+    Challenge.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
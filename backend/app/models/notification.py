@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -15,7 +15,7 @@ class Notification(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     type: Mapped[str] = mapped_column(
         String(30), nullable=False
@@ -23,7 +23,55 @@ class Notification(Base):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     challenge_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    is_read: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
+
+
+# 목록 조회 (user_id = ? ORDER BY created_at DESC)
+Index(
+    "ix_notifications_user_created",
+    Notification.user_id,
+    Notification.created_at.desc(),
+)
+# 미읽음 목록/카운트 (user_id = ? AND is_read = false ORDER BY created_at DESC)
+Index(
+    "ix_notifications_user_read_created",
+    Notification.user_id,
+    Notification.is_read,
+    Notification.created_at.desc(),
+)
+
+
+class BroadcastNotification(Base):
+    """전체 유저 대상 알림 테이블 모델.
+
+    유저마다 행을 만들지 않고 한 행만 저장한다 (fan-out-on-read).
+    읽음 여부는 NotificationReadCursor로 판단한다.
+    """
+
+    __tablename__ = "broadcast_notifications"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    type: Mapped[str] = mapped_column(String(30), nullable=False)  # new_challenge
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    challenge_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
+
+
+class NotificationReadCursor(Base):
+    """유저별 브로드캐스트 알림 읽음 커서 테이블 모델.
+
+    last_read_broadcast_id 이하의 브로드캐스트는 읽은 것으로 본다.
+    """
+
+    __tablename__ = "notification_read_cursors"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_read_broadcast_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,40 @@
+"""풀이 모델 모듈."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class Solve(Base):
+    """풀이 테이블 모델 (유저당 챌린지 하나에 한 번).
+
+    정답 제출만 담는 좁은 테이블로, 풀이 여부/점수/대시보드 조회는 여기서 읽는다.
+    submissions는 정답/오답 시도를 모두 기록하는 로그로만 사용한다.
+    """
+
+    __tablename__ = "solves"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    challenge_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("challenges.id", ondelete="CASCADE"), primary_key=True
+    )
+    points_awarded: Mapped[int] = mapped_column(Integer, nullable=False)
+    solved_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+
+# 유저별 풀이 시각순 조회 (최근 활동, 스트릭, 히트맵)
+Index(
+    "ix_solves_user_solved_at",
+    Solve.user_id,
+    Solve.solved_at,
+    postgresql_include=["challenge_id"],
+)
+# 챌린지별 풀이 순서 (최초 풀이자, 카테고리 집계)
+Index("ix_solves_challenge_solved_at", Solve.challenge_id, Solve.solved_at)
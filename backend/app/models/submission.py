@@ -9,9 +9,15 @@ from app.database import Base
 
 
 class Submission(Base):
-    """플래그 제출 테이블 모델."""
+    """플래그 제출 테이블 모델 (정답/오답 시도 로그).
+
+    풀이 여부와 점수는 solves 테이블에서 읽는다.
+    submitted_at 기준 월별 범위 파티션 테이블이며 (partition_service),
+    파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, submitted_at)이다.
+    """
 
     __tablename__ = "submissions"
+    __table_args__ = {"postgresql_partition_by": "RANGE (submitted_at)"}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -26,7 +32,7 @@ class Submission(Base):
     submitted_flag: Mapped[str] = mapped_column(String(500), nullable=False)
     is_correct: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     submitted_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+        DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(UTC)
     )
 
     # Relationships
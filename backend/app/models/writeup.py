@@ -2,11 +2,16 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, Integer, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
+# 전문 검색 생성 컬럼 식. 마이그레이션 007의 식과 같아야 한다
+# (tsvector 최대 크기를 넘지 않도록 본문 앞부분만 색인)
+SEARCH_VECTOR_SQL = "to_tsvector('simple', left(content, 100000))"
+
 
 class Writeup(Base):
     """Write-up 테이블 모델."""
@@ -21,8 +26,12 @@ class Writeup(Base):
         Integer, ForeignKey("challenges.id"), nullable=False, index=True
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # 저장 시 렌더링해 둔 sanitize된 HTML (조회 시 Markdown 렌더링 생략)
+    content_html: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_public: Mapped[bool] = mapped_column(Boolean, default=True)
     upvotes: Mapped[int] = mapped_column(Integer, default=0)
+    # writeup_votes 도입(005) 전에 투표자 기록 없이 쌓인 추천 수 (upvotes 재계산 기준값)
+    legacy_upvotes: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
@@ -32,6 +41,52 @@ class Writeup(Base):
         onupdate=lambda: datetime.now(UTC),
     )
 
-    # Relationships
-    user: Mapped["User"] = relationship("User", lazy="selectin")
-    challenge: Mapped["Challenge"] = relationship("Challenge", lazy="selectin")
+    # 전문 검색용 생성 컬럼
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
+
+    # Relationships (응답은 projection 쿼리로 만들므로 암묵적 로딩을 막는다)
+    user: Mapped["User"] = relationship("User", lazy="raise")
+    challenge: Mapped["Challenge"] = relationship("Challenge", lazy="raise")
+
+
+class WriteupVote(Base):
+    """Write-up 추천 테이블 모델 (유저당 Write-up 하나에 한 번)."""
+
+    __tablename__ = "writeup_votes"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    writeup_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("writeups.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+
+# 공개 Write-up keyset 페이지네이션 (newest/oldest, most_upvoted, 챌린지별)
+Index(
+    "ix_writeups_public_created",
+    Writeup.created_at,
+    Writeup.id,
+    postgresql_where=text("is_public"),
+)
+Index(
+    "ix_writeups_public_upvotes",
+    Writeup.upvotes,
+    Writeup.created_at,
+    Writeup.id,
+    postgresql_where=text("is_public"),
+)
+Index(
+    "ix_writeups_public_challenge_created",
+    Writeup.challenge_id,
+    Writeup.created_at,
+    Writeup.id,
+    postgresql_where=text("is_public"),
+)
+# 본문 전문 검색
+Index("ix_writeups_search_vector", Writeup.search_vector, postgresql_using="gin")
@@ -114,14 +114,44 @@ class ChallengeAdminResponse(ChallengeResponse):
     updated_at: datetime
 
 
+class ChallengeSummary(BaseModel):
+    """챌린지 목록 카드 스키마 (본문/힌트/파일 제외).
+
+    목록 조회는 이 필드의 컬럼만 SELECT하고, DB 값은 신뢰할 수 있으므로
+    model_construct로 검증 없이 만든다.
+    """
+
+    id: int
+    title: str
+    category: str
+    difficulty: int
+    points: int
+    is_dynamic: bool
+    tags: list[str] | None = None
+    solve_count: int
+    is_active: bool
+    author_id: int | None = None
+    created_at: datetime
+    is_solved: bool = False
+
+    model_config = {"from_attributes": True}
+
+
 class ChallengeListResponse(BaseModel):
     """챌린지 목록 응답 스키마 (커서 기반 페이지네이션)."""
 
-    items: list[ChallengeResponse]
+    items: list[ChallengeSummary]
     next_cursor: int | None = None
     total: int
 
 
+class ChallengeSearchResponse(BaseModel):
+    """챌린지 검색 응답 스키마 (관련도 순)."""
+
+    items: list[ChallengeSummary]
+    next_cursor: str | None = None
+
+
 # === 커뮤니티 출제 스키마 ===
 
 
@@ -171,3 +201,13 @@ class CommunitySubmissionResponse(ChallengeResponse):
     review_status: str
     review_comment: str | None = None
     reviewed_at: datetime | None = None
+
+
+class CommunitySubmissionSummary(ChallengeSummary):
+    """커뮤니티 챌린지 목록 스키마 (심사 상태 포함, 힌트/파일 제외)."""
+
+    description: str
+    source: str
+    review_status: str
+    review_comment: str | None = None
+    reviewed_at: datetime | None = None
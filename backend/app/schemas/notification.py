@@ -15,6 +15,7 @@ class NotificationResponse(BaseModel):
     challenge_id: int | None
     is_read: bool
     created_at: datetime
+    broadcast: bool = False  # 전체 유저 대상 알림 여부 (읽음 처리 엔드포인트가 다름)
 
     model_config = {"from_attributes": True}
 
@@ -4,19 +4,22 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+# 본문 최대 길이 (sanitize는 선형이지만 저장/전송 크기를 제한한다)
+WRITEUP_MAX_CHARS = 200_000
+
 
 class WriteupCreate(BaseModel):
     """Write-up 생성 요청 스키마."""
 
     challenge_id: int
-    content: str = Field(..., min_length=10)
+    content: str = Field(..., min_length=10, max_length=WRITEUP_MAX_CHARS)
     is_public: bool = True
 
 
 class WriteupUpdate(BaseModel):
     """Write-up 수정 요청 스키마."""
 
-    content: str | None = Field(default=None, min_length=10)
+    content: str | None = Field(default=None, min_length=10, max_length=WRITEUP_MAX_CHARS)
     is_public: bool | None = None
 
 
@@ -29,6 +32,22 @@ class WriteupResponse(BaseModel):
     challenge_id: int
     challenge_title: str
     content: str
+    content_html: str | None = None
+    is_public: bool
+    upvotes: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class WriteupSummary(BaseModel):
+    """Write-up 목록 항목 스키마 (본문은 앞부분만 포함)."""
+
+    id: int
+    user_id: int
+    username: str
+    challenge_id: int
+    challenge_title: str
+    excerpt: str
     is_public: bool
     upvotes: int
     created_at: datetime
@@ -38,5 +57,13 @@ class WriteupResponse(BaseModel):
 class WriteupListResponse(BaseModel):
     """Write-up 목록 응답 스키마."""
 
-    items: list[WriteupResponse]
+    items: list[WriteupSummary]
     total: int
+    next_cursor: str | None = None
+
+
+class WriteupSearchResponse(BaseModel):
+    """Write-up 검색 응답 스키마 (관련도 순)."""
+
+    items: list[WriteupSummary]
+    next_cursor: str | None = None
@@ -1,18 +1,33 @@
 """관리자 대시보드 통계 서비스.
 
 대시보드에 필요한 집계 쿼리를 최적화하여 제공한다.
+집계는 Celery beat가 ADMIN_STATS_SNAPSHOT_SECONDS마다 실행해 Redis 해시(`admin:stats`)에
+스냅샷으로 저장하고, 대시보드 조회는 스냅샷 한 번 읽기로 끝낸다.
+스냅샷은 갱신 주기의 3배가 지나면 만료되므로 beat가 멈추면 조회 시 직접 집계한다.
 """
 
+import logging
 from datetime import UTC, datetime, timedelta
 
+import orjson
+from redis.exceptions import RedisError
 from sqlalchemy import case, func, literal_column, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+from app.core.redis import get_redis_client
 from app.models.challenge import Challenge
 from app.models.container_instance import ContainerInstance
+from app.models.solve import Solve
 from app.models.submission import Submission
 from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+STATS_SNAPSHOT_KEY = "admin:stats"
+
 
 async def get_dashboard_stats(db: AsyncSession) -> dict:
     """관리자 대시보드 통계를 반환한다.
@@ -27,6 +42,8 @@ async def get_dashboard_stats(db: AsyncSession) -> dict:
     """
     now = datetime.now(UTC)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    # 제출은 월별 파티션이므로 상한도 두어 미래 달/기본 파티션을 건너뛰게 한다
+    tomorrow_start = today_start + timedelta(days=1)
 
     # 6개 카운트를 UNION ALL로 단일 쿼리로 통합
     counts_query = union_all(
@@ -42,7 +59,7 @@ async def get_dashboard_stats(db: AsyncSession) -> dict:
         select(
             literal_column("'today_submissions'"),
             func.count(Submission.id),
-        ).where(Submission.submitted_at >= today_start),
+        ).where(Submission.submitted_at >= today_start, Submission.submitted_at < tomorrow_start),
         select(
             literal_column("'pending_reviews'"),
             func.count(Challenge.id),
@@ -58,9 +75,8 @@ async def get_dashboard_stats(db: AsyncSession) -> dict:
 
     # 카테고리별 풀이 분포
     cat_result = await db.execute(
-        select(Challenge.category, func.count(Submission.id))
-        .join(Submission, Submission.challenge_id == Challenge.id)
-        .where(Submission.is_correct.is_(True))
+        select(Challenge.category, func.count(Solve.user_id))
+        .join(Solve, Solve.challenge_id == Challenge.id)
         .group_by(Challenge.category)
     )
     category_distribution = {row[0]: row[1] for row in cat_result.all()}
@@ -72,7 +88,7 @@ async def get_dashboard_stats(db: AsyncSession) -> dict:
             func.date_trunc("day", Submission.submitted_at).label("day"),
             func.count(Submission.id),
         )
-        .where(Submission.submitted_at >= week_ago)
+        .where(Submission.submitted_at >= week_ago, Submission.submitted_at < tomorrow_start)
         .group_by("day")
         .order_by("day")
     )
@@ -96,3 +112,62 @@ async def get_dashboard_stats(db: AsyncSession) -> dict:
         "category_distribution": category_distribution,
         "daily_submissions": daily_submissions,
     }
+
+
+async def _collect_stats(db: AsyncSession) -> dict:
+    """대시보드 통계를 집계하고 집계 시각을 붙인다."""
+    stats = await get_dashboard_stats(db)
+    stats["computed_at"] = datetime.now(UTC).isoformat()
+    return stats
+
+
+async def refresh_stats_snapshot(db: AsyncSession) -> dict:
+    """대시보드 통계를 집계해 Redis 스냅샷을 교체한다.
+
+    Args:
+        db: DB 세션.
+
+    Returns:
+        집계 시각(computed_at)이 포함된 통계 딕셔너리.
+    """
+    stats = await _collect_stats(db)
+
+    redis = get_redis_client()
+    if redis is None:
+        return stats
+    try:
+        pipe = redis.pipeline(transaction=True)
+        pipe.delete(STATS_SNAPSHOT_KEY)
+        pipe.hset(
+            STATS_SNAPSHOT_KEY,
+            mapping={key: orjson.dumps(value).decode() for key, value in stats.items()},
+        )
+        pipe.expire(STATS_SNAPSHOT_KEY, settings.ADMIN_STATS_SNAPSHOT_SECONDS * 3)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("관리자 통계 스냅샷 저장 실패")
+    return stats
+
+
+async def get_stats_snapshot(db: AsyncSession, *, fresh: bool = False) -> dict:
+    """관리자 대시보드 통계 스냅샷을 반환한다.
+
+    스냅샷이 없거나 fresh이면 직접 집계하고 스냅샷을 교체한다.
+    스냅샷을 읽지 못하면(Redis 장애) 저장도 실패할 것이므로 집계만 한다.
+
+    Args:
+        db: DB 세션.
+        fresh: 스냅샷을 무시하고 다시 집계할지 여부.
+
+    Returns:
+        집계 시각(computed_at)이 포함된 통계 딕셔너리.
+    """
+    redis = get_redis_client()
+    if redis is not None and not fresh:
+        try:
+            snapshot = await redis.hgetall(STATS_SNAPSHOT_KEY)
+        except RedisError:
+            return await _collect_stats(db)
+        if snapshot:
+            return {key: orjson.loads(value) for key, value in snapshot.items()}
+    return await refresh_stats_snapshot(db)
@@ -1,8 +1,10 @@
 """인증 서비스 모듈.
 
-회원가입, 로그인, 토큰 갱신 비즈니스 로직을 처리한다.
+회원가입, 로그인, 토큰 갱신, 로그아웃 비즈니스 로직을 처리한다.
+리프레시 토큰은 패밀리 단위로 회전하며, 재사용이 탐지되면 세션 전체를 폐기한다.
 """
 
+import uuid
 from datetime import UTC, datetime
 
 from sqlalchemy import select
@@ -13,12 +15,17 @@ from app.core.exceptions import (
     ConflictException,
     UnauthorizedException,
 )
+from app.core.hashing import (
+    hash_password_async,
+    needs_rehash,
+    record_rehash,
+    verify_password_async,
+)
+from app.core import token_store
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
 )
 from app.models.user import User
 
@@ -55,7 +62,7 @@ async def register(
     user = User(
         username=username,
         email=email,
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
     )
     db.add(user)
     await db.flush()
@@ -79,22 +86,53 @@ async def login(
 
     Raises:
         UnauthorizedException: 잘못된 인증 정보.
+        ServiceUnavailableException: 세션 저장소(Redis)에 접근할 수 없을 때.
     """
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not await verify_password_async(password, user.password_hash):
         raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다.")
 
+    # cost factor 설정이 바뀌었으면 평문을 알고 있는 지금 재해싱한다
+    if needs_rehash(user.password_hash):
+        user.password_hash = await hash_password_async(password)
+        record_rehash()
+
     user.last_login = datetime.now(UTC)
     await db.flush()
 
-    access_token = create_access_token({"sub": str(user.id)})
-    refresh_token = create_refresh_token({"sub": str(user.id)})
+    access_token, refresh_token = await _issue_token_pair(user.id)
 
     return user, access_token, refresh_token
 
 
+async def _issue_token_pair(
+    user_id: int, family_id: str | None = None, refresh_jti: str | None = None
+) -> tuple[str, str]:
+    """토큰 패밀리에 속한 access/refresh 토큰 쌍을 발급한다.
+
+    family_id가 없으면 새 패밀리(세션)를 시작한다.
+
+    Args:
+        user_id: 유저 ID.
+        family_id: 기존 패밀리 ID (회전 시).
+        refresh_jti: 새 리프레시 토큰 jti (회전 시 미리 등록된 값).
+
+    Returns:
+        (access_token, refresh_token) 튜플.
+    """
+    refresh_jti = refresh_jti or uuid.uuid4().hex
+    if family_id is None:
+        family_id = uuid.uuid4().hex
+        await token_store.start_family(family_id, user_id, refresh_jti)
+
+    claims = {"sub": str(user_id), "fam": family_id}
+    access_token = create_access_token(claims)
+    refresh_token = create_refresh_token({**claims, "jti": refresh_jti})
+    return access_token, refresh_token
+
+
 async def refresh_token(
     db: AsyncSession,
     token: str,
@@ -109,7 +147,8 @@ async def refresh_token(
         (new_access_token, new_refresh_token) 튜플.
 
     Raises:
-        UnauthorizedException: 유효하지 않은 리프레시 토큰.
+        UnauthorizedException: 유효하지 않거나 패밀리 정보가 없는 리프레시 토큰.
+        ServiceUnavailableException: 세션 저장소(Redis)에 접근할 수 없을 때.
     """
     payload = decode_token(token)
     if payload is None or payload.get("type") != "refresh":
@@ -119,15 +158,42 @@ async def refresh_token(
     if user_id is None:
         raise UnauthorizedException("토큰에 유저 정보가 없습니다.")
 
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
-    if not user:
+    result = await db.execute(select(User.id).where(User.id == int(user_id)))
+    if result.scalar_one_or_none() is None:
         raise UnauthorizedException("존재하지 않는 유저입니다.")
 
-    new_access = create_access_token({"sub": str(user.id)})
-    new_refresh = create_refresh_token({"sub": str(user.id)})
+    family_id = payload.get("fam")
+    presented_jti = payload.get("jti")
+    if family_id is None or presented_jti is None:
+        # 패밀리 도입 이전에 발급된 토큰은 재사용을 탐지할 수 없으므로 다시 로그인하게 한다
+        raise UnauthorizedException("만료된 세션입니다. 다시 로그인해주세요.")
+
+    new_jti = uuid.uuid4().hex
+    outcome = await token_store.rotate(family_id, presented_jti, new_jti)
+    if outcome == token_store.REUSE_DETECTED:
+        raise UnauthorizedException("이미 사용된 리프레시 토큰입니다. 다시 로그인해주세요.")
+    if outcome == token_store.FAMILY_MISSING:
+        raise UnauthorizedException("만료되었거나 폐기된 세션입니다.")
+
+    return await _issue_token_pair(int(user_id), family_id, new_jti)
+
+
+async def logout(token: str) -> None:
+    """리프레시 토큰이 속한 세션(토큰 패밀리)을 폐기한다.
+
+    Args:
+        token: 리프레시 토큰.
 
-    return new_access, new_refresh
+    Raises:
+        UnauthorizedException: 유효하지 않은 리프레시 토큰.
+        ServiceUnavailableException: 세션 저장소(Redis)에 접근할 수 없을 때.
+    """
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "refresh":
+        raise UnauthorizedException("유효하지 않은 리프레시 토큰입니다.")
+    family_id = payload.get("fam")
+    if family_id is not None:
+        await token_store.revoke_family(family_id)
 
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
@@ -0,0 +1,250 @@
+"""공개 챌린지 카탈로그 캐시 서비스 모듈.
+
+공개(활성 + 승인) 챌린지 목록 응답을 필터 조합별로 한 번만 직렬화해
+Redis에 보관하고, 요청마다 하는 일은 유저별 풀이 여부 확인만 남긴다.
+
+- `catalog:ver` 카탈로그 버전. 챌린지 행이 추가/삭제되거나 공개 목록에 보이는
+  필드가 바뀐 트랜잭션이 커밋되면 증가한다 (ORM flush 이벤트로 감지하므로
+  관리자 수정, 임포트, 파일 갱신, 검수 승인 등 모든 경로가 포함된다).
+- `catalog:{ver}:list:{hash}` 필터 조합별 목록 응답 JSON.
+  풀이 수(solve_count)와 동적 점수(points)는 풀이마다 바뀌므로 버전을 올리지 않고
+  CATALOG_CACHE_TTL_SECONDS 만큼의 지연을 허용한다.
+- `solved:{user_id}` 유저별 풀이 비트셋 (비트 위치 = 챌린지 ID).
+  0번 비트는 DB에서 한 번 채워졌음을 나타내며, 없으면 다음 조회 시 다시 채운다.
+  정답 제출이 커밋되면 해당 비트를 켜고 `solved:ver:{user_id}` 버전을 올린다
+  (로그인 유저 목록 응답의 HTTP ETag 계산용).
+
+Redis를 사용할 수 없으면 매 요청 DB에서 조회한다.
+"""
+
+import hashlib
+import logging
+import time
+from itertools import chain
+
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.core import post_commit
+from app.core.redis import get_redis_client
+from app.models.challenge import Challenge
+from app.services import challenge_service
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+VERSION_KEY = "catalog:ver"
+SOLVED_TTL_SECONDS = 86400
+_SOLVED_LOADED_BIT = 0
+
+# 커밋 후 반영할 변경: {"dirty": 카탈로그 버전 변경 여부, "solves": [(user_id, challenge_id)]}
+_CHANGES_KEY = "catalog_changes"
+
+# 풀이마다 바뀌는 필드 — 변경되어도 카탈로그 버전을 올리지 않는다 (TTL로 반영)
+_VOLATILE_FIELDS = frozenset({"solve_count", "points", "updated_at"})
+
+
+def _list_key(version: str, params: list) -> str:
+    digest = hashlib.sha256(orjson.dumps(params)).hexdigest()[:16]
+    return f"catalog:{version}:list:{digest}"
+
+
+def _solved_key(user_id: int) -> str:
+    return f"solved:{user_id}"
+
+
+def solved_version_key(user_id: int) -> str:
+    """유저 풀이 상태 버전 Redis 키를 반환한다."""
+    return f"solved:ver:{user_id}"
+
+
+def _changes_catalog(challenge: Challenge) -> bool:
+    """공개 목록에 보이는 필드가 바뀌었는지 확인한다."""
+    return any(
+        attr.key not in _VOLATILE_FIELDS and attr.history.has_changes()
+        for attr in inspect(challenge).attrs
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _track_catalog_changes(session: Session, flush_context) -> None:
+    """flush된 챌린지 변경 중 카탈로그에 영향을 주는 것이 있으면 세션에 표시한다."""
+    changes = post_commit.peek(session, _CHANGES_KEY)
+    if changes and changes.get("dirty"):
+        return
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, Challenge):
+            post_commit.pending(session, _CHANGES_KEY, dict)["dirty"] = True
+            return
+    for obj in session.dirty:
+        if isinstance(obj, Challenge) and _changes_catalog(obj):
+            post_commit.pending(session, _CHANGES_KEY, dict)["dirty"] = True
+            return
+
+
+def record_solve(db: AsyncSession, user_id: int, challenge_id: int) -> None:
+    """커밋 후 풀이 비트셋에 반영할 정답 제출을 세션에 쌓아둔다."""
+    changes = post_commit.pending(db.sync_session, _CHANGES_KEY, dict)
+    changes.setdefault("solves", []).append((user_id, challenge_id))
+
+
+async def _apply_changes(changes: dict) -> None:
+    """커밋된 카탈로그 변경과 정답 제출을 Redis에 반영한다."""
+    dirty = changes.get("dirty", False)
+    solves = changes.get("solves", [])
+    redis = get_redis_client()
+    if redis is None:
+        return
+    try:
+        pipe = redis.pipeline(transaction=False)
+        if dirty:
+            pipe.incr(VERSION_KEY)
+        for user_id, challenge_id in solves:
+            # 비트셋이 아직 채워지지 않았으면 0번 비트가 없으므로 다음 조회 시 DB에서 다시 채운다
+            pipe.setbit(_solved_key(user_id), challenge_id, 1)
+            pipe.expire(_solved_key(user_id), SOLVED_TTL_SECONDS)
+            pipe.incr(solved_version_key(user_id))
+        await pipe.execute()
+    except RedisError:
+        logger.warning("카탈로그 캐시 Redis 반영 실패 (버전 변경: %s, 풀이 %d건)", dirty, len(solves))
+
+
+post_commit.register(_CHANGES_KEY, _apply_changes)
+
+
+async def get_catalog_version() -> str | None:
+    """현재 카탈로그 버전을 반환한다.
+
+    키가 없으면 현재 시각으로 초기화하여, 키가 사라진 뒤에도
+    이전 버전의 캐시 항목과 겹치지 않게 한다.
+
+    Returns:
+        버전 문자열. Redis를 사용할 수 없으면 None.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return None
+    try:
+        version = await redis.get(VERSION_KEY)
+        if version is None:
+            await redis.set(VERSION_KEY, time.time_ns(), nx=True)
+            version = await redis.get(VERSION_KEY)
+    except RedisError:
+        return None
+    return version
+
+
+async def _load_page(
+    db: AsyncSession,
+    category: str | None,
+    difficulty: int | None,
+    search: str | None,
+    cursor: int | None,
+    limit: int,
+) -> dict:
+    challenges, next_cursor, total = await challenge_service.list_challenges(
+        db,
+        category=category,
+        difficulty=difficulty,
+        search=search,
+        cursor=cursor,
+        limit=limit,
+    )
+    return {
+        "items": [c.model_dump(mode="json") for c in challenges],
+        "next_cursor": next_cursor,
+        "total": total,
+    }
+
+
+async def get_catalog_page(
+    db: AsyncSession,
+    *,
+    category: str | None = None,
+    difficulty: int | None = None,
+    search: str | None = None,
+    cursor: int | None = None,
+    limit: int = 20,
+) -> dict:
+    """공개 챌린지 목록 한 페이지를 캐시에서 조회한다 (없으면 DB 조회 후 저장).
+
+    Args:
+        db: DB 세션.
+        category: 카테고리 필터.
+        difficulty: 난이도 필터.
+        search: 검색어.
+        cursor: 커서 (마지막 조회된 챌린지 ID).
+        limit: 페이지당 개수.
+
+    Returns:
+        ChallengeListResponse 형태의 dict (is_solved는 모두 False).
+    """
+    version = await get_catalog_version()
+    if version is None:
+        return await _load_page(db, category, difficulty, search, cursor, limit)
+
+    redis = get_redis_client()
+    key = _list_key(version, [category, difficulty, search, cursor, limit])
+    try:
+        cached = await redis.get(key)
+    except RedisError:
+        cached = None
+    if cached is not None:
+        return orjson.loads(cached)
+
+    page = await _load_page(db, category, difficulty, search, cursor, limit)
+    try:
+        await redis.set(key, orjson.dumps(page), ex=settings.CATALOG_CACHE_TTL_SECONDS)
+    except RedisError:
+        pass
+    return page
+
+
+async def get_solved_flags(
+    db: AsyncSession, user_id: int, challenge_ids: list[int]
+) -> set[int]:
+    """주어진 챌린지 중 유저가 풀이한 것을 반환한다.
+
+    풀이 비트셋에서 해당 비트만 읽고, 비트셋이 없으면 DB에서 채운다.
+
+    Args:
+        db: DB 세션.
+        user_id: 유저 ID.
+        challenge_ids: 확인할 챌린지 ID 목록.
+
+    Returns:
+        풀이 완료된 챌린지 ID set.
+    """
+    if not challenge_ids:
+        return set()
+    redis = get_redis_client()
+    if redis is not None:
+        key = _solved_key(user_id)
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.getbit(key, _SOLVED_LOADED_BIT)
+            for challenge_id in challenge_ids:
+                pipe.getbit(key, challenge_id)
+            loaded, *bits = await pipe.execute()
+            if loaded:
+                return {cid for cid, bit in zip(challenge_ids, bits) if bit}
+        except RedisError:
+            redis = None
+
+    solved_ids = await challenge_service.get_solved_challenge_ids(db, user_id)
+    if redis is not None:
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for challenge_id in solved_ids:
+                pipe.setbit(key, challenge_id, 1)
+            pipe.setbit(key, _SOLVED_LOADED_BIT, 1)
+            pipe.expire(key, SOLVED_TTL_SECONDS)
+            await pipe.execute()
+        except RedisError:
+            pass
+    return {cid for cid in challenge_ids if cid in solved_ids}
@@ -15,7 +15,18 @@ from app.core.exceptions import (
 )
 from app.models.challenge import Challenge
 from app.models.user import User
-from app.services.challenge_service import hash_flag
+from app.schemas.challenge import CommunitySubmissionSummary
+from app.services.challenge_service import SUMMARY_COLUMNS, hash_flag
+
+# 출제/심사 목록 컬럼 (힌트/파일 JSONB는 읽지 않는다)
+COMMUNITY_SUMMARY_COLUMNS = (
+    *SUMMARY_COLUMNS,
+    Challenge.description,
+    Challenge.source,
+    Challenge.review_status,
+    Challenge.review_comment,
+    Challenge.reviewed_at,
+)
 
 
 async def submit_challenge(
@@ -144,7 +155,7 @@ async def delete_submission(
 async def get_my_submissions(
     db: AsyncSession,
     user_id: int,
-) -> list[Challenge]:
+) -> list[CommunitySubmissionSummary]:
     """내 출제 목록을 조회한다.
 
     Args:
@@ -152,31 +163,31 @@ async def get_my_submissions(
         user_id: 유저 ID.
 
     Returns:
-        Challenge 목록.
+        출제 챌린지 요약 목록.
     """
     result = await db.execute(
-        select(Challenge)
+        select(*COMMUNITY_SUMMARY_COLUMNS)
         .where(Challenge.author_id == user_id, Challenge.source == "community")
         .order_by(Challenge.created_at.desc())
     )
-    return list(result.scalars().all())
+    return [CommunitySubmissionSummary.model_construct(**row._mapping) for row in result]
 
 
-async def list_pending(db: AsyncSession) -> list[Challenge]:
+async def list_pending(db: AsyncSession) -> list[CommunitySubmissionSummary]:
     """심사 대기 중인 챌린지를 조회한다.
 
     Args:
         db: DB 세션.
 
     Returns:
-        pending 상태의 Challenge 목록.
+        pending 상태의 챌린지 요약 목록.
     """
     result = await db.execute(
-        select(Challenge)
+        select(*COMMUNITY_SUMMARY_COLUMNS)
         .where(Challenge.review_status == "pending")
         .order_by(Challenge.created_at.asc())
     )
-    return list(result.scalars().all())
+    return [CommunitySubmissionSummary.model_construct(**row._mapping) for row in result]
 
 
 async def review_challenge(
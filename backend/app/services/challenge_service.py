@@ -2,13 +2,79 @@
 
 import hashlib
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ConflictException, NotFoundException
+from app.core.pagination import encode_cursor
 from app.models.challenge import Challenge
-from app.models.submission import Submission
-from app.schemas.challenge import ChallengeCreate, ChallengeUpdate
+from app.models.solve import Solve
+from app.schemas.challenge import ChallengeCreate, ChallengeSummary, ChallengeUpdate
+from app.services import search_service
+
+# 목록 카드에 필요한 컬럼 (description/hints/files 등 큰 컬럼은 읽지 않는다)
+SUMMARY_COLUMNS = (
+    Challenge.id,
+    Challenge.title,
+    Challenge.category,
+    Challenge.difficulty,
+    Challenge.points,
+    Challenge.is_dynamic,
+    Challenge.tags,
+    Challenge.solve_count,
+    Challenge.is_active,
+    Challenge.author_id,
+    Challenge.created_at,
+)
+
+# 플래그 제출/풀이 확인 경로의 고정 문장.
+# 모듈 로드 시 한 번 만들어 두면 요청마다 문장 생성과 컴파일 캐시 키 계산을 건너뛰고,
+# 같은 SQL 문자열이 되므로 커넥션의 prepared statement도 재사용된다.
+PUBLIC_CHALLENGE_STMT = select(Challenge).where(
+    Challenge.id == bindparam("challenge_id"),
+    Challenge.is_active.is_(True),
+    Challenge.review_status == "approved",
+)
+SOLVED_IDS_STMT = select(Solve.challenge_id).where(Solve.user_id == bindparam("user_id"))
+ALREADY_SOLVED_STMT = select(Solve.challenge_id).where(
+    Solve.user_id == bindparam("user_id"),
+    Solve.challenge_id == bindparam("challenge_id"),
+)
+
+# 정답 처리 단일 문장: 풀이 수 증가 → 풀이 기록 → 유저 점수 반영.
+# challenges 행 UPDATE가 행 잠금을 잡으므로 동시 풀이자들은 커밋 순서대로 직렬화되고,
+# RETURNING된 solve_count가 곧 이 풀이의 순번이 된다 (1이면 First Blood).
+# 풀이 수를 먼저 올려야 점수를 알 수 있으므로 ON CONFLICT 대신 solves_pkey 위반으로
+# 중복 풀이를 거부한다 — savepoint 안에서 실행하므로 이 문장의 증가분만 롤백된다.
+# 점수 공식은 calculate_dynamic_points와 같다.
+RECORD_SOLVE_STMT = text(
+    """
+    WITH bumped AS (
+        UPDATE challenges
+        SET solve_count = solve_count + 1,
+            points = greatest(
+                min_points, trunc(max_points - decay * (solve_count + 1))::integer
+            ),
+            updated_at = now()
+        WHERE id = :challenge_id
+        RETURNING id, solve_count, points
+    ),
+    solved AS (
+        INSERT INTO solves (user_id, challenge_id, points_awarded, solved_at)
+        SELECT CAST(:user_id AS integer), id, points, now() FROM bumped
+        RETURNING points_awarded
+    ),
+    scored AS (
+        UPDATE users
+        SET total_score = total_score + solved.points_awarded,
+            solved_count = solved_count + 1
+        FROM solved
+        WHERE users.id = :user_id
+    )
+    SELECT solve_count, points FROM bumped
+    """
+)
 
 
 def hash_flag(flag: str) -> str:
@@ -151,13 +217,7 @@ async def get_public_challenge_by_id(
     Raises:
         NotFoundException: 공개 가능한 챌린지가 존재하지 않을 때.
     """
-    result = await db.execute(
-        select(Challenge).where(
-            Challenge.id == challenge_id,
-            Challenge.is_active.is_(True),
-            Challenge.review_status == "approved",
-        )
-    )
+    result = await db.execute(PUBLIC_CHALLENGE_STMT, {"challenge_id": challenge_id})
     challenge = result.scalar_one_or_none()
     if challenge is None:
         raise NotFoundException("챌린지를 찾을 수 없습니다.")
@@ -174,23 +234,23 @@ async def list_challenges(
     limit: int = 20,
     active_only: bool = True,
     user_id: int | None = None,
-) -> tuple[list[Challenge], int | None, int]:
+) -> tuple[list[ChallengeSummary], int | None, int]:
     """챌린지 목록을 커서 기반으로 조회한다.
 
     Args:
         db: DB 세션.
         category: 카테고리 필터.
         difficulty: 난이도 필터.
-        search: 검색어 (제목, 태그).
+        search: 검색어 (제목, 태그, 설명 전문 검색 + 제목 유사도).
         cursor: 커서 (마지막 조회된 챌린지 ID).
         limit: 페이지당 개수.
         active_only: 활성 챌린지만 조회할지 여부.
         user_id: 풀이 여부 확인용 유저 ID.
 
     Returns:
-        (챌린지 목록, 다음 커서, 전체 개수) 튜플.
+        (챌린지 카드 목록, 다음 커서, 전체 개수) 튜플.
     """
-    query = select(Challenge)
+    query = select(*SUMMARY_COLUMNS)
     count_query = select(func.count(Challenge.id))
 
     if active_only:
@@ -207,9 +267,11 @@ async def list_challenges(
         query = query.where(Challenge.difficulty == difficulty)
         count_query = count_query.where(Challenge.difficulty == difficulty)
     if search:
-        pattern = f"%{search}%"
-        query = query.where(Challenge.title.ilike(pattern))
-        count_query = count_query.where(Challenge.title.ilike(pattern))
+        condition, _ = search_service.match(
+            Challenge.search_vector, search, fuzzy_column=Challenge.title
+        )
+        query = query.where(condition)
+        count_query = count_query.where(condition)
     if cursor:
         query = query.where(Challenge.id > cursor)
 
@@ -219,7 +281,7 @@ async def list_challenges(
     total = total_result.scalar() or 0
 
     result = await db.execute(query)
-    challenges = list(result.scalars().all())
+    challenges = [ChallengeSummary.model_construct(**row._mapping) for row in result]
 
     next_cursor = None
     if len(challenges) > limit:
@@ -229,6 +291,51 @@ async def list_challenges(
     return challenges, next_cursor, total
 
 
+async def search_challenges(
+    db: AsyncSession,
+    term: str,
+    *,
+    category: str | None = None,
+    cursor: str | None = None,
+    limit: int = 20,
+) -> tuple[list[ChallengeSummary], str | None]:
+    """공개 챌린지를 검색어 관련도 순으로 조회한다.
+
+    Args:
+        db: DB 세션.
+        term: 검색어.
+        category: 카테고리 필터.
+        cursor: 이전 응답의 next_cursor.
+        limit: 페이지당 개수.
+
+    Returns:
+        (챌린지 카드 목록, 다음 페이지 커서) 튜플.
+    """
+    condition, rank = search_service.match(
+        Challenge.search_vector, term, fuzzy_column=Challenge.title
+    )
+    query = select(*SUMMARY_COLUMNS, rank.label("rank")).where(
+        Challenge.is_active.is_(True),
+        Challenge.review_status == "approved",
+        condition,
+    )
+    if category:
+        query = query.where(Challenge.category == category)
+
+    kind = search_service.cursor_kind("challenges", term, category)
+    if cursor:
+        query = query.where(search_service.after_cursor(rank, Challenge.id, cursor, kind))
+
+    query = query.order_by(rank.desc(), Challenge.id.desc()).limit(limit + 1)
+    rows = list((await db.execute(query)).all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(kind, [rows[-1].rank, rows[-1].id])
+    return [ChallengeSummary.model_construct(**row._mapping) for row in rows], next_cursor
+
+
 async def get_solved_challenge_ids(
     db: AsyncSession, user_id: int
 ) -> set[int]:
@@ -241,11 +348,7 @@ async def get_solved_challenge_ids(
     Returns:
         풀이 완료된 챌린지 ID set.
     """
-    result = await db.execute(
-        select(Submission.challenge_id)
-        .where(Submission.user_id == user_id, Submission.is_correct.is_(True))
-        .distinct()
-    )
+    result = await db.execute(SOLVED_IDS_STMT, {"user_id": user_id})
     return set(result.scalars().all())
 
 
@@ -280,15 +383,48 @@ async def check_already_solved(
         이미 풀이했으면 True.
     """
     result = await db.execute(
-        select(Submission.id).where(
-            Submission.user_id == user_id,
-            Submission.challenge_id == challenge_id,
-            Submission.is_correct.is_(True),
-        )
+        ALREADY_SOLVED_STMT, {"user_id": user_id, "challenge_id": challenge_id}
     )
     return result.scalar_one_or_none() is not None
 
 
+async def record_correct_solve(
+    db: AsyncSession, user_id: int, challenge_id: int
+) -> tuple[int, bool]:
+    """정답 풀이를 한 문장으로 기록한다.
+
+    챌린지 풀이 수와 동적 점수, 풀이 기록, 유저 점수/풀이 수를 DB에서 원자적으로 갱신한다.
+    savepoint 안에서 실행하므로, 동시에 같은 풀이가 먼저 기록되어 solves_pkey를 위반하면
+    이 문장만 롤백되고 세션에 앞서 추가한 변경(시도 로그 등)은 그대로 남는다.
+
+    Args:
+        db: DB 세션.
+        user_id: 유저 ID.
+        challenge_id: 챌린지 ID.
+
+    Returns:
+        (획득 점수, 최초 풀이 여부) 튜플.
+
+    Raises:
+        NotFoundException: 챌린지가 없는 경우.
+        ConflictException: 이미 풀이한 경우.
+    """
+    try:
+        async with db.begin_nested():
+            result = await db.execute(
+                RECORD_SOLVE_STMT, {"user_id": user_id, "challenge_id": challenge_id}
+            )
+            row = result.one_or_none()
+    except IntegrityError as exc:
+        if "solves_pkey" not in str(exc.orig):
+            raise
+        raise ConflictException("이미 풀이한 문제입니다.") from exc
+    if row is None:
+        raise NotFoundException("챌린지를 찾을 수 없습니다.")
+    solve_count, points = row
+    return points, solve_count == 1
+
+
 def calculate_dynamic_points(
     max_points: int, min_points: int, decay: float, solve_count: int
 ) -> int:
@@ -5,13 +5,16 @@
 
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, case, distinct, func, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.challenge import Challenge
-from app.models.submission import Submission
+from app.models.solve import Solve
 from app.models.user import User
 
+# 대시보드 응답 캐시 네임스페이스 (유저별로 무효화)
+DASHBOARD_CACHE = "dashboard:{user_id}"
+
 
 async def get_user_rank(db: AsyncSession, user_id: int) -> int:
     """유저의 전체 랭킹을 조회한다.
@@ -50,15 +53,12 @@ async def get_main_category(
         가장 많이 푼 카테고리 문자열 또는 None.
     """
     result = await db.execute(
-        select(Challenge.category, func.count(Submission.id).label("cnt"))
-        .select_from(Submission)
-        .join(Challenge, Submission.challenge_id == Challenge.id)
-        .where(
-            Submission.user_id == user_id,
-            Submission.is_correct.is_(True),
-        )
+        select(Challenge.category, func.count(Solve.challenge_id).label("cnt"))
+        .select_from(Solve)
+        .join(Challenge, Solve.challenge_id == Challenge.id)
+        .where(Solve.user_id == user_id)
         .group_by(Challenge.category)
-        .order_by(func.count(Submission.id).desc())
+        .order_by(func.count(Solve.challenge_id).desc())
         .limit(1)
     )
     row = result.first()
@@ -76,15 +76,10 @@ async def get_streak_days(db: AsyncSession, user_id: int) -> int:
         연속 풀이 일수.
     """
     result = await db.execute(
-        select(
-            func.date(Submission.submitted_at).label("solve_date")
-        )
-        .where(
-            Submission.user_id == user_id,
-            Submission.is_correct.is_(True),
-        )
-        .group_by(func.date(Submission.submitted_at))
-        .order_by(func.date(Submission.submitted_at).desc())
+        select(func.date(Solve.solved_at).label("solve_date"))
+        .where(Solve.user_id == user_id)
+        .group_by(func.date(Solve.solved_at))
+        .order_by(func.date(Solve.solved_at).desc())
     )
     dates = [row.solve_date for row in result.all()]
 
@@ -166,23 +161,16 @@ async def get_activity_heatmap(
 
     result = await db.execute(
         select(
-            func.date(Submission.submitted_at).label("solve_date"),
-            func.count(
-                distinct(
-                    case(
-                        (Submission.is_correct.is_(True), Submission.challenge_id),
-                    )
-                )
-            ).label("count"),
+            func.date(Solve.solved_at).label("solve_date"),
+            func.count(Solve.challenge_id).label("count"),
         )
         .where(
-            Submission.user_id == user_id,
-            Submission.is_correct.is_(True),
-            Submission.submitted_at >= start_date,
-            Submission.submitted_at <= end_date,
+            Solve.user_id == user_id,
+            Solve.solved_at >= start_date,
+            Solve.solved_at <= end_date,
         )
-        .group_by(func.date(Submission.submitted_at))
-        .order_by(func.date(Submission.submitted_at))
+        .group_by(func.date(Solve.solved_at))
+        .order_by(func.date(Solve.solved_at))
     )
     rows = result.all()
 
@@ -209,19 +197,16 @@ async def get_recent_activity(
     """
     result = await db.execute(
         select(
-            Submission.challenge_id,
+            Solve.challenge_id,
             Challenge.title.label("challenge_title"),
             Challenge.category,
             Challenge.points,
-            Submission.submitted_at.label("solved_at"),
-        )
-        .select_from(Submission)
-        .join(Challenge, Submission.challenge_id == Challenge.id)
-        .where(
-            Submission.user_id == user_id,
-            Submission.is_correct.is_(True),
+            Solve.solved_at,
         )
-        .order_by(Submission.submitted_at.desc())
+        .select_from(Solve)
+        .join(Challenge, Solve.challenge_id == Challenge.id)
+        .where(Solve.user_id == user_id)
+        .order_by(Solve.solved_at.desc())
         .limit(limit)
     )
     rows = result.all()
@@ -253,12 +238,7 @@ async def get_recommended_challenges(
     """
     # 이미 풀은 문제 ID 목록
     solved_result = await db.execute(
-        select(Submission.challenge_id)
-        .where(
-            Submission.user_id == user_id,
-            Submission.is_correct.is_(True),
-        )
-        .distinct()
+        select(Solve.challenge_id).where(Solve.user_id == user_id)
     )
     solved_ids = {row.challenge_id for row in solved_result.all()}
 
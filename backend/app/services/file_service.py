@@ -1,13 +1,23 @@
 """챌린지 파일 업로드/다운로드 서비스.
 
 파일 저장, 검증, 삭제를 처리한다.
+업로드/import 시점에 챌린지별 번들(.zip/.tar.gz)과 텍스트 파일의
+gzip/brotli 사전 압축본을 생성한다. 파생 파일은 원본과 섞이지 않도록 챌린지 디렉토리의
+숨김 하위 디렉토리(.bundles, .encoded)에 둔다 (업로드 파일명은 '.'으로 시작할 수 없다).
 """
 
 import asyncio
+import gzip
 import hashlib
 import logging
+import os
 import shutil
+import tarfile
+import tempfile
+import zipfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import IO
 
 from fastapi import UploadFile
 
@@ -18,9 +28,16 @@ logger = logging.getLogger(__name__)
 UPLOAD_DIR = Path("/var/www/challenge-files")
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 
+try:  # brotli는 선택 의존성 — 없으면 gzip 사전 압축본만 생성
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
 
 REPO_BACKEND_DIR = Path(__file__).resolve().parents[2]
 CHALLENGES_ROOT_DIR = REPO_BACKEND_DIR / "challenges"
+# 업로드 기능 도입 이전의 공개 파일 디렉토리 (읽기 전용)
+LEGACY_PUBLIC_FILES_DIR = REPO_BACKEND_DIR / "public_files"
 
 ALLOWED_EXTENSIONS = {
     ".c", ".cpp", ".h", ".py", ".js", ".ts", ".go", ".rs", ".java",
@@ -37,6 +54,24 @@ ALLOWED_EXTENSIONS = {
     "",  # 확장자 없는 바이너리 (e.g., 'basic_bof')
 }
 
+# 사전 압축 대상 (이미 압축된 포맷/바이너리는 이득이 없으므로 제외)
+COMPRESSIBLE_EXTENSIONS = {
+    ".c", ".cpp", ".h", ".py", ".js", ".ts", ".go", ".rs", ".java",
+    ".rb", ".php", ".sh", ".pl", ".asm", ".s",
+    ".txt", ".md", ".yaml", ".yml", ".json", ".xml", ".csv",
+    ".html", ".css",
+}
+MIN_COMPRESS_SIZE = 512  # 이보다 작은 파일은 헤더 오버헤드가 더 크다
+
+# Accept-Encoding 협상 우선순위 (앞쪽이 우선)
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+BUNDLE_FORMATS = ("zip", "tar.gz")
+
+# 파생 파일 하위 디렉토리
+BUNDLE_DIR_NAME = ".bundles"
+ENCODED_DIR_NAME = ".encoded"
+
 
 def _ensure_challenge_dir(challenge_id: int) -> Path:
     """챌린지별 파일 디렉토리를 생성한다.
@@ -131,6 +166,8 @@ async def upload_multiple_files(
 ) -> list[dict]:
     """여러 파일을 한 번에 업로드한다.
 
+    업로드가 끝나면 번들과 사전 압축본을 다시 생성한다.
+
     Args:
         challenge_id: 챌린지 ID.
         files: 업로드 파일 리스트.
@@ -142,9 +179,207 @@ async def upload_multiple_files(
     for file in files:
         info = await upload_file(challenge_id, file)
         results.append(info)
+    await build_derived_files(challenge_id)
     return results
 
 
+def bundle_name(challenge_id: int, fmt: str) -> str:
+    """챌린지 번들 다운로드 파일명을 반환한다.
+
+    Args:
+        challenge_id: 챌린지 ID.
+        fmt: 번들 포맷 ("zip" 또는 "tar.gz").
+
+    Returns:
+        번들 파일명.
+    """
+    return f"challenge-{challenge_id}.{fmt}"
+
+
+def resolve_challenge_file(challenge_id: int, filename: str) -> Path | None:
+    """챌린지 파일의 실제 경로를 찾는다 (업로드 디렉토리 → 레거시 공개 디렉토리 순).
+
+    Args:
+        challenge_id: 챌린지 ID.
+        filename: 파일명 (경로 구분자가 없는 이름이어야 한다).
+
+    Returns:
+        파일 경로. 어느 쪽에도 없으면 None.
+    """
+    for root in (UPLOAD_DIR, LEGACY_PUBLIC_FILES_DIR):
+        path = root / str(challenge_id) / filename
+        if path.is_file():
+            return path
+    return None
+
+
+def _list_original_files(dir_path: Path) -> list[Path]:
+    """디렉토리의 원본 파일 목록을 이름순으로 반환한다 (파생 파일 하위 디렉토리 제외)."""
+    if not dir_path.exists():
+        return []
+    return sorted((f for f in dir_path.iterdir() if f.is_file()), key=lambda f: f.name)
+
+
+def _atomic_write(path: Path, write: Callable[[IO[bytes]], None]) -> None:
+    """같은 디렉토리의 고유한 임시 파일에 쓴 뒤 rename한다.
+
+    동시에 같은 파일을 만들거나 다운로드 중이어도 깨진 파일이 보이지 않는다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            write(tmp)
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def _precompress(path: Path, encoded_dir: Path) -> None:
+    """텍스트 파일의 gzip/brotli 사전 압축본을 생성한다.
+
+    압축 결과가 원본보다 크면 저장하지 않는다.
+    """
+    data = path.read_bytes()
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    for suffix, compressed in variants.items():
+        if len(compressed) < len(data):
+            _atomic_write(encoded_dir / (path.name + suffix), lambda fh: fh.write(compressed))
+
+
+def _bundle_path(challenge_id: int, sources: list[Path], fmt: str) -> Path:
+    """번들 저장 경로를 반환한다.
+
+    포함 파일의 이름/크기/수정 시각으로 이름을 정하므로 파일 구성이 바뀌면 새 번들이 된다.
+    """
+    digest = hashlib.sha256()
+    for path in sources:
+        stat = path.stat()
+        digest.update(f"{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return (
+        UPLOAD_DIR / str(challenge_id) / BUNDLE_DIR_NAME
+        / f"challenge-{challenge_id}-{digest.hexdigest()[:16]}.{fmt}"
+    )
+
+
+def _build_bundle_sync(challenge_id: int, sources: list[Path], fmt: str) -> Path:
+    """번들이 없으면 생성하고 경로를 반환한다."""
+    bundle_path = _bundle_path(challenge_id, sources, fmt)
+    if bundle_path.is_file():
+        return bundle_path
+
+    def write(fh: IO[bytes]) -> None:
+        if fmt == "zip":
+            with zipfile.ZipFile(fh, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                for path in sources:
+                    zf.write(path, arcname=path.name)
+        else:
+            with tarfile.open(fileobj=fh, mode="w:gz") as tf:
+                for path in sources:
+                    tf.add(path, arcname=path.name)
+
+    _atomic_write(bundle_path, write)
+    return bundle_path
+
+
+def _resolve_files(challenge_id: int, filenames: list[str]) -> list[Path]:
+    """파일명 목록 중 실제로 존재하는 파일 경로를 이름순으로 반환한다."""
+    paths = (resolve_challenge_file(challenge_id, Path(name).name) for name in set(filenames))
+    return sorted((p for p in paths if p is not None), key=lambda p: p.name)
+
+
+async def get_bundle(challenge_id: int, filenames: list[str], fmt: str) -> Path | None:
+    """챌린지 파일 번들 경로를 반환한다 (없으면 생성).
+
+    Args:
+        challenge_id: 챌린지 ID.
+        filenames: 번들에 넣을 파일명 목록 (챌린지의 files 필드).
+        fmt: 번들 포맷 ("zip" 또는 "tar.gz").
+
+    Returns:
+        번들 경로. 포함할 파일이 하나도 없으면 None.
+    """
+    sources = _resolve_files(challenge_id, filenames)
+    if not sources:
+        return None
+    return await asyncio.to_thread(_build_bundle_sync, challenge_id, sources, fmt)
+
+
+def _build_derived_files_sync(challenge_id: int, filenames: list[str] | None) -> None:
+    """사전 압축본과 번들을 동기적으로 재생성한다."""
+    dir_path = UPLOAD_DIR / str(challenge_id)
+    originals = _list_original_files(dir_path)
+
+    encoded_dir = dir_path / ENCODED_DIR_NAME
+    for stale in _list_original_files(encoded_dir):
+        stale.unlink(missing_ok=True)
+    for path in originals:
+        if (
+            path.suffix.lower() in COMPRESSIBLE_EXTENSIONS
+            and path.stat().st_size >= MIN_COMPRESS_SIZE
+        ):
+            _precompress(path, encoded_dir)
+
+    if filenames is None:
+        filenames = [path.name for path in originals]
+    sources = _resolve_files(challenge_id, filenames)
+    current = set()
+    if sources:
+        current = {_build_bundle_sync(challenge_id, sources, fmt) for fmt in BUNDLE_FORMATS}
+    for stale in _list_original_files(dir_path / BUNDLE_DIR_NAME):
+        if stale not in current:
+            stale.unlink(missing_ok=True)
+
+
+async def build_derived_files(challenge_id: int, filenames: list[str] | None = None) -> None:
+    """텍스트 파일 사전 압축본과 챌린지 번들(.zip/.tar.gz)을 재생성한다.
+
+    Args:
+        challenge_id: 챌린지 ID.
+        filenames: 번들에 넣을 파일명 목록. None이면 업로드된 파일 전체.
+    """
+    await asyncio.to_thread(_build_derived_files_sync, challenge_id, filenames)
+    logger.info("번들/사전 압축본 생성: challenge=%d", challenge_id)
+
+
+def select_encoded_variant(
+    file_path: Path, accept_encoding: str | None
+) -> tuple[Path, str | None]:
+    """Accept-Encoding 헤더에 맞는 사전 압축본을 고른다.
+
+    Args:
+        file_path: 원본 파일 경로.
+        accept_encoding: 요청의 Accept-Encoding 헤더 값.
+
+    Returns:
+        (서빙할 파일 경로, Content-Encoding 값 또는 None) 튜플.
+    """
+    if not accept_encoding:
+        return file_path, None
+
+    qvalues: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        try:
+            qvalue = float(params.strip().removeprefix("q=")) if params else 1.0
+        except ValueError:
+            continue
+        qvalues[token.strip().lower()] = qvalue
+
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        # 명시된 코딩의 q 값이 와일드카드(*)보다 우선한다 (gzip;q=0, * 이면 gzip 제외)
+        if qvalues.get(encoding, qvalues.get("*", 0)) > 0:
+            variant = file_path.parent / ENCODED_DIR_NAME / (file_path.name + suffix)
+            if variant.is_file():
+                return variant, encoding
+    return file_path, None
+
+
 async def list_files(challenge_id: int) -> list[str]:
     """챌린지에 업로드된 파일 목록을 반환한다.
 
@@ -156,9 +391,7 @@ async def list_files(challenge_id: int) -> list[str]:
     """
     def _list() -> list[str]:
         dir_path = UPLOAD_DIR / str(challenge_id)
-        if not dir_path.exists():
-            return []
-        return [f.name for f in dir_path.iterdir() if f.is_file()]
+        return [f.name for f in _list_original_files(dir_path)]
 
     return await asyncio.to_thread(_list)
 
@@ -179,6 +412,7 @@ async def delete_file(challenge_id: int, filename: str) -> None:
         raise BadRequestException("파일을 찾을 수 없습니다.")
     await asyncio.to_thread(file_path.unlink)
     logger.info("파일 삭제: challenge=%d, file=%s", challenge_id, safe_name)
+    await build_derived_files(challenge_id)
 
 
 async def delete_challenge_files(challenge_id: int) -> None:
@@ -218,7 +452,7 @@ async def stage_release_files(
 
     for filename in file_list:
         safe_name = Path(filename).name
-        if safe_name != filename or not safe_name:
+        if safe_name != filename or not safe_name or safe_name.startswith("."):
             raise BadRequestException(f"유효하지 않은 파일명입니다: {filename}")
 
         _validate_extension(safe_name)
@@ -239,4 +473,6 @@ async def stage_release_files(
         await asyncio.to_thread(shutil.copy2, src_path, dst_dir / safe_name)
         copied.append(safe_name)
 
+    if copied:
+        await build_derived_files(challenge_id, copied)
     return copied
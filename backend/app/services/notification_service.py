@@ -1,17 +1,134 @@
 """알림 서비스 모듈.
 
 알림 생성, 조회, 읽음 처리를 담당한다.
+
+알림은 두 종류다.
+- 개인 알림: notifications 테이블에 유저별 행으로 저장한다.
+  여러 유저에게 보낼 때는 create_notifications_bulk로 한 번에 INSERT한다.
+- 브로드캐스트 알림: broadcast_notifications 테이블에 한 행만 저장하고,
+  유저별 읽음 커서(notification_read_cursors)로 읽음 여부를 계산한다 (fan-out-on-read).
+  가입 이전에 만들어진 브로드캐스트는 보이지 않는다.
+
+변경 사항은 트랜잭션 커밋 후에 Redis로 반영된다.
+- `notifications:{user_id}` 채널로 새 알림을 발행 (WebSocket 푸시용)
+- `notif:unread:{user_id}` 개인 알림 미읽음 카운터 갱신
+- `notif:ver:{user_id}` 버전 증가 (목록 조회 ETag용)
+브로드캐스트는 user_id 자리에 BROADCAST를 사용한다.
 """
 
+import json
 import logging
+import time
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select, update
+from redis.exceptions import RedisError
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.notification import Notification
+from app.config import get_settings
+from app.core import post_commit
+from app.core.exceptions import NotFoundException
+from app.core.redis import get_redis_client
+from app.models.notification import (
+    BroadcastNotification,
+    Notification,
+    NotificationReadCursor,
+)
+from app.models.user import User
+from app.schemas.notification import NotificationResponse
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+UNREAD_TTL_SECONDS = 86400
+_EVENTS_KEY = "notification_events"
+
+# KEYS[1]=미읽음 카운터. 키가 있을 때만 증감한다 (없으면 다음 조회 시 DB에서 재계산)
+_INCR_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+  local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+  if value < 0 then
+    redis.call('DEL', KEYS[1])
+  end
+  return value
+end
+return nil
+"""
+
+# KEYS[1]=미읽음 카운터, KEYS[2]=알림 버전. DB에서 센 값을 버전이 그대로일 때만 저장한다
+# (센 뒤에 반영된 이벤트가 있으면 그 값은 이미 낡았으므로 저장하지 않는다)
+_SET_IF_VERSION_SCRIPT = """
+local version = redis.call('GET', KEYS[2]) or ''
+if version == ARGV[1] then
+  return redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3], 'NX')
+end
+return nil
+"""
+
+CHANNEL_PATTERN = "notifications:*"
+BROADCAST = "broadcast"
+
+_READ_CURSOR = func.coalesce(NotificationReadCursor.last_read_broadcast_id, 0)
+
+_incr_if_exists = None
+_set_if_version = None
+
+
+def channel_name(user_id: int | str) -> str:
+    """유저 알림 pub/sub 채널명을 반환한다."""
+    return f"notifications:{user_id}"
+
+
+def _unread_key(user_id: int | str) -> str:
+    return f"notif:unread:{user_id}"
+
+
+def _version_key(user_id: int | str) -> str:
+    return f"notif:ver:{user_id}"
+
+
+def _queue_event(db: AsyncSession, user_id: int | str, **event_data) -> None:
+    """커밋 후 Redis에 반영할 알림 이벤트를 세션에 쌓아둔다."""
+    post_commit.pending(db.sync_session, _EVENTS_KEY, list).append(
+        {"user_id": user_id, **event_data}
+    )
+
+
+async def _apply_events(events: list[dict]) -> None:
+    """커밋된 알림 이벤트를 Redis 카운터/버전/채널에 반영한다."""
+    global _incr_if_exists
+    redis = get_redis_client()
+    if redis is None:
+        return
+    if _incr_if_exists is None:
+        _incr_if_exists = redis.register_script(_INCR_IF_EXISTS_SCRIPT)
+
+    try:
+        for item in events:
+            user_id = item["user_id"]
+            if "unread_set" in item:
+                await redis.set(_unread_key(user_id), item["unread_set"], ex=UNREAD_TTL_SECONDS)
+            elif item.get("unread_delta"):
+                await _incr_if_exists(keys=[_unread_key(user_id)], args=[item["unread_delta"]])
+            await redis.incr(_version_key(user_id))
+            if "payload" in item:
+                await redis.publish(channel_name(user_id), json.dumps(item["payload"]))
+    except RedisError:
+        logger.warning("알림 이벤트 Redis 반영 실패: %d건", len(events))
+        # 카운터/버전이 DB와 어긋났으므로 지워서 다음 조회 때 다시 계산되게 한다
+        user_ids = {item["user_id"] for item in events}
+        try:
+            await redis.delete(
+                *(key for uid in user_ids for key in (_unread_key(uid), _version_key(uid)))
+            )
+        except RedisError:
+            logger.warning("알림 카운터/버전 삭제 실패: %s", sorted(map(str, user_ids)))
+
+
+post_commit.register(_EVENTS_KEY, _apply_events)
+
 
 async def create_notification(
     db: AsyncSession,
@@ -43,9 +160,171 @@ async def create_notification(
     )
     db.add(notif)
     await db.flush()
+    _queue_event(
+        db,
+        user_id,
+        unread_delta=1,
+        payload={
+            "type": "notification",
+            "item": NotificationResponse.model_validate(notif).model_dump(mode="json"),
+        },
+    )
     return notif
 
 
+async def create_notifications_bulk(
+    db: AsyncSession,
+    user_ids: list[int],
+    type: str,
+    title: str,
+    message: str,
+    challenge_id: int | None = None,
+) -> int:
+    """여러 유저에게 같은 알림을 한 번의 INSERT로 생성한다.
+
+    Args:
+        db: DB 세션.
+        user_ids: 대상 유저 ID 목록.
+        type: 알림 타입.
+        title: 제목.
+        message: 내용.
+        challenge_id: 관련 챌린지 ID (선택).
+
+    Returns:
+        생성된 알림 수.
+    """
+    if not user_ids:
+        return 0
+
+    now = datetime.now(UTC)
+    result = await db.execute(
+        insert(Notification)
+        .values(
+            [
+                {
+                    "user_id": uid,
+                    "type": type,
+                    "title": title,
+                    "message": message,
+                    "challenge_id": challenge_id,
+                    "is_read": False,
+                    "created_at": now,
+                }
+                for uid in user_ids
+            ]
+        )
+        .returning(Notification.id, Notification.user_id)
+    )
+    rows = result.all()
+    for row in rows:
+        item = NotificationResponse(
+            id=row.id,
+            type=type,
+            title=title,
+            message=message,
+            challenge_id=challenge_id,
+            is_read=False,
+            created_at=now,
+        )
+        _queue_event(
+            db,
+            row.user_id,
+            unread_delta=1,
+            payload={"type": "notification", "item": item.model_dump(mode="json")},
+        )
+    return len(rows)
+
+
+async def create_broadcast(
+    db: AsyncSession,
+    type: str,
+    title: str,
+    message: str,
+    challenge_id: int | None = None,
+) -> BroadcastNotification:
+    """전체 유저 대상 알림을 생성한다 (한 행만 저장).
+
+    Args:
+        db: DB 세션.
+        type: 알림 타입.
+        title: 제목.
+        message: 내용.
+        challenge_id: 관련 챌린지 ID (선택).
+
+    Returns:
+        생성된 BroadcastNotification 객체.
+    """
+    broadcast = BroadcastNotification(
+        type=type,
+        title=title,
+        message=message,
+        challenge_id=challenge_id,
+    )
+    db.add(broadcast)
+    await db.flush()
+    _queue_event(
+        db,
+        BROADCAST,
+        payload={
+            "type": "notification",
+            "item": _broadcast_response(broadcast, is_read=False).model_dump(mode="json"),
+        },
+    )
+    return broadcast
+
+
+def _broadcast_response(broadcast: BroadcastNotification, is_read: bool) -> NotificationResponse:
+    """브로드캐스트 행을 알림 응답 스키마로 변환한다."""
+    return NotificationResponse(
+        id=broadcast.id,
+        type=broadcast.type,
+        title=broadcast.title,
+        message=broadcast.message,
+        challenge_id=broadcast.challenge_id,
+        is_read=is_read,
+        created_at=broadcast.created_at,
+        broadcast=True,
+    )
+
+
+def _visible_broadcasts(user_id: int, *columns):
+    """유저에게 보이는 브로드캐스트 조회 쿼리를 반환한다.
+
+    가입 시각 이후의 브로드캐스트만 대상으로 하며, 읽음 커서 테이블을 외부 조인한다.
+    """
+    return (
+        select(*columns)
+        .select_from(BroadcastNotification)
+        .join(User, User.id == user_id)
+        .outerjoin(NotificationReadCursor, NotificationReadCursor.user_id == user_id)
+        .where(BroadcastNotification.created_at >= User.created_at)
+    )
+
+
+async def notify_new_challenge(
+    db: AsyncSession,
+    challenge_title: str,
+    challenge_id: int,
+) -> BroadcastNotification:
+    """새 챌린지 공개 알림을 전체 유저에게 보낸다.
+
+    Args:
+        db: DB 세션.
+        challenge_title: 챌린지 제목.
+        challenge_id: 챌린지 ID.
+
+    Returns:
+        생성된 BroadcastNotification 객체.
+    """
+    return await create_broadcast(
+        db,
+        type="new_challenge",
+        title="새 문제 공개",
+        message=f"'{challenge_title}' 문제가 새로 공개되었습니다!",
+        challenge_id=challenge_id,
+    )
+
+
 async def notify_first_blood(
     db: AsyncSession,
     user_id: int,
@@ -124,22 +403,20 @@ async def notify_admins_new_submission(
         author_name: 출제자 닉네임.
     """
     from app.core.permissions import AUTHOR_ROLES
-    from app.models.user import User
 
     result = await db.execute(
         select(User.id).where(User.role.in_(AUTHOR_ROLES))
     )
-    admin_ids = result.scalars().all()
+    admin_ids = list(result.scalars().all())
 
-    for admin_id in admin_ids:
-        await create_notification(
-            db,
-            user_id=admin_id,
-            type="review_request",
-            title="새 심사 요청",
-            message=f"{author_name}님이 '{challenge_title}' 문제를 제출했습니다.",
-            challenge_id=challenge_id,
-        )
+    await create_notifications_bulk(
+        db,
+        admin_ids,
+        type="review_request",
+        title="새 심사 요청",
+        message=f"{author_name}님이 '{challenge_title}' 문제를 제출했습니다.",
+        challenge_id=challenge_id,
+    )
 
 
 async def get_user_notifications(
@@ -147,9 +424,11 @@ async def get_user_notifications(
     user_id: int,
     limit: int = 20,
     unread_only: bool = False,
-) -> tuple[list[Notification], int]:
+) -> tuple[list[NotificationResponse], int]:
     """유저의 알림 목록과 미읽음 수를 반환한다.
 
+    개인 알림과 브로드캐스트 알림을 최신순으로 합쳐 반환한다.
+
     Args:
         db: DB 세션.
         user_id: 유저 ID.
@@ -157,15 +436,68 @@ async def get_user_notifications(
         unread_only: 미읽음만 조회 여부.
 
     Returns:
-        (알림 리스트, 미읽음 수) 튜플.
+        (알림 응답 리스트, 미읽음 수) 튜플.
     """
     stmt = select(Notification).where(Notification.user_id == user_id)
     if unread_only:
         stmt = stmt.where(Notification.is_read.is_(False))
     stmt = stmt.order_by(Notification.created_at.desc()).limit(limit)
-
     result = await db.execute(stmt)
-    notifications = list(result.scalars().all())
+    items = [NotificationResponse.model_validate(n) for n in result.scalars().all()]
+
+    broadcast_stmt = _visible_broadcasts(
+        user_id,
+        BroadcastNotification,
+        (BroadcastNotification.id <= _READ_CURSOR).label("is_read"),
+    )
+    if unread_only:
+        broadcast_stmt = broadcast_stmt.where(BroadcastNotification.id > _READ_CURSOR)
+    broadcast_stmt = broadcast_stmt.order_by(BroadcastNotification.id.desc()).limit(limit)
+    broadcast_result = await db.execute(broadcast_stmt)
+    items.extend(
+        _broadcast_response(row.BroadcastNotification, is_read=row.is_read)
+        for row in broadcast_result
+    )
+
+    items.sort(key=lambda n: n.created_at, reverse=True)
+    unread_count = await get_unread_count(db, user_id)
+
+    return items[:limit], unread_count
+
+
+async def get_unread_count(db: AsyncSession, user_id: int) -> int:
+    """유저의 미읽음 알림 수를 반환한다 (개인 + 브로드캐스트).
+
+    개인 알림은 Redis 카운터가 있으면 그대로 사용하고, 없으면 DB에서 세어 캐시한다.
+    브로드캐스트는 읽음 커서 이후의 행 수를 센다.
+
+    Args:
+        db: DB 세션.
+        user_id: 유저 ID.
+
+    Returns:
+        미읽음 알림 수.
+    """
+    unread_count = await _count_personal_unread(db, user_id)
+    return unread_count + await _count_broadcast_unread(db, user_id)
+
+
+async def _count_personal_unread(db: AsyncSession, user_id: int) -> int:
+    """개인 알림 미읽음 수를 반환한다 (Redis 카운터 우선).
+
+    카운터가 없으면 DB에서 세고, 세기 전에 읽은 알림 버전이 그대로일 때만 저장한다.
+    그 사이 커밋된 알림은 카운터가 없어 증감되지 않으므로, 낡은 값이 TTL 동안 남지 않게 한다.
+    """
+    global _set_if_version
+    redis = get_redis_client()
+    version = None
+    if redis is not None:
+        try:
+            cached, version = await redis.mget(_unread_key(user_id), _version_key(user_id))
+            if cached is not None:
+                return int(cached)
+        except RedisError:
+            redis = None
 
     unread_result = await db.execute(
         select(func.count(Notification.id)).where(
@@ -175,7 +507,56 @@ async def get_user_notifications(
     )
     unread_count = unread_result.scalar() or 0
 
-    return notifications, unread_count
+    if redis is not None:
+        if _set_if_version is None:
+            _set_if_version = redis.register_script(_SET_IF_VERSION_SCRIPT)
+        try:
+            await _set_if_version(
+                keys=[_unread_key(user_id), _version_key(user_id)],
+                args=[version or "", unread_count, UNREAD_TTL_SECONDS],
+            )
+        except RedisError:
+            pass
+    return unread_count
+
+
+async def _count_broadcast_unread(db: AsyncSession, user_id: int) -> int:
+    """읽음 커서 이후의 브로드캐스트 수를 반환한다."""
+    result = await db.execute(
+        _visible_broadcasts(user_id, func.count(BroadcastNotification.id)).where(
+            BroadcastNotification.id > _READ_CURSOR
+        )
+    )
+    return result.scalar() or 0
+
+
+async def get_list_version(user_id: int) -> str | None:
+    """유저 알림 목록의 버전 값을 반환한다 (ETag 계산용).
+
+    유저 버전과 브로드캐스트 버전을 합친 값이다.
+    키가 없으면 현재 시각으로 초기화하여, 키가 사라진 뒤에도
+    이전에 발급한 ETag와 값이 겹치지 않게 한다.
+
+    Args:
+        user_id: 유저 ID.
+
+    Returns:
+        버전 문자열. Redis를 사용할 수 없으면 None.
+    """
+    redis = get_redis_client()
+    if redis is None:
+        return None
+    keys = [_version_key(user_id), _version_key(BROADCAST)]
+    try:
+        versions = await redis.mget(keys)
+        if None in versions:
+            for key, version in zip(keys, versions):
+                if version is None:
+                    await redis.set(key, time.time_ns(), nx=True)
+            versions = await redis.mget(keys)
+    except RedisError:
+        return None
+    return ".".join(versions)
 
 
 async def mark_as_read(
@@ -190,16 +571,22 @@ async def mark_as_read(
         notification_id: 알림 ID.
         user_id: 유저 ID.
     """
-    await db.execute(
+    result = await db.execute(
         update(Notification)
-        .where(Notification.id == notification_id, Notification.user_id == user_id)
+        .where(
+            Notification.id == notification_id,
+            Notification.user_id == user_id,
+            Notification.is_read.is_(False),
+        )
         .values(is_read=True)
     )
     await db.flush()
+    if result.rowcount:
+        _queue_event(db, user_id, unread_delta=-result.rowcount)
 
 
 async def mark_all_as_read(db: AsyncSession, user_id: int) -> None:
-    """유저의 모든 알림을 읽음 처리한다.
+    """유저의 모든 알림을 읽음 처리한다 (브로드캐스트 포함).
 
     Args:
         db: DB 세션.
@@ -210,4 +597,154 @@ async def mark_all_as_read(db: AsyncSession, user_id: int) -> None:
         .where(Notification.user_id == user_id, Notification.is_read.is_(False))
         .values(is_read=True)
     )
+    latest = await db.execute(select(func.max(BroadcastNotification.id)))
+    latest_broadcast_id = latest.scalar()
+    if latest_broadcast_id is not None:
+        await _advance_read_cursor(db, user_id, latest_broadcast_id)
     await db.flush()
+    _queue_event(db, user_id, unread_set=0)
+
+
+async def mark_broadcast_read(db: AsyncSession, broadcast_id: int, user_id: int) -> None:
+    """브로드캐스트 알림을 읽음 처리한다.
+
+    읽음 커서를 해당 ID까지 전진시키므로, 그 이전의 브로드캐스트도 함께 읽음 처리된다.
+
+    Args:
+        db: DB 세션.
+        broadcast_id: 브로드캐스트 알림 ID.
+        user_id: 유저 ID.
+
+    Raises:
+        NotFoundException: 브로드캐스트 알림이 없을 때.
+    """
+    exists = await db.execute(
+        select(BroadcastNotification.id).where(BroadcastNotification.id == broadcast_id)
+    )
+    if exists.scalar_one_or_none() is None:
+        raise NotFoundException("알림을 찾을 수 없습니다.")
+    await _advance_read_cursor(db, user_id, broadcast_id)
+    _queue_event(db, user_id)
+
+
+async def _advance_read_cursor(db: AsyncSession, user_id: int, broadcast_id: int) -> None:
+    """유저의 브로드캐스트 읽음 커서를 전진시킨다 (뒤로 가지 않는다)."""
+    stmt = pg_insert(NotificationReadCursor).values(
+        user_id=user_id, last_read_broadcast_id=broadcast_id
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[NotificationReadCursor.user_id],
+            set_={
+                "last_read_broadcast_id": func.greatest(
+                    NotificationReadCursor.last_read_broadcast_id,
+                    stmt.excluded.last_read_broadcast_id,
+                )
+            },
+        )
+    )
+
+
+async def delete_expired_read_batch(db: AsyncSession, batch_size: int) -> list[int]:
+    """보존 기간이 지난 읽은 알림을 한 배치만큼 삭제한다.
+
+    id 순으로 오래된 행부터 삭제하여, 배치를 반복해도 같은 구간을 다시 스캔하지 않게 한다.
+
+    Args:
+        db: DB 세션.
+        batch_size: 한 번에 삭제할 최대 행 수.
+
+    Returns:
+        삭제된 알림의 user_id 목록 (중복 포함). 비어 있으면 더 삭제할 행이 없다.
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    expired_ids = (
+        select(Notification.id)
+        .where(Notification.is_read.is_(True), Notification.created_at < cutoff)
+        .order_by(Notification.id)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(Notification)
+        .where(Notification.id.in_(expired_ids))
+        .returning(Notification.user_id)
+    )
+    return list(result.scalars().all())
+
+
+async def trim_users_over_cap(db: AsyncSession, max_users: int) -> list[int]:
+    """유저당 최대 보관 수를 넘는 오래된 알림을 삭제한다.
+
+    Args:
+        db: DB 세션.
+        max_users: 한 번에 처리할 최대 유저 수.
+
+    Returns:
+        알림이 삭제된 유저 ID 목록. 비어 있으면 초과한 유저가 없다.
+    """
+    cap = settings.NOTIFICATION_MAX_PER_USER
+    result = await db.execute(
+        select(Notification.user_id)
+        .group_by(Notification.user_id)
+        .having(func.count(Notification.id) > cap)
+        .limit(max_users)
+    )
+    user_ids = list(result.scalars().all())
+
+    for user_id in user_ids:
+        # ix_notifications_user_created로 최신 cap개를 건너뛴 나머지를 찾는다
+        overflow_ids = (
+            select(Notification.id)
+            .where(Notification.user_id == user_id)
+            .order_by(Notification.created_at.desc(), Notification.id.desc())
+            .offset(cap)
+            .scalar_subquery()
+        )
+        await db.execute(
+            delete(Notification).where(
+                Notification.user_id == user_id,
+                Notification.id.in_(overflow_ids),
+            )
+        )
+    return user_ids
+
+
+async def delete_expired_broadcasts(db: AsyncSession) -> int:
+    """보존 기간이 지난 브로드캐스트 알림을 삭제한다.
+
+    읽음 커서는 ID 기준이므로 오래된 행을 지워도 읽음 여부 계산에 영향이 없다.
+
+    Args:
+        db: DB 세션.
+
+    Returns:
+        삭제된 브로드캐스트 수.
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    result = await db.execute(
+        delete(BroadcastNotification).where(BroadcastNotification.created_at < cutoff)
+    )
+    return result.rowcount or 0
+
+
+async def invalidate_users(user_ids: set[int | str]) -> None:
+    """유저들의 미읽음 카운터를 지우고 목록 버전을 올린다.
+
+    정리 작업처럼 커밋 후 이벤트를 쓸 수 없는 곳에서 커밋 뒤에 호출한다.
+    카운터는 다음 조회 시 DB에서 다시 계산된다.
+
+    Args:
+        user_ids: 유저 ID 집합 (브로드캐스트 버전은 BROADCAST).
+    """
+    redis = get_redis_client()
+    if redis is None or not user_ids:
+        return
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.delete(_unread_key(user_id))
+            pipe.incr(_version_key(user_id))
+        await pipe.execute()
+    except RedisError:
+        logger.warning("알림 캐시 무효화 실패: %d명", len(user_ids))
@@ -0,0 +1,179 @@
+"""제출(submissions) 월별 파티션 관리 서비스 모듈.
+
+submissions는 submitted_at 기준 월별 범위 파티션 테이블이다 (submissions_pYYYYMM).
+- ensure_partitions: 이번 달부터 N개월 뒤까지의 파티션을 미리 만든다.
+  파티션이 없는 시각의 행은 기본 파티션(submissions_default)에 들어가며,
+  그 범위의 파티션을 만들 때 기본 파티션의 행을 새 파티션으로 옮긴다.
+- archive_expired_partitions: 보존 기간이 지난 달의 파티션을 CSV.gz로 내보낸 뒤
+  분리/삭제한다. 풀이와 점수는 solves에 있으므로 시도 로그만 보관 파일로 옮겨진다.
+
+파티션 DDL은 바인드 파라미터를 쓸 수 없으므로 이름/경계값은 날짜로만 만든다.
+"""
+
+import gzip
+import logging
+import re
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+TABLE = "submissions"
+DEFAULT_PARTITION = f"{TABLE}_default"
+_PARTITION_NAME = re.compile(rf"^{TABLE}_p(\d{{4}})(\d{{2}})$")
+
+
+def add_months(month: date, months: int) -> date:
+    """월 시작일에 개월 수를 더한 월 시작일을 반환한다."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def current_month() -> date:
+    """현재(UTC) 월의 시작일을 반환한다."""
+    return datetime.now(UTC).date().replace(day=1)
+
+
+def partition_name(month: date) -> str:
+    """월 파티션 테이블 이름을 반환한다."""
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+async def list_partitions(db: AsyncSession) -> list[date]:
+    """존재하는 월 파티션의 시작일 목록을 오름차순으로 반환한다 (기본 파티션 제외)."""
+    result = await db.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:table AS regclass)
+            """
+        ),
+        {"table": TABLE},
+    )
+    months = []
+    for (name,) in result.all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+async def _create_partition(db: AsyncSession, month: date) -> None:
+    """월 파티션을 만든다. 기본 파티션에 해당 범위의 행이 있으면 옮긴 뒤 연결한다."""
+    name = partition_name(month)
+    start, end = _bound(month), _bound(add_months(month, 1))
+    stray = await db.scalar(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+            f"WHERE submitted_at >= {start} AND submitted_at < {end})"
+        )
+    )
+    if not stray:
+        await db.execute(
+            text(f"CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM ({start}) TO ({end})")
+        )
+        return
+
+    # 기본 파티션에 같은 범위의 행이 있으면 PARTITION OF가 실패하므로
+    # 빈 테이블에 행을 옮긴 뒤 파티션으로 연결한다
+    await db.execute(text(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)"))
+    await db.execute(
+        text(
+            f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE submitted_at >= {start} AND submitted_at < {end}
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+            """
+        )
+    )
+    await db.execute(
+        text(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ({start}) TO ({end})")
+    )
+    logger.warning("기본 파티션의 제출 행을 %s로 옮겼습니다.", name)
+
+
+async def ensure_partitions(db: AsyncSession, months_ahead: int) -> list[str]:
+    """이번 달부터 months_ahead개월 뒤까지 없는 월 파티션을 만든다.
+
+    Args:
+        db: DB 세션.
+        months_ahead: 미리 만들 개월 수.
+
+    Returns:
+        새로 만든 파티션 이름 목록.
+    """
+    existing = set(await list_partitions(db))
+    created = []
+    start = current_month()
+    for offset in range(months_ahead + 1):
+        month = add_months(start, offset)
+        if month in existing:
+            continue
+        await _create_partition(db, month)
+        created.append(partition_name(month))
+    return created
+
+
+async def _export_partition(db: AsyncSession, name: str, archive_dir: Path) -> Path:
+    """파티션 전체를 헤더가 있는 CSV.gz 파일로 내보낸다 (임시 파일 작성 후 이름 변경)."""
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    partial = archive_dir / f"{name}.csv.gz.partial"
+
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    with gzip.open(partial, "wb") as fh:
+
+        async def write(chunk: bytes) -> None:
+            fh.write(chunk)
+
+        await raw.driver_connection.copy_from_table(
+            name, output=write, format="csv", header=True
+        )
+    partial.replace(path)
+    return path
+
+
+async def archive_expired_partitions(
+    db: AsyncSession, retention_months: int, archive_dir: str
+) -> list[Path]:
+    """보존 기간이 지난 월 파티션을 파일로 내보내고 삭제한다.
+
+    파티션 하나씩 내보내기 → 분리/삭제 → 커밋 순으로 처리하므로,
+    도중에 실패해도 이미 처리한 파티션은 삭제되고 남은 파티션은 다음 실행에서 다시 처리된다.
+
+    Args:
+        db: DB 세션.
+        retention_months: 보존 개월 수 (이번 달 포함하지 않음). 0 이하이면 보관하지 않는다.
+        archive_dir: 보관 파일 디렉토리.
+
+    Returns:
+        생성된 보관 파일 경로 목록.
+    """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(current_month(), -retention_months)
+    archived = []
+    for month in await list_partitions(db):
+        if month >= cutoff:
+            break
+        name = partition_name(month)
+        path = await _export_partition(db, name, Path(archive_dir))
+        await db.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        await db.commit()
+        logger.info("제출 파티션 보관: %s -> %s", name, path)
+        archived.append(path)
+    return archived
@@ -1,42 +1,31 @@
 """스코어링 서비스 모듈.
 
 유저 점수 업데이트 및 스코어보드 조회 로직을 처리한다.
+점수가 바뀌면 커밋 후 스코어보드와 해당 유저의 대시보드 응답 캐시를 무효화한다.
 """
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.submission import Submission
+from app.core import response_cache
+from app.models.solve import Solve
 from app.models.user import User
+from app.services.dashboard_service import DASHBOARD_CACHE
 
+# 스코어보드 응답 캐시 네임스페이스
+SCOREBOARD_CACHE = "scoreboard"
 
-async def update_user_score_on_solve(
-    db: AsyncSession,
-    user_id: int,
-    points: int,
-) -> None:
-    """문제 풀이 성공 시 유저의 점수와 풀이 수를 업데이트한다.
-
-    Args:
-        db: DB 세션.
-        user_id: 유저 ID.
-        points: 획득 점수.
-    """
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if not user:
-        return
 
-    user.total_score += points
-    user.solved_count += 1
-    await db.flush()
+def invalidate_score_caches(db: AsyncSession, user_id: int) -> None:
+    """커밋 후 스코어보드와 유저 대시보드 응답 캐시를 무효화하도록 예약한다."""
+    response_cache.invalidate(db, SCOREBOARD_CACHE, DASHBOARD_CACHE.format(user_id=user_id))
 
 
 async def recalculate_user_score(
     db: AsyncSession,
     user_id: int,
 ) -> int:
-    """유저의 총 점수를 Submission 기반으로 재계산한다.
+    """유저의 총 점수를 풀이(solves) 기반으로 재계산한다.
 
     Args:
         db: DB 세션.
@@ -49,9 +38,9 @@ async def recalculate_user_score(
 
     result = await db.execute(
         select(func.coalesce(func.sum(Challenge.points), 0))
-        .select_from(Submission)
-        .join(Challenge, Submission.challenge_id == Challenge.id)
-        .where(Submission.user_id == user_id, Submission.is_correct.is_(True))
+        .select_from(Solve)
+        .join(Challenge, Solve.challenge_id == Challenge.id)
+        .where(Solve.user_id == user_id)
     )
     total = result.scalar_one()
 
@@ -60,6 +49,7 @@ async def recalculate_user_score(
     if user:
         user.total_score = total
         await db.flush()
+        invalidate_score_caches(db, user_id)
 
     return total
 
@@ -86,13 +76,13 @@ async def get_scoreboard(
             select(
                 User.id,
                 User.username,
-                func.count(Submission.id).label("solved_count"),
+                func.count(Solve.challenge_id).label("solved_count"),
                 func.coalesce(func.sum(Challenge.points), 0).label("total_score"),
             )
             .select_from(User)
-            .join(Submission, Submission.user_id == User.id)
-            .join(Challenge, Submission.challenge_id == Challenge.id)
-            .where(Submission.is_correct.is_(True), Challenge.category == category)
+            .join(Solve, Solve.user_id == User.id)
+            .join(Challenge, Solve.challenge_id == Challenge.id)
+            .where(Challenge.category == category)
             .group_by(User.id, User.username)
             .order_by(func.sum(Challenge.points).desc())
             .limit(limit)
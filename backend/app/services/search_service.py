@@ -0,0 +1,105 @@
+"""전문 검색(Full-text search) 서비스 모듈.
+
+챌린지(제목/태그/설명)와 Write-up 본문의 생성 컬럼 search_vector(tsvector)를
+GIN 인덱스로 검색한다. 한국어 형태소 분석기가 없으므로 'simple' 설정으로
+토큰을 소문자화만 하고, 검색어 토큰은 접두어(:*)로 매칭한다.
+전문 검색으로 찾지 못하는 오타 등은 pg_trgm 단어 유사도(%>) 매칭으로 보완한다.
+
+결과는 순위 내림차순이며 (순위, id) keyset 커서로 페이지를 넘긴다.
+"""
+
+import hashlib
+import re
+from typing import Any
+
+from sqlalchemy import Float, cast, func, literal, or_, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.exceptions import BadRequestException
+from app.core.pagination import decode_cursor
+
+TS_CONFIG = "simple"
+MAX_QUERY_TOKENS = 8
+
+# 'simple' 파서와 같이 밑줄/구두점에서 토큰을 나눈다
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def build_tsquery_text(term: str) -> str | None:
+    """검색어를 접두어 매칭 tsquery 문자열로 변환한다.
+
+    Args:
+        term: 사용자 검색어.
+
+    Returns:
+        `tok1:* & tok2:*` 형태의 문자열. 토큰이 없으면 None.
+    """
+    tokens = _TOKEN.findall(term.lower())[:MAX_QUERY_TOKENS]
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def match(
+    vector: ColumnElement,
+    term: str,
+    fuzzy_column: ColumnElement | None = None,
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """검색 조건과 순위 식을 만든다.
+
+    Args:
+        vector: tsvector 컬럼.
+        term: 사용자 검색어.
+        fuzzy_column: pg_trgm 유사도 매칭을 함께 적용할 텍스트 컬럼.
+
+    Returns:
+        (WHERE 조건, 순위 식) 튜플. 순위는 ts_rank_cd와 단어 유사도의 합이다.
+    """
+    conditions = []
+    rank: ColumnElement = literal(0.0)
+
+    query_text = build_tsquery_text(term)
+    if query_text is not None:
+        tsquery = func.to_tsquery(cast(literal(TS_CONFIG), REGCONFIG), query_text)
+        conditions.append(vector.op("@@")(tsquery))
+        rank = func.ts_rank_cd(vector, tsquery)
+    if fuzzy_column is not None:
+        # 검색어와 컬럼 내 가장 비슷한 단어 구간의 유사도 (`컬럼 %> 검색어`)
+        conditions.append(fuzzy_column.op("%>")(term))
+        rank = rank + func.word_similarity(term, fuzzy_column)
+
+    if not conditions:
+        return literal(False), rank
+    # real 순위를 double로 맞춰 커서 값과 정확히 비교되게 한다
+    return or_(*conditions), cast(rank, Float)
+
+
+def cursor_kind(scope: str, term: str, *filters: Any) -> str:
+    """검색 범위/검색어/필터에 묶인 커서 종류 문자열을 만든다.
+
+    다른 검색어의 커서를 재사용하지 못하도록 검색어 해시를 포함한다.
+    """
+    key = "\x00".join([term, *(str(f) for f in filters)])
+    return f"search:{scope}:{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}"
+
+
+def after_cursor(
+    rank: ColumnElement[float],
+    id_column: ColumnElement[int],
+    cursor: str,
+    kind: str,
+) -> ColumnElement[bool]:
+    """커서 이후(순위 내림차순, id 내림차순) 행을 고르는 조건을 반환한다.
+
+    Raises:
+        BadRequestException: 커서가 유효하지 않을 때.
+    """
+    values = decode_cursor(cursor, kind)
+    if (
+        len(values) != 2
+        or not isinstance(values[0], (int, float))
+        or not isinstance(values[1], int)
+    ):
+        raise BadRequestException("유효하지 않은 커서입니다.")
+    return tuple_(rank, id_column) < tuple_(float(values[0]), values[1])
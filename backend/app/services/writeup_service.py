@@ -1,35 +1,196 @@
 """Write-up 서비스 모듈.
 
 Write-up CRUD, 솔브 확인, HTML sanitize 로직을 처리한다.
+
+본문은 저장 시 한 번 sanitize하고 렌더링한 HTML(content_html)을 함께 저장하여
+조회할 때마다 Markdown을 렌더링하지 않는다.
+
+조회는 응답에 필요한 컬럼만 가져오는 projection 쿼리(작성자 username,
+챌린지 title 조인)를 사용하고, 목록은 keyset 커서로 페이지를 넘긴다.
+공개 Write-up 수는 Redis에 잠시 캐시하고, Write-up이 바뀌면 커밋 후 지운다.
+Write-up이 바뀌면 커밋 후 WRITEUP_CACHE 버전을 올린다 (HTTP ETag 계산용).
+
+추천은 writeup_votes에 유저당 한 행으로 기록하고, 추천 수 증가분은 Redis 해시에
+모아 둔다. 주기 태스크는 해시에 있는 Write-up의 upvotes를 writeup_votes 행 수로
+다시 계산하므로 (증가분을 더하지 않으므로) 같은 해시를 두 번 반영해도 결과가 같다.
+조회 시에는 DB 값에 미반영 증가분을 더해 보여준다. most_upvoted 정렬은 DB 값 기준이다.
 """
 
-import re
+import asyncio
+import logging
+from datetime import datetime
 
-from sqlalchemy import func, select
+from redis.exceptions import RedisError
+from sqlalchemy import Row, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.exceptions import (
     BadRequestException,
     ForbiddenException,
     NotFoundException,
 )
-from app.models.writeup import Writeup
+from app.core import post_commit, response_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.redis import get_redis_client
+from app.core.sanitizer import render_markdown, sanitize_markdown
+from app.models.challenge import Challenge
+from app.models.user import User
+from app.models.writeup import Writeup, WriteupVote
+from app.services import search_service
 from app.services.challenge_service import check_already_solved, get_challenge_by_id
 
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+COUNT_CACHE_TTL_SECONDS = 60
+
+# 커밋 후 공개 Write-up 수 캐시를 지울 챌린지 ID
+_COUNTS_KEY = "writeup_counts"
+
+# Write-up 목록/본문/추천 수 변경 시 올리는 응답 캐시 네임스페이스
+WRITEUP_CACHE = "writeups"
+
+# 추천 수는 Redis 해시에 증가분으로 모았다가 주기적으로 DB에 일괄 반영한다
+PENDING_UPVOTES_KEY = "writeup:upvotes:pending"
+FLUSHING_UPVOTES_KEY = "writeup:upvotes:flushing"
+
+# KEYS[1]=대기 해시, KEYS[2]=반영 중 해시
+_TAKE_PENDING_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+  if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {}
+  end
+  redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+_take_script = None
+
+# 정렬별 keyset 키 (모두 같은 방향이어야 행 비교를 사용할 수 있다)
+_SORT_KEYS = {
+    "newest": ((Writeup.created_at, Writeup.id), True),
+    "oldest": ((Writeup.created_at, Writeup.id), False),
+    "most_upvoted": ((Writeup.upvotes, Writeup.created_at, Writeup.id), True),
+}
+
+
+# 목록 응답에 담는 본문 앞부분 길이 (전체 본문은 상세 조회로 가져온다)
+EXCERPT_LENGTH = 300
+
+_SUMMARY_COLUMNS = (
+    Writeup.id,
+    Writeup.user_id,
+    User.username,
+    Writeup.challenge_id,
+    Challenge.title.label("challenge_title"),
+    Writeup.is_public,
+    Writeup.upvotes,
+    Writeup.created_at,
+    Writeup.updated_at,
+)
+
+
+def _view_query():
+    """상세 응답에 필요한 컬럼(본문 포함)만 조회하는 쿼리를 반환한다."""
+    return (
+        select(*_SUMMARY_COLUMNS, Writeup.content, Writeup.content_html)
+        .join(User, User.id == Writeup.user_id)
+        .join(Challenge, Challenge.id == Writeup.challenge_id)
+    )
+
+
+def _summary_query():
+    """목록 응답용 쿼리를 반환한다.
+
+    본문(content)과 렌더링된 HTML(content_html)은 TOAST에 저장되는 큰 컬럼이므로
+    읽지 않고, 미리보기용 앞부분만 substr로 잘라 가져온다.
+    """
+    return (
+        select(
+            *_SUMMARY_COLUMNS,
+            func.substr(Writeup.content, 1, EXCERPT_LENGTH).label("excerpt"),
+        )
+        .join(User, User.id == Writeup.user_id)
+        .join(Challenge, Challenge.id == Writeup.challenge_id)
+    )
+
+
+def _decode_sort_cursor(cursor: str, sort: str, keys: tuple) -> list:
+    """목록 커서를 디코드하고 값 타입을 정렬 키 컬럼 타입과 대조한다.
+
+    Raises:
+        BadRequestException: 커서가 손상되었거나 값의 개수/타입이 맞지 않을 때.
+    """
+    values = decode_cursor(cursor, sort)
+    if len(values) != len(keys):
+        raise BadRequestException("유효하지 않은 커서입니다.")
+    for value, key in zip(values, keys):
+        expected = key.type.python_type
+        if (
+            isinstance(value, bool)
+            or not isinstance(value, expected)
+            or (isinstance(value, datetime) and value.tzinfo is None)
+        ):
+            raise BadRequestException("유효하지 않은 커서입니다.")
+    return values
+
+
+def _count_key(challenge_id: int | None) -> str:
+    return f"writeups:count:{challenge_id or 'all'}"
+
+
+def _invalidate_counts(db: AsyncSession, challenge_id: int) -> None:
+    """트랜잭션 커밋 후 지울 공개 Write-up 수 캐시를 세션에 쌓아둔다."""
+    post_commit.pending(db.sync_session, _COUNTS_KEY, set).add(challenge_id)
+
+
+async def _drop_counts(challenge_ids: set[int]) -> None:
+    """커밋된 변경이 있는 챌린지의 공개 Write-up 수 캐시를 지운다."""
+    redis = get_redis_client()
+    if redis is None:
+        return
+    try:
+        await redis.delete(_count_key(None), *map(_count_key, challenge_ids))
+    except RedisError:
+        logger.warning("Write-up 수 캐시 무효화 실패: challenges=%s", sorted(challenge_ids))
+
+
+post_commit.register(_COUNTS_KEY, _drop_counts)
+
+
+async def render_content(content: str) -> str | None:
+    """sanitize된 본문을 저장용 HTML로 렌더링한다.
+
+    렌더링은 CPU 작업이므로 스레드에서 실행한다. Markdown 파서는 일부 병적 입력에서
+    선형보다 느리므로 WRITEUP_RENDER_MAX_CHARS보다 긴 본문은 렌더링하지 않는다.
+
+    Args:
+        content: sanitize된 본문.
+
+    Returns:
+        렌더링된 HTML. 너무 길면 None (클라이언트가 렌더링).
+    """
+    if len(content) > settings.WRITEUP_RENDER_MAX_CHARS:
+        return None
+    return await asyncio.to_thread(render_markdown, content)
+
 
 def sanitize_content(content: str) -> str:
     """Write-up 콘텐츠에서 위험한 HTML 태그를 제거한다.
 
+    토크나이저 기반 단일 패스로 동작하여 입력 길이에 선형 시간이 걸린다.
+
     Args:
         content: 원본 콘텐츠.
 
     Returns:
         sanitize된 콘텐츠.
     """
-    content = re.sub(r"<script[^>]*>.*?</script>", "", content, flags=re.DOTALL | re.IGNORECASE)
-    content = re.sub(r"on\w+\s*=", "", content, flags=re.IGNORECASE)
-    content = re.sub(r"javascript:", "", content, flags=re.IGNORECASE)
-    return content
+    return sanitize_markdown(content)
 
 
 async def create_writeup(
@@ -69,14 +230,18 @@ async def create_writeup(
     # 챌린지 존재 확인
     await get_challenge_by_id(db, challenge_id)
 
+    content = sanitize_content(content)
     writeup = Writeup(
         user_id=user_id,
         challenge_id=challenge_id,
-        content=sanitize_content(content),
+        content=content,
+        content_html=await render_content(content),
         is_public=is_public,
     )
     db.add(writeup)
     await db.flush()
+    _invalidate_counts(db, challenge_id)
+    response_cache.invalidate(db, WRITEUP_CACHE)
     return writeup
 
 
@@ -108,10 +273,13 @@ async def update_writeup(
 
     if content is not None:
         writeup.content = sanitize_content(content)
-    if is_public is not None:
+        writeup.content_html = await render_content(writeup.content)
+    if is_public is not None and is_public != writeup.is_public:
         writeup.is_public = is_public
+        _invalidate_counts(db, writeup.challenge_id)
 
     await db.flush()
+    response_cache.invalidate(db, WRITEUP_CACHE)
     return writeup
 
 
@@ -136,6 +304,8 @@ async def delete_writeup(
 
     await db.delete(writeup)
     await db.flush()
+    _invalidate_counts(db, writeup.challenge_id)
+    response_cache.invalidate(db, WRITEUP_CACHE)
 
 
 async def get_writeup(db: AsyncSession, writeup_id: int) -> Writeup:
@@ -155,68 +325,303 @@ async def get_writeup(db: AsyncSession, writeup_id: int) -> Writeup:
     return writeup
 
 
+async def get_writeup_view(db: AsyncSession, writeup_id: int) -> dict:
+    """Write-up 응답용 projection 데이터를 조회한다.
+
+    Args:
+        db: DB 세션.
+        writeup_id: Write-up ID.
+
+    Returns:
+        username, challenge_title을 포함한 딕셔너리 (추천 수는 미반영분 포함).
+    """
+    result = await db.execute(_view_query().where(Writeup.id == writeup_id))
+    row = result.first()
+    if row is None:
+        raise NotFoundException("Write-up을 찾을 수 없습니다.")
+    return (await _with_pending_upvotes([row]))[0]
+
+
+async def count_public_writeups(db: AsyncSession, challenge_id: int | None = None) -> int:
+    """공개 Write-up 수를 반환한다 (Redis에 COUNT_CACHE_TTL_SECONDS 동안 캐시).
+
+    Args:
+        db: DB 세션.
+        challenge_id: 챌린지 필터.
+
+    Returns:
+        공개 Write-up 수.
+    """
+    redis = get_redis_client()
+    key = _count_key(challenge_id)
+    if redis is not None:
+        try:
+            cached = await redis.get(key)
+            if cached is not None:
+                return int(cached)
+        except RedisError:
+            redis = None
+
+    count_query = select(func.count(Writeup.id)).where(Writeup.is_public.is_(True))
+    if challenge_id:
+        count_query = count_query.where(Writeup.challenge_id == challenge_id)
+    total = (await db.execute(count_query)).scalar() or 0
+
+    if redis is not None:
+        try:
+            await redis.set(key, total, ex=COUNT_CACHE_TTL_SECONDS)
+        except RedisError:
+            pass
+    return total
+
+
 async def list_writeups(
     db: AsyncSession,
     challenge_id: int | None = None,
     sort: str = "newest",
     limit: int = 20,
     offset: int = 0,
-) -> tuple[list[Writeup], int]:
+    cursor: str | None = None,
+) -> tuple[list[dict], int, str | None]:
     """Write-up 목록을 조회한다.
 
+    cursor가 주어지면 해당 위치 다음부터 keyset 방식으로 읽는다.
+    offset은 기존 클라이언트 호환을 위해 cursor가 없을 때만 적용한다.
+
     Args:
         db: DB 세션.
         challenge_id: 챌린지 필터.
         sort: 정렬 기준 (newest, oldest, most_upvoted).
         limit: 페이지당 개수.
-        offset: 오프셋.
+        offset: 오프셋 (호환용).
+        cursor: 이전 응답의 next_cursor.
 
     Returns:
-        (Write-up 목록, 전체 개수) 튜플.
+        (Write-up 요약 딕셔너리 목록, 전체 개수, 다음 페이지 커서) 튜플.
+
+    Raises:
+        BadRequestException: 커서가 유효하지 않을 때.
     """
-    query = select(Writeup).where(Writeup.is_public.is_(True))
-    count_query = select(func.count(Writeup.id)).where(Writeup.is_public.is_(True))
+    keys, descending = _SORT_KEYS.get(sort, _SORT_KEYS["newest"])
 
+    query = _summary_query().where(Writeup.is_public.is_(True))
     if challenge_id:
         query = query.where(Writeup.challenge_id == challenge_id)
-        count_query = count_query.where(Writeup.challenge_id == challenge_id)
 
-    if sort == "most_upvoted":
-        query = query.order_by(Writeup.upvotes.desc(), Writeup.created_at.desc())
-    elif sort == "oldest":
-        query = query.order_by(Writeup.created_at.asc())
-    else:
-        query = query.order_by(Writeup.created_at.desc())
+    if cursor:
+        values = _decode_sort_cursor(cursor, sort, keys)
+        if descending:
+            query = query.where(tuple_(*keys) < tuple_(*values))
+        else:
+            query = query.where(tuple_(*keys) > tuple_(*values))
+    elif offset:
+        query = query.offset(offset)
 
-    query = query.offset(offset).limit(limit)
+    query = query.order_by(*(k.desc() if descending else k.asc() for k in keys))
+    result = await db.execute(query.limit(limit + 1))
+    rows = list(result.all())
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, [getattr(last, k.key) for k in keys])
 
-    result = await db.execute(query)
-    writeups = list(result.scalars().all())
+    total = await count_public_writeups(db, challenge_id)
+    return await _with_pending_upvotes(rows), total, next_cursor
 
-    return writeups, total
+
+async def search_writeups(
+    db: AsyncSession,
+    term: str,
+    challenge_id: int | None = None,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """공개 Write-up 본문을 검색어 관련도 순으로 조회한다.
+
+    Args:
+        db: DB 세션.
+        term: 검색어.
+        challenge_id: 챌린지 필터.
+        limit: 페이지당 개수.
+        cursor: 이전 응답의 next_cursor.
+
+    Returns:
+        (Write-up 요약 딕셔너리 목록, 다음 페이지 커서) 튜플.
+    """
+    condition, rank = search_service.match(Writeup.search_vector, term)
+    query = (
+        _summary_query()
+        .add_columns(rank.label("rank"))
+        .where(Writeup.is_public.is_(True), condition)
+    )
+    if challenge_id:
+        query = query.where(Writeup.challenge_id == challenge_id)
+
+    kind = search_service.cursor_kind("writeups", term, challenge_id)
+    if cursor:
+        query = query.where(search_service.after_cursor(rank, Writeup.id, cursor, kind))
+
+    query = query.order_by(rank.desc(), Writeup.id.desc()).limit(limit + 1)
+    rows = list((await db.execute(query)).all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(kind, [rows[-1].rank, rows[-1].id])
+    return await _with_pending_upvotes(rows), next_cursor
 
 
 async def upvote_writeup(
     db: AsyncSession,
     writeup_id: int,
-) -> Writeup:
-    """Write-up에 추천을 한다.
+    user_id: int,
+) -> bool:
+    """Write-up 추천을 기록한다 (유저당 한 번).
+
+    추천 수 반영은 커밋 후 record_upvote()로 한다.
 
     Args:
         db: DB 세션.
         writeup_id: Write-up ID.
+        user_id: 추천한 유저 ID.
 
     Returns:
-        업데이트된 Writeup 객체.
+        새로 추천했으면 True, 이미 추천한 상태면 False.
     """
-    result = await db.execute(select(Writeup).where(Writeup.id == writeup_id))
-    writeup = result.scalar_one_or_none()
-    if not writeup:
+    exists = await db.execute(select(Writeup.id).where(Writeup.id == writeup_id))
+    if exists.scalar_one_or_none() is None:
         raise NotFoundException("Write-up을 찾을 수 없습니다.")
 
-    writeup.upvotes += 1
-    await db.flush()
-    return writeup
+    result = await db.execute(
+        pg_insert(WriteupVote)
+        .values(user_id=user_id, writeup_id=writeup_id)
+        .on_conflict_do_nothing()
+        .returning(WriteupVote.writeup_id)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+async def record_upvote(db: AsyncSession, writeup_id: int) -> None:
+    """커밋된 추천을 추천 수에 반영한다.
+
+    Redis가 있으면 대기 중 증가분 해시에 HINCRBY만 하고 (행 잠금 없음),
+    주기 태스크가 DB에 일괄 반영한다. Redis가 없거나 실패하면
+    해당 Write-up의 추천 수를 바로 다시 계산한다.
+
+    추천마다 WRITEUP_CACHE 버전을 올리면 인기 Write-up 목록 캐시가 계속 비워지므로,
+    캐시된 응답의 추천 수는 주기 태스크가 반영한 뒤 버전을 올릴 때 갱신된다.
+
+    Args:
+        db: DB 세션.
+        writeup_id: Write-up ID.
+    """
+    redis = get_redis_client()
+    if redis is not None:
+        try:
+            await redis.hincrby(PENDING_UPVOTES_KEY, str(writeup_id), 1)
+            return
+        except RedisError:
+            logger.warning("추천 수 캐시 반영 실패 — DB에 직접 반영: writeup=%d", writeup_id)
+
+    await recount_upvotes(db, [writeup_id])
+    response_cache.invalidate(db, WRITEUP_CACHE)
+    await db.commit()
+
+
+async def _pending_upvotes(writeup_ids: list[int]) -> dict[int, int]:
+    """아직 DB에 반영되지 않은 추천 증가분을 조회한다 (반영 중인 것 포함)."""
+    redis = get_redis_client()
+    if redis is None or not writeup_ids:
+        return {}
+    fields = [str(i) for i in writeup_ids]
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.hmget(PENDING_UPVOTES_KEY, fields)
+        pipe.hmget(FLUSHING_UPVOTES_KEY, fields)
+        pending, flushing = await pipe.execute()
+    except RedisError:
+        return {}
+    return {
+        writeup_id: int(a or 0) + int(b or 0)
+        for writeup_id, a, b in zip(writeup_ids, pending, flushing)
+        if a or b
+    }
+
+
+async def _with_pending_upvotes(rows: list[Row]) -> list[dict]:
+    """projection 행에 미반영 추천 증가분을 더한 딕셔너리 목록을 반환한다."""
+    deltas = await _pending_upvotes([row.id for row in rows])
+    items = []
+    for row in rows:
+        item = row._asdict()
+        item["upvotes"] += deltas.get(row.id, 0)
+        items.append(item)
+    return items
+
+
+async def take_pending_upvotes() -> dict[int, int]:
+    """DB에 반영할 추천 증가분을 가져온다.
+
+    대기 해시를 반영 중 해시로 원자적으로 옮긴다. 이전 반영이 실패해
+    반영 중 해시가 남아 있으면 그것을 먼저 다시 반환한다.
+
+    Returns:
+        {writeup_id: 증가분}. Redis가 없으면 빈 딕셔너리.
+    """
+    global _take_script
+    redis = get_redis_client()
+    if redis is None:
+        return {}
+    if _take_script is None:
+        _take_script = redis.register_script(_TAKE_PENDING_SCRIPT)
+    flat = await _take_script(keys=[PENDING_UPVOTES_KEY, FLUSHING_UPVOTES_KEY])
+    return {int(flat[i]): int(flat[i + 1]) for i in range(0, len(flat), 2)}
+
+
+async def recount_upvotes(db: AsyncSession, writeup_ids: list[int] | None = None) -> int:
+    """추천 수를 legacy_upvotes + writeup_votes 행 수로 다시 계산한다.
+
+    증가분을 더하지 않고 절대값으로 덮어쓰므로, 같은 Write-up을 여러 번 (또는 동시에)
+    다시 계산해도 결과가 같다. 값이 바뀐 행만 갱신하며 updated_at은 건드리지 않는다.
+
+    Args:
+        db: DB 세션.
+        writeup_ids: 다시 계산할 Write-up ID 목록. None이면 전체.
+
+    Returns:
+        갱신된 Write-up 수.
+    """
+    if writeup_ids is not None and not writeup_ids:
+        return 0
+    params = {}
+    scope = ""
+    if writeup_ids is not None:
+        scope = "WHERE w2.id = ANY(CAST(:ids AS integer[]))"
+        params["ids"] = list(writeup_ids)
+    result = await db.execute(
+        text(
+            f"""
+            UPDATE writeups AS w
+            SET upvotes = w.legacy_upvotes + c.votes
+            FROM (
+                SELECT w2.id, count(v.writeup_id) AS votes
+                FROM writeups AS w2
+                LEFT JOIN writeup_votes AS v ON v.writeup_id = w2.id
+                {scope}
+                GROUP BY w2.id
+            ) AS c
+            WHERE w.id = c.id AND w.upvotes <> w.legacy_upvotes + c.votes
+            """
+        ),
+        params,
+    )
+    return result.rowcount or 0
+
+
+async def clear_flushed_upvotes() -> None:
+    """DB 반영이 커밋된 뒤 반영 중 해시를 지운다."""
+    redis = get_redis_client()
+    if redis is not None:
+        await redis.delete(FLUSHING_UPVOTES_KEY)
@@ -0,0 +1,34 @@
+"""관리자 대시보드 관련 Celery 비동기 태스크.
+
+대시보드 통계를 주기적으로 집계해 스냅샷으로 저장한다.
+"""
+
+import logging
+
+from app.tasks import run_async, task_decorator
+
+logger = logging.getLogger(__name__)
+
+
+@task_decorator("app.tasks.admin_tasks.refresh_admin_stats")
+def refresh_admin_stats() -> dict:
+    """관리자 대시보드 통계 스냅샷을 갱신하는 주기적 태스크.
+
+    Returns:
+        스냅샷 집계 시각.
+    """
+    return run_async(_refresh())
+
+
+async def _refresh() -> dict:
+    """통계 스냅샷 갱신 비동기 래퍼."""
+    from app.database import background_session_factory
+    from app.services import admin_service
+
+    async with background_session_factory() as db:
+        try:
+            stats = await admin_service.refresh_stats_snapshot(db)
+        except Exception:
+            logger.exception("관리자 통계 스냅샷 갱신 중 오류 발생")
+            return {"computed_at": None}
+    return {"computed_at": stats["computed_at"]}
@@ -22,10 +22,10 @@ def cleanup_expired_containers() -> dict:
 
 async def _cleanup() -> int:
     """만료 인스턴스 정리 비동기 래퍼."""
-    from app.database import async_session_factory
+    from app.database import background_session_factory
     from app.services import container_service
 
-    async with async_session_factory() as db:
+    async with background_session_factory() as db:
         try:
             count = await container_service.cleanup_expired(db)
             await db.commit()
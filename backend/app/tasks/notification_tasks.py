@@ -0,0 +1,77 @@
+"""알림 정리 관련 Celery 비동기 태스크.
+
+notifications 테이블이 무한히 커지지 않도록 보존 기간과 유저당 보관 수를 유지한다.
+"""
+
+import logging
+
+from app.tasks import run_async, task_decorator
+
+logger = logging.getLogger(__name__)
+
+# 한 트랜잭션에서 삭제할 최대 행 수 (긴 잠금과 WAL 폭증 방지)
+_DELETE_BATCH_SIZE = 10000
+# 보관 수 초과 정리 시 한 트랜잭션에서 처리할 유저 수
+_TRIM_USER_BATCH_SIZE = 500
+
+
+@task_decorator("app.tasks.notification_tasks.compact_notifications")
+def compact_notifications() -> dict:
+    """오래된 알림을 정리하는 주기적 태스크.
+
+    1. NOTIFICATION_RETENTION_DAYS가 지난 읽은 알림을 배치 단위로 삭제
+    2. 유저당 NOTIFICATION_MAX_PER_USER를 넘는 오래된 알림 삭제 (읽음 여부 무관)
+    3. 보존 기간이 지난 브로드캐스트 알림 삭제
+
+    Returns:
+        단계별 삭제 결과 딕셔너리.
+    """
+    return run_async(_compact())
+
+
+async def _compact() -> dict:
+    """알림 정리 비동기 래퍼."""
+    from app.database import background_session_factory
+    from app.services import notification_service
+
+    expired = 0
+    trimmed_users = 0
+    broadcasts = 0
+    async with background_session_factory() as db:
+        try:
+            while True:
+                user_ids = await notification_service.delete_expired_read_batch(
+                    db, _DELETE_BATCH_SIZE
+                )
+                await db.commit()
+                if not user_ids:
+                    break
+                expired += len(user_ids)
+                # 목록이 바뀌었으므로 버전을 올린다 (카운터는 다음 조회 시 재계산)
+                await notification_service.invalidate_users(set(user_ids))
+
+            while True:
+                user_ids = await notification_service.trim_users_over_cap(
+                    db, _TRIM_USER_BATCH_SIZE
+                )
+                await db.commit()
+                if not user_ids:
+                    break
+                trimmed_users += len(user_ids)
+                await notification_service.invalidate_users(set(user_ids))
+
+            broadcasts = await notification_service.delete_expired_broadcasts(db)
+            await db.commit()
+            if broadcasts:
+                await notification_service.invalidate_users({notification_service.BROADCAST})
+        except Exception:
+            await db.rollback()
+            logger.exception("알림 정리 중 오류 발생")
+
+    logger.info(
+        "알림 정리 완료: 만료 %d건, 보관 수 초과 유저 %d명, 브로드캐스트 %d건",
+        expired,
+        trimmed_users,
+        broadcasts,
+    )
+    return {"expired": expired, "trimmed_users": trimmed_users, "broadcasts": broadcasts}
@@ -0,0 +1,51 @@
+"""제출 파티션 관리 관련 Celery 비동기 태스크.
+
+submissions 월별 파티션을 미리 만들고, 보존 기간이 지난 파티션을 보관 파일로 옮긴다.
+"""
+
+import logging
+
+from app.tasks import run_async, task_decorator
+
+logger = logging.getLogger(__name__)
+
+
+@task_decorator("app.tasks.partition_tasks.maintain_submission_partitions")
+def maintain_submission_partitions() -> dict:
+    """제출 파티션을 유지하는 주기적 태스크.
+
+    1. 이번 달부터 SUBMISSION_PARTITION_MONTHS_AHEAD개월 뒤까지 파티션 생성
+    2. SUBMISSION_RETENTION_MONTHS가 지난 파티션을 SUBMISSION_ARCHIVE_DIR에 CSV.gz로
+       내보낸 뒤 분리/삭제 (0이면 건너뜀)
+
+    Returns:
+        생성/보관된 파티션 결과 딕셔너리.
+    """
+    return run_async(_maintain())
+
+
+async def _maintain() -> dict:
+    """제출 파티션 유지 비동기 래퍼."""
+    from app.config import get_settings
+    from app.database import background_session_factory
+    from app.services import partition_service
+
+    settings = get_settings()
+    created: list[str] = []
+    archived: list[str] = []
+    async with background_session_factory() as db:
+        try:
+            created = await partition_service.ensure_partitions(
+                db, settings.SUBMISSION_PARTITION_MONTHS_AHEAD
+            )
+            await db.commit()
+            paths = await partition_service.archive_expired_partitions(
+                db, settings.SUBMISSION_RETENTION_MONTHS, settings.SUBMISSION_ARCHIVE_DIR
+            )
+            archived = [path.name for path in paths]
+        except Exception:
+            await db.rollback()
+            logger.exception("제출 파티션 유지 중 오류 발생")
+
+    logger.info("제출 파티션 유지 완료: 생성 %s, 보관 %s", created, archived)
+    return {"created": created, "archived": archived}
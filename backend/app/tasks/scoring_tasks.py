@@ -27,10 +27,12 @@ async def _recalculate_challenges() -> int:
     """동적 점수 재계산 비동기 래퍼."""
     from sqlalchemy import select
 
-    from app.database import async_session_factory
+    from app.core import response_cache
+    from app.database import background_session_factory
     from app.models.challenge import Challenge
+    from app.services import scoring_service
 
-    async with async_session_factory() as db:
+    async with background_session_factory() as db:
         try:
             result = await db.execute(
                 select(Challenge).where(Challenge.is_active.is_(True))
@@ -48,6 +50,9 @@ async def _recalculate_challenges() -> int:
                     updated += 1
 
             await db.commit()
+            if updated:
+                # 카테고리별 스코어보드는 챌린지 점수 합계로 계산된다
+                await response_cache.bump(scoring_service.SCOREBOARD_CACHE)
             logger.info("동적 점수 재계산 완료: %d건 업데이트", updated)
             return updated
         except Exception:
@@ -58,7 +63,7 @@ async def _recalculate_challenges() -> int:
 
 @task_decorator("app.tasks.scoring_tasks.recalculate_all_user_scores")
 def recalculate_all_user_scores() -> dict:
-    """모든 유저의 총 점수를 Submission 기반으로 재계산한다.
+    """모든 유저의 총 점수를 풀이(solves) 기반으로 재계산한다.
 
     점수 정합성 유지를 위한 태스크.
 
@@ -73,23 +78,25 @@ async def _recalculate_users() -> int:
     """유저 점수 재계산 비동기 래퍼."""
     from sqlalchemy import select, func
 
-    from app.database import async_session_factory
+    from app.core import response_cache
+    from app.database import background_session_factory
     from app.models.challenge import Challenge
-    from app.models.submission import Submission
+    from app.models.solve import Solve
     from app.models.user import User
+    from app.services import scoring_service
+    from app.services.dashboard_service import DASHBOARD_CACHE
 
-    async with async_session_factory() as db:
+    async with background_session_factory() as db:
         try:
-            # 유저별 맞은 제출의 점수 합산
+            # 유저별 풀이 점수 합산
             score_subq = (
                 select(
-                    Submission.user_id,
+                    Solve.user_id,
                     func.coalesce(func.sum(Challenge.points), 0).label("total"),
-                    func.count(Submission.id).label("solved"),
+                    func.count(Solve.challenge_id).label("solved"),
                 )
-                .join(Challenge, Submission.challenge_id == Challenge.id)
-                .where(Submission.is_correct.is_(True))
-                .group_by(Submission.user_id)
+                .join(Challenge, Solve.challenge_id == Challenge.id)
+                .group_by(Solve.user_id)
                 .subquery()
             )
 
@@ -104,15 +111,21 @@ async def _recalculate_users() -> int:
                 for row in scores_result.all()
             }
 
-            updated = 0
+            changed_ids = []
             for user in users:
                 total, solved = score_map.get(user.id, (0, 0))
                 if user.total_score != total or user.solved_count != solved:
                     user.total_score = total
                     user.solved_count = solved
-                    updated += 1
+                    changed_ids.append(user.id)
+            updated = len(changed_ids)
 
             await db.commit()
+            if changed_ids:
+                await response_cache.bump(
+                    scoring_service.SCOREBOARD_CACHE,
+                    *(DASHBOARD_CACHE.format(user_id=uid) for uid in changed_ids),
+                )
             logger.info("유저 점수 재계산 완료: %d건 업데이트", updated)
             return updated
         except Exception:
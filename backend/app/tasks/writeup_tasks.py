@@ -0,0 +1,81 @@
+"""Write-up 관련 Celery 비동기 태스크."""
+
+import logging
+
+from app.tasks import run_async, task_decorator
+
+logger = logging.getLogger(__name__)
+
+
+@task_decorator("app.tasks.writeup_tasks.flush_writeup_upvotes")
+def flush_writeup_upvotes() -> dict:
+    """Redis에 모인 추천 수 증가분을 DB에 일괄 반영하는 주기적 태스크.
+
+    Returns:
+        갱신된 Write-up 수.
+    """
+    count = run_async(_flush())
+    return {"updated": count}
+
+
+@task_decorator("app.tasks.writeup_tasks.recount_writeup_upvotes")
+def recount_writeup_upvotes() -> dict:
+    """전체 Write-up의 추천 수를 writeup_votes에서 다시 계산하는 주기적 태스크.
+
+    flush가 실패했거나 Redis 해시가 유실되어 어긋난 값을 바로잡는다.
+
+    Returns:
+        갱신된 Write-up 수.
+    """
+    count = run_async(_recount())
+    return {"updated": count}
+
+
+async def _flush() -> int:
+    """추천 수 반영 비동기 래퍼."""
+    from app.core import response_cache
+    from app.database import background_session_factory
+    from app.services import writeup_service
+
+    deltas = await writeup_service.take_pending_upvotes()
+    if not deltas:
+        return 0
+
+    async with background_session_factory() as db:
+        try:
+            # 증가분이 아니라 writeup_votes 기준으로 다시 계산하므로,
+            # 커밋 후 해시 삭제 전에 중단되어 같은 해시를 다시 반영해도 중복되지 않는다
+            updated = await writeup_service.recount_upvotes(db, list(deltas))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            # 반영 중 해시는 남겨두고 다음 실행에서 다시 시도한다
+            logger.exception("추천 수 반영 중 오류 발생")
+            return 0
+
+    await writeup_service.clear_flushed_upvotes()
+    # most_upvoted 정렬 순서가 바뀌었을 수 있다
+    await response_cache.bump(writeup_service.WRITEUP_CACHE)
+    logger.info("추천 수 반영 완료: %d건 (증가분 %d)", updated, sum(deltas.values()))
+    return updated
+
+
+async def _recount() -> int:
+    """추천 수 전체 재계산 비동기 래퍼."""
+    from app.core import response_cache
+    from app.database import background_session_factory
+    from app.services import writeup_service
+
+    async with background_session_factory() as db:
+        try:
+            updated = await writeup_service.recount_upvotes(db)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.exception("추천 수 재계산 중 오류 발생")
+            raise
+
+    if updated:
+        await response_cache.bump(writeup_service.WRITEUP_CACHE)
+        logger.warning("추천 수 불일치 보정: %d건", updated)
+    return updated
@@ -0,0 +1,67 @@
+"""Write-up 본문 재정리 및 HTML 사전 렌더링 백필.
+
+content_html이 없는 Write-up의 본문을 현재 sanitizer로 다시 정리하고,
+WRITEUP_RENDER_MAX_CHARS 이하이면 HTML을 렌더링해 저장한다 (저장 시와 같은 경로).
+id 순으로 배치마다 커밋하므로 중단한 뒤 다시 실행해도 된다.
+길이 제한을 넘는 본문은 HTML 없이 남으므로 다시 실행해도 정리만 반복된다.
+
+실행: python -m scripts.backfill_writeup_html [--batch 200]
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select, update
+
+from app.core import response_cache
+from app.database import async_session_factory
+from app.models.writeup import Writeup
+from app.services import writeup_service
+
+
+async def backfill(batch_size: int) -> tuple[int, int]:
+    """content_html이 없는 Write-up을 처리하고 (처리 수, 렌더링 수)를 반환한다."""
+    processed = rendered = 0
+    last_id = 0
+    async with async_session_factory() as db:
+        while True:
+            result = await db.execute(
+                select(Writeup.id, Writeup.content)
+                .where(Writeup.id > last_id, Writeup.content_html.is_(None))
+                .order_by(Writeup.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            for writeup_id, content in rows:
+                content = writeup_service.sanitize_content(content)
+                html = await writeup_service.render_content(content)
+                await db.execute(
+                    update(Writeup)
+                    .where(Writeup.id == writeup_id)
+                    .values(content=content, content_html=html, updated_at=Writeup.updated_at)
+                )
+                processed += 1
+                rendered += html is not None
+            await db.commit()
+            last_id = rows[-1].id
+            print(f"  ~id {last_id}: 처리 {processed}건, 렌더링 {rendered}건", flush=True)
+
+    if processed:
+        await response_cache.bump(writeup_service.WRITEUP_CACHE)
+    return processed, rendered
+
+
+def main() -> None:
+    """백필을 실행한다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=200)
+    args = parser.parse_args()
+
+    processed, rendered = asyncio.run(backfill(args.batch))
+    print(f"완료: 처리 {processed}건, 렌더링 {rendered}건")
+
+
+if __name__ == "__main__":
+    main()
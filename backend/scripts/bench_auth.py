@@ -0,0 +1,45 @@
+"""JWT 인증 오버헤드 마이크로 벤치마크.
+
+`get_current_user_id`가 요청마다 수행하는 토큰 검증 비용을
+캐시 미사용(jose/pyjwt)과 claims LRU 캐시 사용 시로 나누어 측정한다.
+
+실행: python -m scripts.bench_auth [반복 횟수]
+"""
+
+import sys
+import timeit
+
+from app.core import security
+
+
+def _bench(label: str, func, token: str, number: int) -> float:
+    """함수를 number회 실행하고 호출당 마이크로초를 출력한다."""
+    func(token)  # 워밍업 (캐시 채우기 포함)
+    elapsed = timeit.timeit(lambda: func(token), number=number)
+    per_call_us = elapsed / number * 1_000_000
+    print(f"  {label:<28} {per_call_us:>9.2f} us/req")
+    return per_call_us
+
+
+def main() -> None:
+    """벤치마크를 실행한다."""
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    token = security.create_access_token({"sub": "42"})
+
+    print(f"=== JWT 검증 벤치마크 ({number}회) ===")
+    backend = security.settings.JWT_BACKEND
+    baseline = _bench("decode_token (jose)", security.decode_token, token, number)
+
+    try:
+        security.settings.JWT_BACKEND = "pyjwt"
+        _bench("decode_token (pyjwt)", security.decode_token, token, number)
+    finally:
+        security.settings.JWT_BACKEND = backend
+
+    security.clear_token_cache()
+    cached = _bench("decode_token_cached (hit)", security.decode_token_cached, token, number)
+    print(f"\n  캐시 적용 시 {baseline / cached:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""동시 정답 제출 스트레스 테스트 / 처리량 비교.
+
+한 챌린지에 수백 명이 동시에 정답을 제출하는 상황(대회 시작 직후의 쉬운 문제)을 재현해
+정답 처리 방식별 정합성과 처리량을 비교한다.
+
+- legacy: 기존 방식. ORM 객체로 solve_count/total_score를 읽고 Python에서 더해 저장하며,
+  최초 풀이 여부는 solves 행 존재로 판단한다 (read-modify-write).
+- atomic: challenge_service.record_correct_solve. 단일 CTE 문장으로
+  풀이 수 증가 RETURNING → 풀이 기록 → 유저 점수 반영.
+
+방식마다 점검용 유저/챌린지를 새로 만들어(커밋) 실행하고 끝나면 삭제한다.
+검사 항목:
+- 풀이 수(solve_count) == solves 행 수 == 정답 처리 성공 수
+- First Blood 판정이 정확히 1건
+- 지급 점수가 순번 1..N의 동적 점수와 일치 (calculate_dynamic_points)
+- 유저 total_score/solved_count 합계가 solves와 일치
+- 같은 유저의 동시 중복 제출은 풀이 1건으로만 기록
+
+실행: python -m scripts.bench_concurrent_solves [--solvers 500] [--concurrency 32] [--duplicates 20]
+종료 코드: atomic 방식이 검사를 통과하지 못하면 1.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.config import get_settings
+from app.core.exceptions import ConflictException
+from app.models.challenge import Challenge
+from app.models.solve import Solve
+from app.models.submission import Submission
+from app.models.user import User
+from app.services import challenge_service
+
+PREFIX = "solve_bench_"
+MAX_POINTS, MIN_POINTS, DECAY = 500, 50, 1.5
+
+
+async def _legacy_solve(db: AsyncSession, user_id: int, challenge_id: int) -> tuple[int, bool]:
+    """기존 submit_flag의 정답 처리 (ORM read-modify-write)."""
+    challenge = await db.get(Challenge, challenge_id)
+    challenge.solve_count += 1
+    points = challenge_service.calculate_dynamic_points(
+        challenge.max_points, challenge.min_points, challenge.decay, challenge.solve_count
+    )
+    challenge.points = points
+
+    existing = await db.execute(
+        select(Solve.user_id).where(Solve.challenge_id == challenge_id).limit(1)
+    )
+    first_blood = existing.scalar_one_or_none() is None
+    db.add(Solve(user_id=user_id, challenge_id=challenge_id, points_awarded=points))
+
+    user = await db.get(User, user_id)
+    user.total_score += points
+    user.solved_count += 1
+    await db.flush()
+    return points, first_blood
+
+
+async def _atomic_solve(db: AsyncSession, user_id: int, challenge_id: int) -> tuple[int, bool]:
+    return await challenge_service.record_correct_solve(db, user_id, challenge_id)
+
+
+MODES = {"legacy": _legacy_solve, "atomic": _atomic_solve}
+
+
+async def _seed(engine: AsyncEngine, solvers: int) -> tuple[list[int], int]:
+    """점검용 유저와 챌린지를 만들고 커밋한다."""
+    async with engine.begin() as conn:
+        await _cleanup(conn)
+        result = await conn.execute(
+            text(
+                """
+                INSERT INTO users (username, email, password_hash, total_score, solved_count)
+                SELECT :prefix || i, :prefix || i || '@example.com', 'x', 0, 0
+                FROM generate_series(1, :solvers) AS i
+                RETURNING id
+                """
+            ),
+            {"prefix": PREFIX, "solvers": solvers},
+        )
+        user_ids = sorted(result.scalars().all())
+        challenge_id = await conn.scalar(
+            text(
+                """
+                INSERT INTO challenges
+                    (title, description, category, difficulty, flag_hash,
+                     points, max_points, min_points, decay, solve_count)
+                VALUES (:title, 'solve bench', 'misc', 1, md5('solve bench'),
+                        :max_points, :max_points, :min_points, :decay, 0)
+                RETURNING id
+                """
+            ),
+            {
+                "title": f"{PREFIX}challenge",
+                "max_points": MAX_POINTS,
+                "min_points": MIN_POINTS,
+                "decay": DECAY,
+            },
+        )
+    return user_ids, challenge_id
+
+
+async def _cleanup(conn) -> None:
+    """점검용 데이터를 삭제한다 (solves/submissions는 CASCADE)."""
+    await conn.execute(text("DELETE FROM challenges WHERE title LIKE :p"), {"p": f"{PREFIX}%"})
+    await conn.execute(text("DELETE FROM users WHERE username LIKE :p"), {"p": f"{PREFIX}%"})
+
+
+async def _submit(engine: AsyncEngine, solve, user_id: int, challenge_id: int) -> dict:
+    """정답 제출 한 건을 한 트랜잭션으로 처리한다 (submit_flag의 정답 경로와 같은 순서)."""
+    started = time.perf_counter()
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        db.add(
+            Submission(
+                user_id=user_id,
+                challenge_id=challenge_id,
+                submitted_flag="FLAG{solve_bench}",
+                is_correct=True,
+            )
+        )
+        try:
+            points, first_blood = await solve(db, user_id, challenge_id)
+            await db.commit()
+            outcome = "solved"
+        except ConflictException:
+            # atomic: 풀이 기록만 savepoint로 롤백되고 시도 로그는 커밋된다
+            await db.commit()
+            outcome, points, first_blood = "duplicate", 0, False
+        except IntegrityError as exc:
+            await db.rollback()
+            outcome = "duplicate" if "solves_pkey" in str(exc.orig) else "error"
+            points, first_blood = 0, False
+        except Exception:
+            await db.rollback()
+            outcome, points, first_blood = "error", 0, False
+    return {
+        "outcome": outcome,
+        "points": points,
+        "first_blood": first_blood,
+        "latency": time.perf_counter() - started,
+    }
+
+
+async def _verify(engine: AsyncEngine, challenge_id: int, results: list[dict]) -> list[str]:
+    """DB 상태와 처리 결과를 대조해 문제 목록을 반환한다."""
+    problems = []
+    async with engine.connect() as conn:
+        solve_count = await conn.scalar(
+            text("SELECT solve_count FROM challenges WHERE id = :cid"), {"cid": challenge_id}
+        )
+        awarded = (
+            await conn.execute(
+                text("SELECT points_awarded FROM solves WHERE challenge_id = :cid"),
+                {"cid": challenge_id},
+            )
+        ).scalars().all()
+        user_totals = (
+            await conn.execute(
+                text(
+                    "SELECT coalesce(sum(total_score), 0), coalesce(sum(solved_count), 0) "
+                    "FROM users WHERE username LIKE :p"
+                ),
+                {"p": f"{PREFIX}%"},
+            )
+        ).one()
+
+    solved = sum(r["outcome"] == "solved" for r in results)
+    if not solve_count == len(awarded) == solved:
+        problems.append(
+            f"풀이 수 불일치: solve_count={solve_count}, solves={len(awarded)}, 성공={solved}"
+        )
+    first_bloods = sum(r["first_blood"] for r in results)
+    if first_bloods != 1:
+        problems.append(f"First Blood {first_bloods}건")
+    expected = Counter(
+        challenge_service.calculate_dynamic_points(MAX_POINTS, MIN_POINTS, DECAY, rank)
+        for rank in range(1, len(awarded) + 1)
+    )
+    if Counter(awarded) != expected:
+        problems.append("지급 점수가 풀이 순번별 동적 점수와 다름")
+    if tuple(user_totals) != (sum(awarded), len(awarded)):
+        problems.append(
+            f"유저 점수 합계 불일치: total_score/solved_count={tuple(user_totals)}, "
+            f"solves={(sum(awarded), len(awarded))}"
+        )
+    return problems
+
+
+async def _run_mode(
+    engine: AsyncEngine, mode: str, solvers: int, concurrency: int, duplicates: int
+) -> bool:
+    """한 방식으로 동시 풀이와 중복 제출을 실행하고 검사 통과 여부를 반환한다."""
+    solve = MODES[mode]
+    user_ids, challenge_id = await _seed(engine, solvers)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def submit(user_id: int) -> dict:
+        async with gate:
+            return await _submit(engine, solve, user_id, challenge_id)
+
+    # 마지막 유저는 같은 플래그를 duplicates번 동시에 제출한다
+    targets = user_ids + [user_ids[-1]] * duplicates
+    started = time.perf_counter()
+    results = await asyncio.gather(*(submit(uid) for uid in targets))
+    wall = time.perf_counter() - started
+
+    outcomes = Counter(r["outcome"] for r in results)
+    latencies = sorted(r["latency"] for r in results if r["outcome"] == "solved")
+    problems = await _verify(engine, challenge_id, results)
+    if outcomes["solved"] != solvers:
+        problems.append(f"정답 처리 성공 {outcomes['solved']}건 (기대 {solvers}건)")
+
+    print(f"--- {mode} ---")
+    print(
+        f"  결과: 성공 {outcomes['solved']}, 중복 거부 {outcomes['duplicate']}, "
+        f"오류 {outcomes['error']}"
+    )
+    if latencies:
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"  처리량 {outcomes['solved'] / wall:>8.0f} solves/s  "
+            f"avg {statistics.fmean(latencies) * 1000:>7.2f}ms  p95 {p95 * 1000:>7.2f}ms"
+        )
+    for problem in problems:
+        print(f"  [FAIL] {problem}")
+    if not problems:
+        print("  [OK  ] 모든 검사 통과")
+
+    async with engine.begin() as conn:
+        await _cleanup(conn)
+    return not problems
+
+
+async def main() -> int:
+    """방식별 스트레스 테스트를 실행하고 종료 코드를 반환한다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--solvers", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duplicates", type=int, default=20)
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().async_database_url, pool_size=args.concurrency, max_overflow=0
+    )
+    print(
+        f"=== 동시 정답 제출 (유저 {args.solvers}명, 동시 {args.concurrency}, "
+        f"중복 제출 {args.duplicates}건) ==="
+    )
+    passed = {}
+    try:
+        for mode in args.modes:
+            passed[mode] = await _run_mode(
+                engine, mode, args.solvers, args.concurrency, args.duplicates
+            )
+    finally:
+        await engine.dispose()
+    return 0 if passed.get("atomic", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,142 @@
+"""알림 조회 인덱스 벤치마크.
+
+별도 스키마(bench_notif)에 notifications와 같은 구조의 테이블을 만들고
+대량의 알림 행을 생성한 뒤, 기존 단일 컬럼 인덱스와 복합 인덱스 전략에서
+목록/미읽음 목록/미읽음 수 조회 지연 시간을 비교한다.
+운영 테이블은 건드리지 않으며, 끝나면 스키마를 삭제한다 (--keep 제외).
+
+실행: python -m scripts.bench_notifications [--rows 10000000] [--users 20000] [--samples 200] [--keep]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.database import engine
+
+SCHEMA = "bench_notif"
+TABLE = f"{SCHEMA}.notifications"
+SEED_CHUNK = 1_000_000
+
+STRATEGIES = {
+    "legacy (user_id), (is_read)": [
+        f"CREATE INDEX ix_bench_user_id ON {TABLE} (user_id)",
+        f"CREATE INDEX ix_bench_is_read ON {TABLE} (is_read)",
+    ],
+    "composite (user_id, [is_read,] created_at DESC)": [
+        f"CREATE INDEX ix_bench_user_created ON {TABLE} (user_id, created_at DESC)",
+        f"CREATE INDEX ix_bench_user_read_created ON {TABLE} (user_id, is_read, created_at DESC)",
+    ],
+}
+
+QUERIES = {
+    "list (limit 20)": (
+        f"SELECT * FROM {TABLE} WHERE user_id = :uid ORDER BY created_at DESC LIMIT 20"
+    ),
+    "unread list (limit 20)": (
+        f"SELECT * FROM {TABLE} WHERE user_id = :uid AND is_read = false "
+        "ORDER BY created_at DESC LIMIT 20"
+    ),
+    "unread count": (
+        f"SELECT count(id) FROM {TABLE} WHERE user_id = :uid AND is_read = false"
+    ),
+}
+
+
+async def _seed(conn, rows: int, users: int) -> None:
+    """벤치마크 테이블을 만들고 rows개의 알림을 생성한다.
+
+    유저당 알림 수가 고르지 않도록 user_id를 제곱 분포로 뽑고,
+    약 80%를 읽음 상태로 둔다.
+    """
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await conn.execute(
+        text(f"CREATE TABLE {TABLE} (LIKE public.notifications INCLUDING DEFAULTS)")
+    )
+    await conn.execute(text(f"ALTER TABLE {TABLE} ADD PRIMARY KEY (id)"))
+
+    for start in range(0, rows, SEED_CHUNK):
+        end = min(start + SEED_CHUNK, rows)
+        await conn.execute(
+            text(
+                f"""
+                INSERT INTO {TABLE} (id, user_id, type, title, message, is_read, created_at)
+                SELECT i,
+                       1 + floor(power(random(), 2) * :users)::int,
+                       'first_blood',
+                       'bench',
+                       'bench notification',
+                       random() < 0.8,
+                       now() - ((:rows - i) * interval '1 second')
+                FROM generate_series(:start + 1, :end) AS i
+                """
+            ),
+            {"users": users, "rows": rows, "start": start, "end": end},
+        )
+        await conn.commit()
+        print(f"  seeded {end:,}/{rows:,}")
+
+
+async def _measure(conn, sql: str, user_ids: list[int]) -> tuple[float, float, float]:
+    """유저 샘플마다 쿼리를 실행하여 p50/p95/p99 지연 시간(ms)을 반환한다."""
+    stmt = text(sql)
+    await conn.execute(stmt, {"uid": user_ids[0]})  # 워밍업
+    timings = []
+    for uid in user_ids:
+        started = time.perf_counter()
+        result = await conn.execute(stmt, {"uid": uid})
+        result.all()
+        timings.append((time.perf_counter() - started) * 1000)
+    quantiles = statistics.quantiles(timings, n=100)
+    return statistics.median(timings), quantiles[94], quantiles[98]
+
+
+async def main() -> None:
+    """벤치마크를 실행한다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 스키마를 남긴다")
+    args = parser.parse_args()
+
+    engine.echo = False  # 개발 환경의 SQL 로그가 측정에 섞이지 않게 한다
+    rng = random.Random(42)
+    user_ids = [1 + int(rng.random() ** 2 * args.users) for _ in range(args.samples)]
+
+    async with engine.connect() as conn:
+        print(f"=== 알림 {args.rows:,}건 생성 (유저 {args.users:,}명) ===")
+        await _seed(conn, args.rows, args.users)
+
+        try:
+            for strategy, ddl in STRATEGIES.items():
+                for statement in ddl:
+                    await conn.execute(text(statement))
+                await conn.execute(text(f"ANALYZE {TABLE}"))
+                await conn.commit()
+
+                print(f"\n=== {strategy} ===")
+                print(f"  {'query':<24} {'p50':>9} {'p95':>9} {'p99':>9}")
+                for label, sql in QUERIES.items():
+                    p50, p95, p99 = await _measure(conn, sql, user_ids)
+                    print(f"  {label:<24} {p50:>7.2f}ms {p95:>7.2f}ms {p99:>7.2f}ms")
+
+                for statement in ddl:
+                    index_name = statement.split()[2]
+                    await conn.execute(text(f"DROP INDEX {SCHEMA}.{index_name}"))
+                await conn.commit()
+        finally:
+            if not args.keep:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+                await conn.commit()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
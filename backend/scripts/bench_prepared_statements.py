@@ -0,0 +1,168 @@
+"""Prepared statement / SQL 컴파일 캐시 벤치마크.
+
+플래그 제출 경로(공개 챌린지 조회, 풀이 여부 확인), 풀이 목록, 챌린지 목록
+문장을 반복 실행해 연결 방식별 지연 시간을 비교한다.
+
+1. SQL 컴파일 (DB 불필요)
+   - 요청마다 문장 생성 + 컴파일 (컴파일 캐시 없음)
+   - 요청마다 문장 생성 + 컴파일 캐시 적중
+   - 고정 문장(bindparam) + 컴파일 캐시 적중
+2. DB 왕복 (--direct-url / --pooler-url 지정 시)
+   - direct: 직접 연결, prepared statement 캐시 사용
+   - direct-unprepared: 직접 연결, 캐시 없음 (매번 파싱/계획)
+   - pooler-unprepared: PgBouncer 트랜잭션 풀링, 캐시 없음 (기존 설정)
+   - pooler-prepared: PgBouncer 1.21+ 프로토콜 수준 prepared statement
+
+실행:
+    python -m scripts.bench_prepared_statements [--rounds 2000]
+    python -m scripts.bench_prepared_statements \\
+        --direct-url postgresql+asyncpg://wargame:pw@db:5432/wargame \\
+        --pooler-url postgresql+asyncpg://wargame:pw@pgbouncer:6432/wargame \\
+        --rounds 500 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.util import LRUCache
+
+from app.models.challenge import Challenge
+from app.models.submission import Submission
+from app.services.challenge_service import (
+    ALREADY_SOLVED_STMT,
+    PUBLIC_CHALLENGE_STMT,
+    SOLVED_IDS_STMT,
+    SUMMARY_COLUMNS,
+)
+
+
+def _build_public_challenge(challenge_id: int):
+    """기존 방식처럼 요청마다 문장을 만든다."""
+    return select(Challenge).where(
+        Challenge.id == challenge_id,
+        Challenge.is_active.is_(True),
+        Challenge.review_status == "approved",
+    )
+
+
+def _list_stmt():
+    return (
+        select(*SUMMARY_COLUMNS)
+        .where(Challenge.is_active.is_(True), Challenge.review_status == "approved")
+        .order_by(Challenge.id.asc())
+        .limit(21)
+    )
+
+
+def _compile(stmt, dialect, cache: LRUCache | None) -> None:
+    """엔진이 실행 전에 거치는 캐시 키 계산 → 캐시 조회 → 컴파일 단계만 수행한다."""
+    stmt._compile_w_cache(dialect, compiled_cache=cache, column_keys=[])
+
+
+def bench_compile(rounds: int) -> None:
+    """문장 생성/컴파일 비용을 방식별로 출력한다."""
+    dialect = PGDialect_asyncpg()
+    cases = [
+        ("build + compile (no cache)", lambda i: _build_public_challenge(i), None),
+        ("build + cached compile", lambda i: _build_public_challenge(i), LRUCache(100)),
+        ("prebuilt + cached compile", lambda i: PUBLIC_CHALLENGE_STMT, LRUCache(100)),
+    ]
+    print(f"=== SQL 컴파일 (공개 챌린지 조회, {rounds}회 평균) ===")
+    for label, build, cache in cases:
+        _compile(build(0), dialect, cache)
+        started = time.perf_counter()
+        for i in range(rounds):
+            _compile(build(i), dialect, cache)
+        elapsed = (time.perf_counter() - started) / rounds
+        print(f"  {label:<32} {elapsed * 1e6:>8.1f}µs", flush=True)
+
+
+def _engine(url: str, *, prepared: bool, pooled: bool) -> AsyncEngine:
+    connect_args: dict = {"prepared_statement_cache_size": 256 if prepared else 0}
+    if not prepared:
+        connect_args["statement_cache_size"] = 0
+    if pooled:
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4().hex}__"
+    # 풀러 뒤에서도 앱 풀은 유지한다 (서버 커넥션은 PgBouncer가 트랜잭션마다 배정)
+    return create_async_engine(url, pool_size=16, max_overflow=0, connect_args=connect_args)
+
+
+async def _sample_ids(engine: AsyncEngine) -> tuple[int, int]:
+    async with engine.connect() as conn:
+        challenge_id = await conn.scalar(select(Challenge.id).order_by(Challenge.id).limit(1))
+        user_id = await conn.scalar(select(Submission.user_id).limit(1))
+    return challenge_id or 1, user_id or 1
+
+
+async def _run_mode(label: str, engine: AsyncEngine, rounds: int, concurrency: int) -> None:
+    challenge_id, user_id = await _sample_ids(engine)
+    statements = [
+        ("public challenge", PUBLIC_CHALLENGE_STMT, {"challenge_id": challenge_id}),
+        ("already solved", ALREADY_SOLVED_STMT, {"user_id": user_id, "challenge_id": challenge_id}),
+        ("solved ids", SOLVED_IDS_STMT, {"user_id": user_id}),
+        ("challenge list", _list_stmt(), {}),
+    ]
+
+    print(f"--- {label} ---")
+    for name, stmt, params in statements:
+        latencies: list[float] = []
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                started = time.perf_counter()
+                async with engine.connect() as conn:
+                    await conn.execute(stmt, params)
+                latencies.append(time.perf_counter() - started)
+
+        await worker(concurrency)  # 예열
+        latencies.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(rounds // concurrency) for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"  {name:<18} avg {statistics.fmean(latencies) * 1000:>7.3f}ms  "
+            f"p95 {p95 * 1000:>7.3f}ms  {len(latencies) / wall:>8.0f} q/s",
+            flush=True,
+        )
+    await engine.dispose()
+
+
+async def main() -> None:
+    """방식별 컴파일/실행 시간을 출력한다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--direct-url", help="PostgreSQL 직접 연결 URL")
+    parser.add_argument("--pooler-url", help="PgBouncer(트랜잭션 풀링) URL")
+    args = parser.parse_args()
+
+    bench_compile(args.rounds)
+
+    modes = []
+    if args.direct_url:
+        modes += [
+            ("direct", args.direct_url, True, False),
+            ("direct-unprepared", args.direct_url, False, False),
+        ]
+    if args.pooler_url:
+        modes += [
+            ("pooler-unprepared", args.pooler_url, False, True),
+            ("pooler-prepared (PgBouncer 1.21+)", args.pooler_url, True, True),
+        ]
+    if modes:
+        print(f"=== DB 왕복 ({args.rounds}회, 동시 {args.concurrency}) ===")
+    for label, url, prepared, pooled in modes:
+        engine = _engine(url, prepared=prepared, pooled=pooled)
+        await _run_mode(label, engine, args.rounds, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""Write-up sanitizer 퍼징 및 성능 벤치마크.
+
+1. 퍼징: 태그/속성/따옴표/스크립트 조각을 무작위로 섞은 입력에 대해
+   sanitize_markdown 결과에 `<script`, 태그 내 on* 속성, `javascript:`가
+   남지 않는지와 멱등성(두 번 적용해도 같은 결과)을 검사한다.
+   render_markdown 결과도 같은 불변식을 검사한다.
+2. 성능: 수 MB 크기의 일반/병적 입력에 대해 sanitize 시간을 측정하고,
+   기존 정규식 3회 적용 방식과 비교한다 (기존 방식은 입력 크기를 제한해 측정).
+   HTML 렌더링은 저장 시와 같이 WRITEUP_RENDER_MAX_CHARS까지만 측정한다.
+
+실행: python -m scripts.bench_sanitizer [--iterations 20000] [--size-mb 4] [--seed 42]
+      (python scripts/bench_sanitizer.py로 실행해도 된다)
+"""
+
+import argparse
+import html
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # 파일 경로로 실행하면 backend 디렉토리가 import 경로에 없으므로 추가한다
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import get_settings
+from app.core.sanitizer import (
+    _UNTERMINATED,
+    _Scanner,
+    _parse_tag,
+    render_markdown,
+    sanitize_markdown,
+)
+
+# 기존 구현과 비교할 때 입력 크기 상한 (병적 입력에서 기존 방식은 제곱 시간이 걸린다)
+LEGACY_MAX_BYTES = 64 * 1024
+
+FRAGMENTS = [
+    "<", ">", "/", "=", '"', "'", " ", "\n", "\t", "-", "!", "?",
+    "<script>", "</script>", "<SCRIPT src=x>", "</script >", "<scr", "ipt>",
+    "<img", "<a", "<svg", "<style>", "</style>", "<!--", "-->", "<!doctype html>",
+    " onerror=", " ONCLICK=", " on", "load=", " onmouseover", "=alert(1)",
+    "javascript:", "JaVaScRiPt:", "java", "script:", "&#106;avascript:",
+    " href=", " src=", "x", "alert(1)", "**bold**", "[link](", ")", "`", "```",
+    "# ", "> ", "| a | b |", "|---|---|",
+]
+
+PATHOLOGICAL = {
+    "text": "The quick brown fox jumps over the lazy dog. " * 8 + "\n\n",
+    "code blocks": "```python\nfor i in range(10):\n    print(i < 5 and i > 2)\n```\n",
+    "unclosed <script": "<script",
+    "repeated <a": "<a ",
+    "on*= in text": "once= only= ",
+    "javascript: runs": "javajavascript:script:",
+    "unclosed <!": "<!",
+    "unclosed <!--": "<!--",
+    "closed <a attrs": "<a " * 64 + ">",
+}
+
+
+def legacy_sanitize(content: str) -> str:
+    """기존 정규식 3회 적용 방식 (비교용)."""
+    content = re.sub(r"<script[^>]*>.*?</script>", "", content, flags=re.DOTALL | re.IGNORECASE)
+    content = re.sub(r"on\w+\s*=", "", content, flags=re.IGNORECASE)
+    content = re.sub(r"javascript:", "", content, flags=re.IGNORECASE)
+    return content
+
+
+def _tags(text: str):
+    """브라우저처럼 앞에서부터 토큰화하며 태그를 반환한다."""
+    scanner = _Scanner(text)
+    scan = 0
+    while (lt := text.find("<", scan)) >= 0:
+        markup_end = scanner.skip_markup(lt)
+        if markup_end >= 0:
+            scan = markup_end
+            continue
+        tag = _parse_tag(text, lt)
+        if tag is _UNTERMINATED:
+            return
+        if tag is None:
+            scan = lt + 1
+            continue
+        yield tag
+        scan = tag.end
+
+
+def _violations(output: str, rendered: bool = False) -> list[str]:
+    """sanitize 결과에 남은 위험 요소를 반환한다.
+
+    렌더링된 HTML은 텍스트의 `javascript:`는 무해하므로 URL 속성만 검사한다.
+    """
+    problems = []
+    if not rendered and "javascript:" in output.lower():
+        problems.append("javascript: 잔존")
+    for tag in _tags(output):
+        if tag.name == "script" and not tag.closing:
+            problems.append("<script> 태그 잔존")
+        for attr in tag.attrs:
+            if attr.name.startswith("on"):
+                problems.append(f"이벤트 핸들러 속성 잔존: {attr.name}")
+            if rendered and attr.name in ("href", "src") and attr.value is not None:
+                url = re.sub(r"[\x00-\x20]+", "", html.unescape(attr.value)).lower()
+                if url.startswith("javascript:"):
+                    problems.append(f"javascript: URL 잔존: {attr.name}")
+    return problems
+
+
+def fuzz(iterations: int, rng: random.Random) -> int:
+    """무작위 입력으로 불변식을 검사하고 실패 건수를 반환한다."""
+    failures = 0
+    for i in range(iterations):
+        sample = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 60)))
+        cleaned = sanitize_markdown(sample)
+        problems = _violations(cleaned)
+        if sanitize_markdown(cleaned) != cleaned:
+            problems.append("멱등성 위반")
+        if i % 4 == 0:
+            rendered = render_markdown(cleaned)
+            problems += [f"html: {p}" for p in _violations(rendered, rendered=True)]
+        if problems:
+            failures += 1
+            if failures <= 10:
+                print(f"  FAIL {problems}\n    input:  {sample!r}\n    output: {cleaned!r}")
+    return failures
+
+
+def _time(func, content: str) -> float:
+    started = time.perf_counter()
+    func(content)
+    return time.perf_counter() - started
+
+
+def bench(size_mb: float) -> None:
+    """입력 종류별 처리 시간을 출력한다."""
+    size = int(size_mb * 1024 * 1024)
+    render_max = get_settings().WRITEUP_RENDER_MAX_CHARS
+    print(
+        f"  {'input':<20} {'size':>8} {'sanitize':>10} "
+        f"{f'render@{render_max // 1000}K':>12} {'legacy@64K':>12}"
+    )
+    for label, unit in PATHOLOGICAL.items():
+        content = (unit * (size // len(unit) + 1))[:size]
+        sanitize_seconds = _time(sanitize_markdown, content)
+        render_seconds = _time(render_markdown, sanitize_markdown(content[:render_max]))
+        legacy_seconds = _time(legacy_sanitize, content[:LEGACY_MAX_BYTES])
+        print(
+            f"  {label:<20} {size / 1024 / 1024:>6.1f}MB {sanitize_seconds * 1000:>8.1f}ms "
+            f"{render_seconds * 1000:>10.1f}ms {legacy_seconds * 1000:>10.1f}ms",
+            flush=True,
+        )
+
+
+def main() -> None:
+    """퍼징과 벤치마크를 실행한다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"=== 퍼징 {args.iterations:,}회 ===")
+    failures = fuzz(args.iterations, random.Random(args.seed))
+    print(f"  실패 {failures}건", flush=True)
+
+    print(f"\n=== 성능 ({args.size_mb}MB 입력) ===")
+    bench(args.size_mb)
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""챌린지 목록 응답 직렬화 벤치마크.
+
+100개 항목 페이지 하나를 응답 JSON으로 만드는 비용을 방식별로 측정한다.
+DB 없이 메모리에서 만든 데이터로 측정하며, 응답 직렬화는 FastAPI와 같이
+response_model 검증 → JSONResponse 인코딩 과정을 거친다.
+
+1. ORM 엔티티 + ChallengeResponse.model_validate (기존 방식, 본문/힌트/파일 포함)
+2. 카드 컬럼 Row + ChallengeSummary.model_construct (검증 생략)
+3. 카탈로그 캐시 적중 (JSON 문자열 → dict → ChallengeListResponse)
+
+실행: python -m scripts.bench_serialization [--items 100] [--rounds 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import UTC, datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+
+from app.models.challenge import Challenge
+from app.schemas.challenge import (
+    ChallengeListResponse,
+    ChallengeResponse,
+    ChallengeSummary,
+)
+from app.services.challenge_service import SUMMARY_COLUMNS
+
+CATEGORIES = ["pwn", "reversing", "crypto", "web", "forensics", "misc"]
+
+
+class LegacyListResponse(BaseModel):
+    """기존 목록 응답 스키마 (항목에 본문/힌트/파일 포함)."""
+
+    items: list[ChallengeResponse]
+    next_cursor: int | None = None
+    total: int
+
+
+def _make_challenges(count: int, rng: random.Random) -> list[Challenge]:
+    """실제 데이터와 비슷한 크기의 챌린지 엔티티를 만든다."""
+    now = datetime.now(UTC)
+    return [
+        Challenge(
+            id=i,
+            title=f"Challenge {i}",
+            description="## 문제 설명\n" + "본문 내용 " * rng.randint(100, 400),
+            category=rng.choice(CATEGORIES),
+            difficulty=rng.randint(1, 5),
+            points=rng.randint(50, 500),
+            max_points=500,
+            min_points=50,
+            decay=10.0,
+            flag_hash="0" * 64,
+            flag_type="static",
+            is_dynamic=rng.random() < 0.3,
+            files=[f"file{j}.zip" for j in range(rng.randint(0, 3))],
+            hints=[{"cost": 50, "content": "힌트 " * 20} for _ in range(rng.randint(0, 2))],
+            tags=[f"tag{j}" for j in range(rng.randint(0, 4))],
+            author_id=None,
+            solve_count=rng.randint(0, 1000),
+            is_active=True,
+            created_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _rows(challenges: list[Challenge]) -> list[dict]:
+    """카드 컬럼만 SELECT한 결과 Row의 매핑을 흉내 낸다."""
+    names = [column.key for column in SUMMARY_COLUMNS]
+    return [{name: getattr(c, name) for name in names} for c in challenges]
+
+
+async def _respond(field, content) -> bytes:
+    """FastAPI 라우트와 같은 방식으로 응답 본문을 만든다."""
+    serialized = await serialize_response(field=field, response_content=content)
+    return JSONResponse(serialized).body
+
+
+async def _bench(label: str, build, field, rounds: int) -> None:
+    body = await _respond(field, build())
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await _respond(field, build())
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"  {label:<44} {elapsed * 1e6:>9.1f}µs/page  {len(body) / 1024:>7.1f}KB", flush=True)
+
+
+async def main() -> None:
+    """방식별 페이지 직렬화 시간을 출력한다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    challenges = _make_challenges(args.items, random.Random(42))
+    rows = _rows(challenges)
+    field = create_model_field(name="Response", type_=ChallengeListResponse)
+    legacy_field = create_model_field(name="Response", type_=LegacyListResponse)
+
+    def legacy():
+        items = []
+        for c in challenges:
+            resp = ChallengeResponse.model_validate(c)
+            resp.is_solved = c.id % 2 == 0
+            items.append(resp)
+        return LegacyListResponse(items=items, next_cursor=None, total=len(items))
+
+    def projected():
+        items = [ChallengeSummary.model_construct(**row) for row in rows]
+        for item in items:
+            item.is_solved = item.id % 2 == 0
+        return ChallengeListResponse(items=items, next_cursor=None, total=len(items))
+
+    cached_json = json.dumps({
+        "items": [ChallengeSummary.model_construct(**row).model_dump(mode="json") for row in rows],
+        "next_cursor": None,
+        "total": len(rows),
+    })
+
+    def cached():
+        page = json.loads(cached_json)
+        for item in page["items"]:
+            item["is_solved"] = item["id"] % 2 == 0
+        return ChallengeListResponse.model_validate(page)
+
+    print(f"=== 목록 응답 직렬화 ({args.items}개 항목, {args.rounds}회 평균) ===")
+    await _bench("ORM + ChallengeResponse.model_validate", legacy, legacy_field, args.rounds)
+    await _bench("Row + ChallengeSummary.model_construct", projected, field, args.rounds)
+    await _bench("catalog cache hit (json → model_validate)", cached, field, args.rounds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
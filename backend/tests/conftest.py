@@ -0,0 +1,95 @@
+"""공통 pytest 픽스처.
+
+비동기 테스트는 anyio 플러그인(@pytest.mark.anyio)을 asyncio 백엔드로 실행한다.
+PostgreSQL 테스트는 TEST_DATABASE_URL(alembic upgrade head가 적용된 DB)이 있을 때만 실행한다.
+"""
+
+import itertools
+import os
+
+import pytest
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def fake_redis():
+    """인메모리 Redis (fakeredis). 모듈의 get_redis_client를 이것으로 바꿔 사용한다."""
+    from fakeredis import FakeAsyncRedis
+
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+async def pg_engine():
+    """TEST_DATABASE_URL에 연결하는 비동기 엔진 (없으면 테스트를 건너뛴다)."""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL이 설정되지 않았습니다.")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(url, pool_size=32, max_overflow=0)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def pg_session(pg_engine):
+    """테스트가 끝나면 전부 롤백되는 세션 (세션의 commit은 savepoint로 처리된다)."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with pg_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture
+def make_user(pg_session):
+    """pg_session에 테스트 유저를 만드는 함수."""
+    from app.models.user import User
+
+    counter = itertools.count()
+
+    async def make(**fields) -> User:
+        n = next(counter)
+        user = User(
+            username=f"pytest_user_{n}",
+            email=f"pytest_user_{n}@example.com",
+            password_hash="x",
+            **fields,
+        )
+        pg_session.add(user)
+        await pg_session.flush()
+        return user
+
+    return make
+
+
+@pytest.fixture
+def make_challenge(pg_session):
+    """pg_session에 공개 챌린지를 만드는 함수."""
+    from app.models.challenge import Challenge
+
+    counter = itertools.count()
+
+    async def make(**fields) -> Challenge:
+        n = next(counter)
+        fields = {"category": "pwn", "difficulty": 1, **fields}
+        challenge = Challenge(
+            title=f"pytest_challenge_{n}", description="d", flag_hash="x", **fields
+        )
+        pg_session.add(challenge)
+        await pg_session.flush()
+        return challenge
+
+    return make
@@ -0,0 +1,86 @@
+"""관리자 대시보드 통계 스냅샷 테스트."""
+
+import pytest
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.config import Settings
+from app.services import admin_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def aggregations(monkeypatch):
+    """DB 집계 대역 — 호출 횟수를 통계 값으로 반환한다."""
+    calls = []
+
+    async def get_dashboard_stats(db):
+        calls.append(db)
+        return {"total_users": len(calls), "category_distribution": [{"category": "pwn"}]}
+
+    monkeypatch.setattr(admin_service, "get_dashboard_stats", get_dashboard_stats)
+    return calls
+
+
+@pytest.fixture
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(admin_service, "get_redis_client", lambda: fake_redis)
+    return fake_redis
+
+
+async def test_snapshot_is_served_until_fresh(redis, aggregations):
+    first = await admin_service.get_stats_snapshot(None)
+    second = await admin_service.get_stats_snapshot(None)
+
+    assert first == second
+    assert first["total_users"] == 1
+    assert first["category_distribution"] == [{"category": "pwn"}]
+    assert len(aggregations) == 1
+
+    fresh = await admin_service.get_stats_snapshot(None, fresh=True)
+    assert fresh["total_users"] == 2
+    assert await admin_service.get_stats_snapshot(None) == fresh
+
+
+async def test_snapshot_expires_after_three_intervals(redis, aggregations, monkeypatch):
+    monkeypatch.setattr(admin_service.settings, "ADMIN_STATS_SNAPSHOT_SECONDS", 20)
+    await admin_service.refresh_stats_snapshot(None)
+
+    assert await redis.ttl(admin_service.STATS_SNAPSHOT_KEY) == 60
+
+
+async def test_redis_outage_aggregates_without_second_call(monkeypatch, aggregations):
+    class BrokenRedis:
+        calls = 0
+
+        async def hgetall(self, key):
+            self.calls += 1
+            raise RedisError("down")
+
+        def pipeline(self, **kwargs):
+            self.calls += 1
+            raise RedisError("down")
+
+    broken = BrokenRedis()
+    monkeypatch.setattr(admin_service, "get_redis_client", lambda: broken)
+
+    stats = await admin_service.get_stats_snapshot(None)
+
+    assert stats["total_users"] == 1
+    assert stats["computed_at"]
+    assert broken.calls == 1
+
+
+async def test_without_redis_aggregates_on_request(monkeypatch, aggregations):
+    monkeypatch.setattr(admin_service, "get_redis_client", lambda: None)
+
+    await admin_service.get_stats_snapshot(None)
+    await admin_service.get_stats_snapshot(None)
+    assert len(aggregations) == 2
+
+
+@pytest.mark.parametrize("seconds", [0, -60])
+def test_snapshot_interval_must_be_positive(seconds):
+    with pytest.raises(ValidationError):
+        Settings(ADMIN_STATS_SNAPSHOT_SECONDS=seconds)
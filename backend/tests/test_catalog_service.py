@@ -0,0 +1,84 @@
+"""챌린지 카탈로그 캐시/풀이 비트셋 테스트."""
+
+import pytest
+
+from app.services import catalog_service, challenge_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(catalog_service, "get_redis_client", lambda: fake_redis)
+    return fake_redis
+
+
+@pytest.fixture
+def db_solves(monkeypatch):
+    """DB 풀이 목록 대역 — 조회 횟수를 센다."""
+    state = {"solved": {3, 7}, "calls": 0}
+
+    async def get_solved_challenge_ids(db, user_id):
+        state["calls"] += 1
+        return set(state["solved"])
+
+    monkeypatch.setattr(challenge_service, "get_solved_challenge_ids", get_solved_challenge_ids)
+    return state
+
+
+@pytest.fixture
+def db_pages(monkeypatch):
+    calls = []
+
+    async def list_challenges(db, **filters):
+        calls.append(filters)
+        return [], None, len(calls)
+
+    monkeypatch.setattr(challenge_service, "list_challenges", list_challenges)
+    return calls
+
+
+async def test_solved_bitset_is_loaded_once(db_solves):
+    assert await catalog_service.get_solved_flags(None, 1, [3, 4, 7]) == {3, 7}
+    assert await catalog_service.get_solved_flags(None, 1, [3, 4]) == {3}
+    assert db_solves["calls"] == 1
+
+
+async def test_committed_solve_sets_bit_and_version(redis, db_solves):
+    await catalog_service.get_solved_flags(None, 1, [4])
+    version = await redis.get(catalog_service.solved_version_key(1))
+
+    await catalog_service._apply_changes({"solves": [(1, 4)]})
+
+    assert await catalog_service.get_solved_flags(None, 1, [4]) == {4}
+    assert await redis.get(catalog_service.solved_version_key(1)) != version
+    assert db_solves["calls"] == 1
+
+
+async def test_solve_before_bitset_load_still_reads_db(db_solves):
+    await catalog_service._apply_changes({"solves": [(1, 4)]})
+    db_solves["solved"].add(4)
+
+    assert await catalog_service.get_solved_flags(None, 1, [3, 4, 5]) == {3, 4}
+    assert db_solves["calls"] == 1
+
+
+async def test_catalog_page_is_cached_until_version_bump(db_pages):
+    first = await catalog_service.get_catalog_page(None, category="web")
+    assert await catalog_service.get_catalog_page(None, category="web") == first
+    assert len(db_pages) == 1
+
+    await catalog_service.get_catalog_page(None, category="pwn")
+    assert len(db_pages) == 2
+
+    await catalog_service._apply_changes({"dirty": True})
+    await catalog_service.get_catalog_page(None, category="web")
+    assert len(db_pages) == 3
+
+
+async def test_catalog_without_redis_reads_db(monkeypatch, db_pages):
+    monkeypatch.setattr(catalog_service, "get_redis_client", lambda: None)
+
+    await catalog_service.get_catalog_page(None)
+    await catalog_service.get_catalog_page(None)
+    assert len(db_pages) == 2
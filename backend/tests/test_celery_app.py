@@ -0,0 +1,25 @@
+"""Celery 태스크 등록/주기 설정 테스트."""
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+from app.celery_app import BEAT_SCHEDULE, TASK_MODULES
+
+TASKS_DIR = Path(__file__).resolve().parent.parent / "app" / "tasks"
+
+
+def test_every_task_module_is_included():
+    modules = {f"app.tasks.{p.stem}" for p in TASKS_DIR.glob("*.py") if p.stem != "__init__"}
+
+    assert set(TASK_MODULES) == modules
+
+
+@pytest.mark.parametrize("entry", sorted(BEAT_SCHEDULE))
+def test_beat_entries_point_at_included_tasks(entry):
+    module_name, _, function = BEAT_SCHEDULE[entry]["task"].rpartition(".")
+
+    assert module_name in TASK_MODULES
+    assert callable(getattr(importlib.import_module(module_name), function))
+    assert BEAT_SCHEDULE[entry]["schedule"] > 0
@@ -0,0 +1,86 @@
+"""커넥션 풀 지표와 연결 인자(prepared statement) 테스트."""
+
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from app import database
+from app.services import challenge_service
+
+pytestmark = pytest.mark.anyio
+
+
+def _checkout_until_timeout() -> database._PoolStats:
+    pool = database.MeteredQueuePool(
+        creator=mock.MagicMock, pool_size=1, max_overflow=0, timeout=0.01
+    )
+    held = pool.connect()
+    with pytest.raises(PoolTimeoutError):
+        pool.connect()
+    held.close()
+    pool.connect().close()
+    return pool._stats
+
+
+async def test_metered_pool_records_waits_and_timeouts():
+    stats = await greenlet_spawn(_checkout_until_timeout)
+
+    assert stats.checkouts == 2
+    assert stats.timeouts == 1
+    assert 0 <= stats.wait_max <= stats.wait_total
+
+
+def test_pool_metrics_report_every_workload():
+    metrics = database.get_pool_metrics()
+
+    assert set(metrics) == {"write", "read", "background"}
+    for pool in metrics.values():
+        assert pool["checked_out"] == 0
+        assert pool["saturation"] == 0.0
+        assert pool["wait_avg_ms"] == 0.0
+
+
+@pytest.mark.parametrize(
+    ("url", "pooler_prepared", "cache_size"),
+    [
+        ("postgresql+asyncpg://db.internal/ctf", False, 100),
+        ("postgresql+asyncpg://ep-x-pooler.neon.tech/ctf", False, 0),
+        ("postgresql+asyncpg://ep-x-pooler.neon.tech/ctf", True, 100),
+    ],
+)
+def test_connect_args_by_connection_mode(monkeypatch, url, pooler_prepared, cache_size):
+    monkeypatch.setattr(database.settings, "DB_PREPARED_STATEMENT_CACHE_SIZE", 100)
+    monkeypatch.setattr(database.settings, "DB_POOLER_PREPARED_STATEMENTS", pooler_prepared)
+
+    args = database._connect_args(url)
+
+    assert args["prepared_statement_cache_size"] == cache_size
+    assert args.get("statement_cache_size", cache_size) == cache_size
+    # 풀러 뒤에서는 서버 커넥션 간 이름이 겹치지 않도록 항상 UUID 이름을 쓴다
+    assert ("prepared_statement_name_func" in args) == ("pooler" in url)
+
+
+def test_prepared_statement_names_are_unique():
+    names = {database._prepared_statement_name() for _ in range(100)}
+
+    assert len(names) == 100
+    assert all(name.startswith("__asyncpg_") for name in names)
+
+
+@pytest.mark.parametrize(
+    ("name", "params"),
+    [
+        ("PUBLIC_CHALLENGE_STMT", {"challenge_id"}),
+        ("SOLVED_IDS_STMT", {"user_id"}),
+        ("ALREADY_SOLVED_STMT", {"user_id", "challenge_id"}),
+    ],
+)
+def test_prebuilt_statements_take_named_parameters(name, params):
+    compiled = getattr(challenge_service, name).compile(dialect=postgresql.dialect())
+
+    # 호출자가 넘기는 값은 모두 이름 있는 바인드 파라미터여야 같은 SQL 문자열이 재사용된다
+    assert params <= set(compiled.params)
+    assert all(compiled.params[param] is None for param in params)
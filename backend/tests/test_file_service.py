@@ -0,0 +1,120 @@
+"""챌린지 파일 번들/사전 압축본 테스트."""
+
+import gzip
+import tarfile
+import threading
+import zipfile
+
+import pytest
+
+from app.services import file_service
+
+pytestmark = pytest.mark.anyio
+
+CHALLENGE_ID = 7
+
+
+@pytest.fixture(autouse=True)
+def dirs(tmp_path, monkeypatch):
+    upload = tmp_path / "upload"
+    legacy = tmp_path / "legacy"
+    (upload / str(CHALLENGE_ID)).mkdir(parents=True)
+    (legacy / str(CHALLENGE_ID)).mkdir(parents=True)
+    monkeypatch.setattr(file_service, "UPLOAD_DIR", upload)
+    monkeypatch.setattr(file_service, "LEGACY_PUBLIC_FILES_DIR", legacy)
+    return upload / str(CHALLENGE_ID), legacy / str(CHALLENGE_ID)
+
+
+async def test_author_file_named_like_bundle_is_kept(dirs):
+    upload_dir, _ = dirs
+    (upload_dir / f"challenge-{CHALLENGE_ID}.zip").write_bytes(b"author archive")
+    (upload_dir / "notes.txt").write_text("hello")
+    (upload_dir / "notes.txt.gz").write_bytes(b"author gzip")
+
+    await file_service.build_derived_files(CHALLENGE_ID)
+    await file_service.build_derived_files(CHALLENGE_ID)
+
+    assert (upload_dir / f"challenge-{CHALLENGE_ID}.zip").read_bytes() == b"author archive"
+    assert (upload_dir / "notes.txt.gz").read_bytes() == b"author gzip"
+    assert await file_service.list_files(CHALLENGE_ID) == [
+        f"challenge-{CHALLENGE_ID}.zip",
+        "notes.txt",
+        "notes.txt.gz",
+    ]
+
+
+async def test_bundle_contains_only_registered_files_including_legacy(dirs):
+    upload_dir, legacy_dir = dirs
+    (upload_dir / "a.c").write_text("int main;")
+    (upload_dir / "unlisted.txt").write_text("secret")
+    (legacy_dir / "b.py").write_text("print(1)")
+
+    zip_path = await file_service.get_bundle(CHALLENGE_ID, ["a.c", "b.py", "gone.bin"], "zip")
+    with zipfile.ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == ["a.c", "b.py"]
+
+    tar_path = await file_service.get_bundle(CHALLENGE_ID, ["a.c", "b.py"], "tar.gz")
+    with tarfile.open(tar_path) as tf:
+        assert sorted(tf.getnames()) == ["a.c", "b.py"]
+
+    assert await file_service.get_bundle(CHALLENGE_ID, ["gone.bin"], "zip") is None
+
+
+async def test_bundle_changes_with_file_contents(dirs):
+    upload_dir, _ = dirs
+    source = upload_dir / "a.c"
+    source.write_text("v1")
+    first = await file_service.get_bundle(CHALLENGE_ID, ["a.c"], "zip")
+    source.write_text("version 2")
+    second = await file_service.get_bundle(CHALLENGE_ID, ["a.c"], "zip")
+    assert first != second
+    with zipfile.ZipFile(second) as zf:
+        assert zf.read("a.c") == b"version 2"
+
+
+def test_concurrent_bundle_builds_do_not_collide(dirs):
+    upload_dir, _ = dirs
+    for i in range(20):
+        (upload_dir / f"f{i}.txt").write_bytes(bytes(range(256)) * 200)
+    sources = sorted(upload_dir.iterdir())
+    errors = []
+
+    def build():
+        try:
+            file_service._build_bundle_sync(CHALLENGE_ID, sources, "zip")
+        except Exception as exc:  # pragma: no cover - 실패 시 원인 표시용
+            errors.append(exc)
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    bundle_dir = upload_dir / file_service.BUNDLE_DIR_NAME
+    bundles = list(bundle_dir.iterdir())
+    assert len(bundles) == 1
+    with zipfile.ZipFile(bundles[0]) as zf:
+        assert zf.testzip() is None
+
+
+async def test_precompressed_variants_and_encoding_negotiation(dirs):
+    upload_dir, _ = dirs
+    source = upload_dir / "exploit.py"
+    source.write_text("print('A' * 64)\n" * 100)
+    await file_service.build_derived_files(CHALLENGE_ID)
+
+    encoded_dir = upload_dir / file_service.ENCODED_DIR_NAME
+    assert gzip.decompress((encoded_dir / "exploit.py.gz").read_bytes()) == source.read_bytes()
+
+    assert file_service.select_encoded_variant(source, None) == (source, None)
+    assert file_service.select_encoded_variant(source, "gzip;q=0") == (source, None)
+    assert file_service.select_encoded_variant(source, "gzip;q=0, br;q=0, *") == (source, None)
+    path, encoding = file_service.select_encoded_variant(source, "br;q=0, *")
+    assert (path, encoding) == (encoded_dir / "exploit.py.gz", "gzip")
+    path, encoding = file_service.select_encoded_variant(source, "gzip, deflate")
+    assert (path, encoding) == (encoded_dir / "exploit.py.gz", "gzip")
+    if file_service.brotli is not None:
+        path, encoding = file_service.select_encoded_variant(source, "gzip, br")
+        assert (path, encoding) == (encoded_dir / "exploit.py.br", "br")
@@ -0,0 +1,63 @@
+"""비밀번호 해싱 프로세스 풀 테스트."""
+
+import asyncio
+
+import bcrypt
+import pytest
+
+from app.core import hashing
+
+
+@pytest.fixture(autouse=True)
+def fast_pool(monkeypatch):
+    monkeypatch.setattr(hashing.settings, "BCRYPT_ROUNDS", 4)
+    monkeypatch.setattr(hashing.settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(hashing.settings, "PASSWORD_HASH_MAX_CONCURRENCY", 2)
+    # 세마포어는 이벤트 루프마다 새로 만든다
+    monkeypatch.setattr(hashing, "_semaphore", None)
+    yield
+    hashing.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("hashed", "expected"),
+    [
+        (bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=4)).decode(), False),
+        (bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode(), True),
+        ("$2b$xx$broken", True),
+        ("plaintext", True),
+    ],
+)
+def test_needs_rehash(hashed, expected):
+    assert hashing.needs_rehash(hashed) is expected
+
+
+@pytest.mark.anyio
+async def test_hash_and_verify_in_pool():
+    hashed = await hashing.hash_password_async("s3cret")
+    assert hashed.startswith("$2b$04$")
+    assert await hashing.verify_password_async("s3cret", hashed)
+    assert not await hashing.verify_password_async("wrong", hashed)
+
+
+@pytest.mark.anyio
+async def test_concurrency_is_bounded_and_metered(monkeypatch):
+    peak = 0
+    original = hashing._run
+
+    async def spy(func, *args):
+        nonlocal peak
+        task = asyncio.ensure_future(original(func, *args))
+        await asyncio.sleep(0)
+        peak = max(peak, hashing._metrics["in_flight"])
+        return await task
+
+    monkeypatch.setattr(hashing, "_run", spy)
+    calls_before = hashing.get_metrics()["calls"]
+
+    await asyncio.gather(*(hashing.hash_password_async(f"pw{i}") for i in range(6)))
+
+    metrics = hashing.get_metrics()
+    assert metrics["calls"] - calls_before == 6
+    assert metrics["in_flight"] == 0 and metrics["waiting"] == 0
+    assert 1 <= peak <= 2
@@ -0,0 +1,143 @@
+"""조건부 GET 미들웨어 테스트 (ETag/304, Cache-Control, 캐시 규칙)."""
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core import http_cache
+from app.core.http_cache import CacheRule, HTTPCacheMiddleware
+from app.main import HTTP_CACHE_RULES
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(http_cache, "get_redis_client", lambda: fake_redis)
+    return fake_redis
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(calls):
+    async def items(request):
+        calls.append(request.url.path)
+        return JSONResponse({"ok": True})
+
+    async def missing(request):
+        calls.append(request.url.path)
+        return JSONResponse({"detail": "x"}, status_code=404)
+
+    rules = [
+        CacheRule("items", r"/items", lambda user_id: ["ver:items"]),
+        CacheRule(
+            "mine",
+            r"/mine",
+            lambda user_id: ["ver:items", *([f"ver:user:{user_id}"] if user_id else [])],
+            per_user=True,
+        ),
+        CacheRule("missing", r"/missing", lambda _: ["ver:items"]),
+    ]
+    app = Starlette(
+        routes=[Route("/items", items), Route("/mine", items), Route("/missing", missing)]
+    )
+    app = HTTPCacheMiddleware(app, rules)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_matching_etag_skips_route(redis, client, calls):
+    first = await client.get("/items")
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("public, max-age=0, s-maxage=")
+    second = await client.get("/items", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert calls == ["/items"]
+
+
+async def test_version_bump_changes_etag(redis, client):
+    etag = (await client.get("/items")).headers["etag"]
+    await redis.incr("ver:items")
+
+    response = await client.get("/items", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+async def test_query_string_is_part_of_etag(redis, client):
+    etag = (await client.get("/items?page=1")).headers["etag"]
+
+    assert (await client.get("/items?page=2")).headers["etag"] != etag
+
+
+async def test_authenticated_per_user_response_is_private(redis, client, monkeypatch):
+    async def user_id(headers):
+        return 7
+
+    monkeypatch.setattr(http_cache, "_user_id", user_id)
+    anonymous = await client.get("/mine")
+    response = await client.get("/mine", headers={"Authorization": "Bearer t"})
+
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "Authorization" in response.headers["vary"]
+    assert response.headers["etag"] != anonymous.headers["etag"]
+    assert await redis.exists("ver:user:7")
+
+
+async def test_error_response_gets_no_cache_headers(redis, client):
+    response = await client.get("/missing")
+
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+
+
+async def test_without_redis_passes_through(monkeypatch, client, calls):
+    monkeypatch.setattr(http_cache, "get_redis_client", lambda: None)
+    response = await client.get("/items", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert calls == ["/items"]
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('W/"a-1"', True),
+        ('"a-1"', True),
+        ('W/"b-2", W/"a-1"', True),
+        ("*", True),
+        ('W/"a-2"', False),
+    ],
+)
+def test_etag_weak_comparison(header, expected):
+    assert http_cache._etag_matches(header, 'W/"a-1"') is expected
+
+
+@pytest.mark.parametrize(
+    ("path", "rule"),
+    [
+        ("/api/v1/challenges", "challenges"),
+        ("/api/v1/challenges/search", "challenges"),
+        ("/api/v1/challenges/3", "challenge"),
+        ("/api/v1/scoreboards", "scoreboard"),
+        ("/api/v1/writeups", "writeups"),
+        ("/api/v1/writeups/search", "writeups"),
+        # 비공개일 수 있는 상세 조회는 공개 캐시하지 않는다
+        ("/api/v1/writeups/3", None),
+        ("/api/v1/challenges/3/files/1", None),
+    ],
+)
+def test_public_cache_rules(path, rule):
+    matched = HTTPCacheMiddleware(None, HTTP_CACHE_RULES)._match(path)
+
+    assert (matched.name if matched else None) == rule
@@ -0,0 +1,203 @@
+"""알림 서비스 테스트 (Redis 미읽음 카운터/버전/채널 반영, 일괄 생성/브로드캐스트, 정리)."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core import post_commit
+from app.models.notification import Notification
+from app.services import notification_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(notification_service, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(notification_service, "_incr_if_exists", None)
+    monkeypatch.setattr(notification_service, "_set_if_version", None)
+    return fake_redis
+
+
+async def test_unread_delta_only_updates_existing_counter(redis):
+    await notification_service._apply_events([{"user_id": 1, "unread_delta": 1}])
+    assert await redis.get("notif:unread:1") is None
+
+    await redis.set("notif:unread:1", 2)
+    await notification_service._apply_events(
+        [{"user_id": 1, "unread_delta": 1}, {"user_id": 1, "unread_delta": -1}]
+    )
+    assert await redis.get("notif:unread:1") == "2"
+
+
+async def test_negative_counter_is_dropped(redis):
+    await redis.set("notif:unread:1", 0)
+    await notification_service._apply_events([{"user_id": 1, "unread_delta": -1}])
+
+    assert await redis.get("notif:unread:1") is None
+
+
+async def test_events_bump_version_and_publish(redis):
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(notification_service.channel_name(1))
+    await pubsub.get_message(timeout=1)
+
+    payload = {"type": "notification", "item": {"id": 7}}
+    await notification_service._apply_events(
+        [{"user_id": 1, "unread_set": 0}, {"user_id": 1, "payload": payload}]
+    )
+
+    assert await redis.get("notif:unread:1") == "0"
+    assert await redis.get("notif:ver:1") == "2"
+    message = await pubsub.get_message(timeout=1)
+    assert json.loads(message["data"]) == payload
+    await pubsub.aclose()
+
+
+async def test_list_version_changes_after_event():
+    before = await notification_service.get_list_version(1)
+    assert before == await notification_service.get_list_version(1)
+
+    await notification_service._apply_events([{"user_id": 1}])
+    assert await notification_service.get_list_version(1) != before
+
+
+async def test_cached_unread_count_skips_db(redis):
+    await redis.set("notif:unread:1", 5)
+
+    assert await notification_service._count_personal_unread(None, 1) == 5
+
+
+class CountingDB:
+    """미읽음 수 조회 대역. 조회 도중 실행할 작업(동시 커밋)을 지정할 수 있다."""
+
+    def __init__(self, count: int, during_count=None) -> None:
+        self.count = count
+        self.during_count = during_count
+
+    async def execute(self, statement):
+        if self.during_count is not None:
+            await self.during_count()
+        return self
+
+    def scalar(self) -> int:
+        return self.count
+
+
+async def test_db_count_is_cached_when_version_is_unchanged(redis):
+    assert await notification_service._count_personal_unread(CountingDB(3), 1) == 3
+
+    assert await redis.get("notif:unread:1") == "3"
+
+
+async def test_db_count_is_not_cached_after_concurrent_event(redis):
+    async def concurrent_notification():
+        await notification_service._apply_events([{"user_id": 1, "unread_delta": 1}])
+
+    db = CountingDB(3, during_count=concurrent_notification)
+    assert await notification_service._count_personal_unread(db, 1) == 3
+
+    # 센 뒤에 반영된 알림이 있으므로 낡은 값을 저장하지 않는다
+    assert await redis.get("notif:unread:1") is None
+
+
+async def test_failed_events_drop_counter_and_version(redis, monkeypatch):
+    await redis.set("notif:unread:1", 2)
+    await redis.set("notif:ver:1", 5)
+    await redis.set("notif:ver:2", 7)
+
+    async def broken_incr(key):
+        raise notification_service.RedisError("down")
+
+    monkeypatch.setattr(redis, "incr", broken_incr)
+    await notification_service._apply_events([{"user_id": 1, "unread_delta": 1}])
+
+    assert await redis.get("notif:unread:1") is None
+    assert await redis.get("notif:ver:1") is None
+    assert await redis.get("notif:ver:2") == "7"
+
+
+def _queued_events(db) -> list[dict]:
+    return post_commit.peek(db.sync_session, notification_service._EVENTS_KEY) or []
+
+
+@pytest.mark.postgres
+async def test_bulk_insert_queues_one_event_per_user(pg_session, make_user):
+    users = [await make_user() for _ in range(3)]
+
+    created = await notification_service.create_notifications_bulk(
+        pg_session, [u.id for u in users], "system", "공지", "본문"
+    )
+
+    assert created == 3
+    events = _queued_events(pg_session)
+    assert sorted(e["user_id"] for e in events) == sorted(u.id for u in users)
+    assert all(e["unread_delta"] == 1 and e["payload"]["item"]["id"] for e in events)
+    assert await notification_service.create_notifications_bulk(pg_session, [], "x", "y", "z") == 0
+
+
+@pytest.mark.postgres
+async def test_broadcast_is_one_row_read_through_cursor(pg_session, make_user):
+    member = await make_user()
+    broadcast = await notification_service.create_broadcast(pg_session, "new_challenge", "t", "m")
+    newcomer = await make_user()
+
+    assert await notification_service.get_unread_count(pg_session, member.id) == 1
+    # 가입 전에 만들어진 브로드캐스트는 보이지 않는다
+    assert await notification_service.get_unread_count(pg_session, newcomer.id) == 0
+
+    await notification_service.mark_broadcast_read(pg_session, broadcast.id, member.id)
+    assert await notification_service.get_unread_count(pg_session, member.id) == 0
+    assert _queued_events(pg_session)[0]["user_id"] == notification_service.BROADCAST
+
+
+async def _add_notifications(db, user_id: int, ages_days: list[int], is_read: bool) -> None:
+    now = datetime.now(UTC)
+    db.add_all(
+        Notification(
+            user_id=user_id,
+            type="system",
+            title="t",
+            message="m",
+            is_read=is_read,
+            created_at=now - timedelta(days=age),
+        )
+        for age in ages_days
+    )
+    await db.flush()
+
+
+async def _remaining_ages(db, user_id: int) -> list[int]:
+    result = await db.execute(
+        select(Notification.created_at).where(Notification.user_id == user_id)
+    )
+    now = datetime.now(UTC)
+    return sorted(round((now - created).total_seconds() / 86400) for created in result.scalars())
+
+
+@pytest.mark.postgres
+async def test_expired_read_batch_keeps_unread_and_recent(pg_session, make_user, monkeypatch):
+    monkeypatch.setattr(notification_service.settings, "NOTIFICATION_RETENTION_DAYS", 30)
+    user = await make_user()
+    await _add_notifications(pg_session, user.id, [40, 50, 5], is_read=True)
+    await _add_notifications(pg_session, user.id, [60], is_read=False)
+
+    deleted = await notification_service.delete_expired_read_batch(pg_session, batch_size=1)
+    assert deleted == [user.id]
+    deleted = await notification_service.delete_expired_read_batch(pg_session, batch_size=10)
+    assert deleted == [user.id]
+    assert await _remaining_ages(pg_session, user.id) == [5, 60]
+
+
+@pytest.mark.postgres
+async def test_trim_keeps_newest_per_user(pg_session, make_user, monkeypatch):
+    monkeypatch.setattr(notification_service.settings, "NOTIFICATION_MAX_PER_USER", 2)
+    heavy, light = await make_user(), await make_user()
+    await _add_notifications(pg_session, heavy.id, [1, 2, 3, 4], is_read=False)
+    await _add_notifications(pg_session, light.id, [1, 2], is_read=False)
+
+    assert heavy.id in await notification_service.trim_users_over_cap(pg_session, max_users=100)
+    assert await _remaining_ages(pg_session, heavy.id) == [1, 2]
+    assert await _remaining_ages(pg_session, light.id) == [1, 2]
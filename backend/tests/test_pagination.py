@@ -0,0 +1,72 @@
+"""Keyset 커서 인코딩/검증 테스트."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core.exceptions import BadRequestException
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services import writeup_service
+
+CREATED = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+
+
+def test_cursor_round_trips_datetime():
+    cursor = encode_cursor("newest", [CREATED, 42])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "newest") == [CREATED, 42]
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", encode_cursor("newest", [CREATED, 1])[:-4]])
+def test_corrupt_cursor_is_rejected(cursor):
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor, "newest")
+
+
+def test_cursor_of_other_sort_is_rejected():
+    with pytest.raises(BadRequestException):
+        decode_cursor(encode_cursor("oldest", [CREATED, 1]), "newest")
+
+
+@pytest.mark.parametrize(
+    ("sort", "values"),
+    [
+        ("newest", [CREATED, 1]),
+        ("oldest", [CREATED, 1]),
+        ("most_upvoted", [3, CREATED, 1]),
+    ],
+)
+def test_writeup_cursor_accepts_sort_key_types(sort, values):
+    keys, _ = writeup_service._SORT_KEYS[sort]
+    cursor = encode_cursor(sort, values)
+
+    assert writeup_service._decode_sort_cursor(cursor, sort, keys) == values
+
+
+@pytest.mark.parametrize(
+    ("sort", "values"),
+    [
+        ("newest", ["2026-03-01", 1]),
+        ("newest", [CREATED, "1"]),
+        ("newest", [CREATED.replace(tzinfo=None), 1]),
+        ("oldest", [CREATED]),
+        ("most_upvoted", [True, CREATED, 1]),
+        ("most_upvoted", [3.5, CREATED, 1]),
+        ("most_upvoted", [{"x": 1}, CREATED, 1]),
+    ],
+)
+def test_writeup_cursor_rejects_wrong_types(sort, values):
+    keys, _ = writeup_service._SORT_KEYS[sort]
+    cursor = encode_cursor(sort, values)
+
+    with pytest.raises(BadRequestException):
+        writeup_service._decode_sort_cursor(cursor, sort, keys)
+
+
+@pytest.mark.anyio
+async def test_list_rejects_bad_cursor_before_querying():
+    cursor = encode_cursor("newest", [None, None])
+
+    with pytest.raises(BadRequestException):
+        await writeup_service.list_writeups(None, sort="newest", cursor=cursor)
@@ -0,0 +1,66 @@
+"""제출 월별 파티션 관리 테스트."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.config import Settings
+from app.services import partition_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    ("month", "months", "expected"),
+    [
+        (date(2026, 1, 1), 0, date(2026, 1, 1)),
+        (date(2026, 11, 1), 2, date(2027, 1, 1)),
+        (date(2026, 1, 1), -1, date(2025, 12, 1)),
+        (date(2026, 3, 1), -27, date(2023, 12, 1)),
+    ],
+)
+def test_add_months(month, months, expected):
+    assert partition_service.add_months(month, months) == expected
+
+
+def test_partition_name_matches_listing_pattern():
+    name = partition_service.partition_name(date(2026, 3, 1))
+
+    assert name == "submissions_p202603"
+    assert partition_service._PARTITION_NAME.match(name).groups() == ("2026", "03")
+    assert not partition_service._PARTITION_NAME.match(partition_service.DEFAULT_PARTITION)
+
+
+def test_retention_is_opt_in():
+    assert Settings.model_fields["SUBMISSION_RETENTION_MONTHS"].default == 0
+
+
+@pytest.mark.parametrize("retention", [0, -1])
+async def test_zero_retention_archives_nothing(retention, tmp_path):
+    # 보관하지 않으면 DB에 접근하지 않는다
+    assert await partition_service.archive_expired_partitions(None, retention, tmp_path) == []
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.postgres
+async def test_ensure_partitions_is_idempotent(pg_session):
+    await partition_service.ensure_partitions(pg_session, 2)
+
+    months = set(await partition_service.list_partitions(pg_session))
+    start = partition_service.current_month()
+    assert {partition_service.add_months(start, n) for n in range(3)} <= months
+    assert await partition_service.ensure_partitions(pg_session, 2) == []
+
+
+@pytest.mark.postgres
+async def test_old_partition_is_exported_and_dropped(pg_session, tmp_path):
+    old = partition_service.add_months(partition_service.current_month(), -24)
+    name = partition_service.partition_name(old)
+    await partition_service._create_partition(pg_session, old)
+
+    archived = await partition_service.archive_expired_partitions(pg_session, 12, str(tmp_path))
+
+    assert tmp_path / f"{name}.csv.gz" in archived
+    assert old not in await partition_service.list_partitions(pg_session)
+    assert not await pg_session.scalar(text("SELECT to_regclass(:name)"), {"name": name})
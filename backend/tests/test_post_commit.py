@@ -0,0 +1,92 @@
+"""트랜잭션 커밋 후 작업 큐 테스트."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core import post_commit
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def received(monkeypatch):
+    """테스트 키로 들어온 값을 기록하는 핸들러를 등록한다."""
+    values = []
+
+    async def handler(value):
+        values.append(value)
+
+    monkeypatch.setitem(post_commit._handlers, "test", handler)
+    return values
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+async def _drain() -> None:
+    await asyncio.gather(*post_commit._background_tasks)
+
+
+async def test_commit_runs_handler_with_queued_value(session, received):
+    session.execute(text("SELECT 1"))
+    post_commit.pending(session, "test", list).append(1)
+    post_commit.pending(session, "test", list).append(2)
+    session.commit()
+    await _drain()
+
+    assert received == [[1, 2]]
+    assert post_commit.peek(session, "test") is None
+
+
+async def test_rollback_discards_queued_value(session, received):
+    session.execute(text("SELECT 1"))
+    post_commit.pending(session, "test", set).add("x")
+    session.rollback()
+    session.execute(text("SELECT 1"))
+    session.commit()
+    await _drain()
+
+    assert received == []
+
+
+async def test_savepoint_rollback_keeps_queued_value(session, received):
+    session.execute(text("SELECT 1"))
+    post_commit.pending(session, "test", list).append(1)
+    with pytest.raises(ValueError):
+        with session.begin_nested():
+            session.execute(text("SELECT 1"))
+            raise ValueError
+    with session.begin_nested():
+        post_commit.pending(session, "test", list).append(2)
+
+    assert post_commit.peek(session, "test") == [1, 2]
+    session.commit()
+    await _drain()
+
+    assert received == [[1, 2]]
+
+
+async def test_empty_value_is_not_dispatched(session, received):
+    session.execute(text("SELECT 1"))
+    post_commit.pending(session, "test", dict)
+    session.commit()
+    await _drain()
+
+    assert received == []
+
+
+def test_commit_outside_event_loop_drops_value(session, received):
+    session.execute(text("SELECT 1"))
+    post_commit.pending(session, "test", list).append(1)
+    session.commit()
+
+    assert received == []
+    assert post_commit.peek(session, "test") is None
@@ -0,0 +1,75 @@
+"""인증 주체(principal) 캐시 테스트."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import principal_cache
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSession:
+    """users 조회 결과 한 행을 돌려주는 세션 대역."""
+
+    def __init__(self, row):
+        self.row = row
+        self.queries = 0
+
+    async def execute(self, _statement):
+        self.queries += 1
+        return SimpleNamespace(first=lambda: self.row)
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch, fake_redis):
+    principal_cache._local_cache.clear()
+    monkeypatch.setattr(principal_cache, "get_redis_client", lambda: fake_redis)
+    yield
+    principal_cache._local_cache.clear()
+
+
+async def test_loads_once_then_serves_from_cache(fake_redis):
+    db = FakeSession(SimpleNamespace(id=5, username="alice", role="admin"))
+
+    first = await principal_cache.get_principal(db, 5)
+    second = await principal_cache.get_principal(db, 5)
+
+    assert first == second == principal_cache.Principal(5, "alice", "admin")
+    assert db.queries == 1
+    assert await fake_redis.hgetall("principal:5") == {"username": "alice", "role": "admin"}
+
+
+async def test_redis_shared_across_workers():
+    db = FakeSession(SimpleNamespace(id=5, username="alice", role="admin"))
+    await principal_cache.get_principal(db, 5)
+
+    principal_cache._local_cache.clear()  # 다른 워커
+    assert (await principal_cache.get_principal(db, 5)).role == "admin"
+    assert db.queries == 1
+
+
+async def test_invalidate_reloads_role(fake_redis):
+    db = FakeSession(SimpleNamespace(id=5, username="alice", role="admin"))
+    await principal_cache.get_principal(db, 5)
+
+    db.row = SimpleNamespace(id=5, username="alice", role="user")
+    await principal_cache.invalidate_principal(5)
+
+    assert (await principal_cache.get_principal(db, 5)).role == "user"
+    assert db.queries == 2
+
+
+async def test_missing_user_is_not_cached():
+    db = FakeSession(None)
+    assert await principal_cache.get_principal(db, 9) is None
+    assert await principal_cache.get_principal(db, 9) is None
+    assert db.queries == 2
+
+
+async def test_works_without_redis(monkeypatch):
+    monkeypatch.setattr(principal_cache, "get_redis_client", lambda: None)
+    db = FakeSession(SimpleNamespace(id=5, username="alice", role="admin"))
+    assert (await principal_cache.get_principal(db, 5)).username == "alice"
+    assert (await principal_cache.get_principal(db, 5)).username == "alice"
+    assert db.queries == 1
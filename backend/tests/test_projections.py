@@ -0,0 +1,74 @@
+"""목록 조회 컬럼 프로젝션과 카드 스키마 정합성 테스트."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.schemas.challenge import ChallengeSummary, CommunitySubmissionSummary
+from app.services.challenge_review_service import COMMUNITY_SUMMARY_COLUMNS
+from app.services.challenge_service import SUMMARY_COLUMNS
+
+CREATED = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+
+ROW = {
+    "id": 1,
+    "title": "baby rop",
+    "category": "pwn",
+    "difficulty": 2,
+    "points": 300,
+    "is_dynamic": True,
+    "tags": ["rop"],
+    "solve_count": 4,
+    "is_active": True,
+    "author_id": None,
+    "created_at": CREATED,
+}
+
+REVIEW = {
+    "description": "설명",
+    "source": "community",
+    "review_status": "pending",
+    "review_comment": None,
+    "reviewed_at": None,
+}
+
+
+def _labels(columns) -> set[str]:
+    return {column.key for column in columns}
+
+
+def _required(model) -> set[str]:
+    return {name for name, field in model.model_fields.items() if field.is_required()}
+
+
+@pytest.mark.parametrize(
+    ("model", "columns"),
+    [
+        (ChallengeSummary, SUMMARY_COLUMNS),
+        (CommunitySubmissionSummary, COMMUNITY_SUMMARY_COLUMNS),
+    ],
+)
+def test_projection_covers_model_fields(model, columns):
+    # model_construct는 검증하지 않으므로 빠진 컬럼은 직렬화 시점에야 드러난다
+    assert _required(model) <= _labels(columns)
+    assert _labels(columns) <= set(model.model_fields)
+
+
+@pytest.mark.parametrize(
+    ("model", "row"),
+    [
+        (ChallengeSummary, ROW),
+        (CommunitySubmissionSummary, {**ROW, **REVIEW}),
+    ],
+)
+def test_constructed_card_serializes_like_validated(model, row):
+    constructed = model.model_construct(**row)
+
+    assert constructed.model_dump(mode="json") == model.model_validate(row).model_dump(mode="json")
+    assert constructed.is_solved is False
+
+
+def test_search_rank_column_is_not_serialized():
+    card = ChallengeSummary.model_construct(**ROW, rank=0.5)
+
+    assert "rank" not in card.model_dump()
@@ -0,0 +1,133 @@
+"""풀이 조회 쿼리 실행 계획 테스트.
+
+풀이 여부/풀이 목록/대시보드 서비스 함수를 실제로 호출해 solves를 읽는 SQL을 수집하고,
+각 SQL의 EXPLAIN 결과가 solves 인덱스를 쓰는지(순차 스캔이 없는지) 확인한다.
+데이터는 pg_session의 트랜잭션 안에서 만들고 ANALYZE 하므로 테스트가 끝나면 롤백된다.
+"""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import event, text
+
+from app.services import challenge_service, dashboard_service
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+PREFIX = "plan_check_"
+USER_INDEXES = {"solves_pkey", "ix_solves_user_solved_at"}
+
+# (이름, 서비스 호출)
+CHECKS = [
+    ("solved ids", lambda db, uid, cid: challenge_service.get_solved_challenge_ids(db, uid)),
+    (
+        "already solved",
+        lambda db, uid, cid: challenge_service.check_already_solved(db, uid, cid),
+    ),
+    ("main category", lambda db, uid, cid: dashboard_service.get_main_category(db, uid)),
+    ("streak", lambda db, uid, cid: dashboard_service.get_streak_days(db, uid)),
+    (
+        "heatmap",
+        lambda db, uid, cid: dashboard_service.get_activity_heatmap(
+            db, uid, datetime.now(UTC).year
+        ),
+    ),
+    ("recent activity", lambda db, uid, cid: dashboard_service.get_recent_activity(db, uid)),
+]
+
+
+async def _seed(conn, users: int, challenges: int, solve_rate: float) -> None:
+    """점검용 유저/챌린지/풀이 데이터를 생성한다 (커밋하지 않는다)."""
+    await conn.execute(
+        text(
+            """
+            INSERT INTO users (username, email, password_hash)
+            SELECT :prefix || i, :prefix || i || '@example.com', 'x'
+            FROM generate_series(1, :users) AS i
+            """
+        ),
+        {"prefix": PREFIX, "users": users},
+    )
+    await conn.execute(
+        text(
+            """
+            INSERT INTO challenges (title, description, category, difficulty, flag_hash)
+            SELECT :prefix || i, 'plan check',
+                   (ARRAY['pwn', 'reversing', 'crypto', 'web', 'forensics', 'misc'])[1 + i % 6],
+                   1 + i % 5, md5(i::text)
+            FROM generate_series(1, :challenges) AS i
+            """
+        ),
+        {"prefix": PREFIX, "challenges": challenges},
+    )
+    await conn.execute(
+        text(
+            """
+            INSERT INTO solves (user_id, challenge_id, points_awarded, solved_at)
+            SELECT u.id, c.id, 100, now() - random() * interval '365 days'
+            FROM users u, challenges c
+            WHERE u.username LIKE :prefix || '%' AND c.title LIKE :prefix || '%'
+              AND random() < :solve_rate
+            """
+        ),
+        {"prefix": PREFIX, "solve_rate": solve_rate},
+    )
+    for table in ("users", "challenges", "solves"):
+        await conn.execute(text(f"ANALYZE {table}"))
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+async def _explain(conn, statement: str, parameters) -> tuple[set[str], bool]:
+    """(사용된 인덱스 이름, solves 순차 스캔 여부)를 반환한다."""
+    result = await conn.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", tuple(parameters or ())
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes = list(_walk(plan[0]["Plan"]))
+    indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+    seq_scan = any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "solves"
+        for node in nodes
+    )
+    return indexes, seq_scan
+
+
+async def test_solve_queries_use_solves_indexes(pg_session):
+    conn = await pg_session.connection()
+    await _seed(conn, users=2000, challenges=200, solve_rate=0.1)
+    user_id = await conn.scalar(
+        text("SELECT min(id) FROM users WHERE username LIKE :p"), {"p": f"{PREFIX}%"}
+    )
+    challenge_id = await conn.scalar(
+        text("SELECT min(id) FROM challenges WHERE title LIKE :p"), {"p": f"{PREFIX}%"}
+    )
+
+    captured: list[tuple[str, object]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if "solves" in statement and not statement.startswith("EXPLAIN"):
+            captured.append((statement, parameters))
+
+    failures = []
+    event.listen(conn.sync_connection, "before_cursor_execute", capture)
+    try:
+        for name, call in CHECKS:
+            captured.clear()
+            await call(pg_session, user_id, challenge_id)
+            assert captured, name
+            for statement, parameters in list(captured):
+                indexes, seq_scan = await _explain(conn, statement, parameters)
+                if not indexes & USER_INDEXES or seq_scan:
+                    failures.append((name, sorted(indexes), seq_scan))
+    finally:
+        event.remove(conn.sync_connection, "before_cursor_execute", capture)
+
+    assert failures == []
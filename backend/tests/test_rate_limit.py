@@ -0,0 +1,93 @@
+"""Rate limit 테스트 (클라이언트 IP 판별, Redis Lua 알고리즘)."""
+
+from ipaddress import ip_network
+from types import SimpleNamespace
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.api import deps
+from app.core import rate_limit
+from app.core.exceptions import RateLimitException
+from app.core.rate_limit import RateLimitAlgorithm
+
+
+def _request(peer: str | None, real_ip: str | None = None) -> SimpleNamespace:
+    headers = {"x-real-ip": real_ip} if real_ip else {}
+    client = SimpleNamespace(host=peer) if peer else None
+    return SimpleNamespace(client=client, headers=headers)
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    monkeypatch.setattr(deps, "_TRUSTED_PROXIES", [ip_network("172.16.0.0/12")])
+
+
+def test_client_ip_ignores_header_from_untrusted_peer(trusted):
+    assert deps.client_ip(_request("203.0.113.7", "10.0.0.1")) == "203.0.113.7"
+
+
+def test_client_ip_uses_header_from_trusted_proxy(trusted):
+    assert deps.client_ip(_request("172.18.0.5", "198.51.100.9")) == "198.51.100.9"
+    assert deps.client_ip(_request("172.18.0.5")) == "172.18.0.5"
+
+
+def test_client_ip_without_trusted_proxies_uses_socket(monkeypatch):
+    monkeypatch.setattr(deps, "_TRUSTED_PROXIES", [])
+    assert deps.client_ip(_request("127.0.0.1", "198.51.100.9")) == "127.0.0.1"
+    assert deps.client_ip(_request(None, "198.51.100.9")) == "unknown"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("algorithm", list(RateLimitAlgorithm))
+async def test_redis_limit_allows_up_to_max(algorithm):
+    redis = FakeAsyncRedis(decode_responses=True)
+    for _ in range(3):
+        await rate_limit.check_rate_limit(redis, "k", 3, 60, algorithm)
+
+    with pytest.raises(RateLimitException) as exc_info:
+        await rate_limit.check_rate_limit(redis, "k", 3, 60, algorithm)
+    # sliding_window는 직전 버킷의 가중치가 남으므로 최대 두 윈도우까지 기다릴 수 있다
+    assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 120
+    # 다른 키는 영향을 받지 않는다
+    await rate_limit.check_rate_limit(redis, "other", 3, 60, algorithm)
+
+
+@pytest.mark.anyio
+async def test_redis_outage_fails_open():
+    server = FakeServer()
+    server.connected = False
+    redis = FakeAsyncRedis(server=server, decode_responses=True)
+
+    await rate_limit.check_rate_limit(redis, "k", 1, 60)
+    await rate_limit.check_rate_limit(redis, "k", 1, 60)
+
+
+def test_local_bucket_refills_over_time(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    bucket = rate_limit.LocalTokenBucket()
+
+    assert [bucket.consume("k", 2, 10) for _ in range(2)] == [0.0, 0.0]
+    assert bucket.consume("k", 2, 10) == pytest.approx(5.0)
+
+    now[0] += 5
+    assert bucket.consume("k", 2, 10) == 0.0
+    assert bucket.consume("k", 2, 10) > 0
+
+
+def test_local_bucket_evicts_least_recent_key():
+    bucket = rate_limit.LocalTokenBucket(max_keys=2)
+    for key in ("a", "b", "a", "c"):
+        bucket.consume(key, 5, 60)
+
+    assert list(bucket._buckets) == ["a", "c"]
+
+
+def test_local_prefilter_raises_with_retry_after(monkeypatch):
+    monkeypatch.setattr(rate_limit, "local_prefilter", rate_limit.LocalTokenBucket())
+    rate_limit.check_local_rate_limit("k", 1, 30)
+
+    with pytest.raises(RateLimitException) as exc_info:
+        rate_limit.check_local_rate_limit("k", 1, 30)
+    assert exc_info.value.headers["Retry-After"] == "30"
@@ -0,0 +1,118 @@
+"""응답 캐시 테스트 (버전 무효화, 로컬 폴백, 캐시 라우트의 세션)."""
+
+import inspect
+from typing import get_args
+
+import orjson
+import pytest
+from fastapi import params
+from pydantic import BaseModel
+
+from app.api import deps
+from app.api.v1 import challenges, scoreboards, users, writeups
+from app.core import response_cache
+
+pytestmark = pytest.mark.anyio
+
+
+class Page(BaseModel):
+    value: int
+
+
+@pytest.fixture
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(response_cache, "get_redis_client", lambda: fake_redis)
+    return fake_redis
+
+
+@pytest.fixture
+def local(monkeypatch):
+    monkeypatch.setattr(response_cache, "get_redis_client", lambda: None)
+    monkeypatch.setattr(response_cache, "_local_versions", {})
+    monkeypatch.setattr(response_cache, "_local_entries", response_cache.OrderedDict())
+
+
+@pytest.fixture
+def route():
+    """호출마다 증가한 값을 반환하는 캐시 라우트."""
+    calls = []
+
+    @response_cache.cached_response("test:{user_id}")
+    async def handler(db: object, user_id: int, limit: int = 10) -> Page:
+        calls.append((user_id, limit))
+        return Page(value=len(calls))
+
+    handler.calls = calls
+    return handler
+
+
+async def _get(route, **kwargs) -> tuple[dict, str]:
+    response = await route(db=object(), **kwargs)
+    return orjson.loads(response.body), response.headers["X-Cache"]
+
+
+@pytest.mark.parametrize("backend", ["redis", "local"])
+async def test_hit_until_namespace_bumped(request, backend, route):
+    request.getfixturevalue(backend)
+
+    assert await _get(route, user_id=1) == ({"value": 1}, "MISS")
+    assert await _get(route, user_id=1) == ({"value": 1}, "HIT")
+    assert await _get(route, user_id=1, limit=5) == ({"value": 2}, "MISS")
+    assert await _get(route, user_id=2) == ({"value": 3}, "MISS")
+
+    await response_cache.bump("test:1")
+
+    assert await _get(route, user_id=1) == ({"value": 4}, "MISS")
+    assert await _get(route, user_id=2) == ({"value": 3}, "HIT")
+
+
+async def test_result_read_before_bump_is_not_served(redis, route, monkeypatch):
+    original = response_cache._store
+
+    async def store_after_bump(*args):
+        # 조회와 저장 사이에 다른 요청이 데이터를 바꾸고 버전을 올린 경우
+        await response_cache.bump("test:1")
+        await original(*args)
+
+    monkeypatch.setattr(response_cache, "_store", store_after_bump)
+    assert await _get(route, user_id=1) == ({"value": 1}, "MISS")
+    monkeypatch.setattr(response_cache, "_store", original)
+
+    assert await _get(route, user_id=1) == ({"value": 2}, "MISS")
+
+
+async def test_missing_version_key_is_seeded_with_timestamp(redis, route):
+    await _get(route, user_id=1)
+    version = await redis.get(response_cache.version_key("test:1"))
+
+    assert int(version) > 10**18
+    await redis.delete(response_cache.version_key("test:1"))
+    assert await _get(route, user_id=1) == ({"value": 2}, "MISS")
+
+
+def test_encode_handles_models_inside_containers():
+    assert orjson.loads(response_cache.encode({"items": [Page(value=1)]})) == {
+        "items": [{"value": 1}]
+    }
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        scoreboards.get_scoreboard,
+        users.get_my_stats,
+        users.get_my_heatmap,
+        users.get_my_dashboard,
+        challenges.list_challenges,
+        challenges.search_challenges,
+        challenges.get_challenge,
+        writeups.list_writeups,
+        writeups.search_writeups,
+    ],
+)
+def test_cached_routes_read_from_primary(endpoint):
+    # 커밋 직후 올라간 버전으로 지연된 복제본의 결과를 저장하지 않도록 주 DB에서 읽는다
+    db = inspect.signature(endpoint).parameters["db"].annotation
+    dependency = next(arg for arg in get_args(db) if isinstance(arg, params.Depends))
+
+    assert dependency.dependency is deps.get_db_session
@@ -0,0 +1,79 @@
+"""Write-up sanitizer 테스트."""
+
+import random
+import time
+
+import pytest
+
+from app.core.sanitizer import render_markdown, sanitize_html, sanitize_markdown
+from app.services import writeup_service
+from scripts.bench_sanitizer import FRAGMENTS, _violations
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("a<script>alert(1)</script>b", "a b"),
+        ("a <SCRIPT src=x>alert(1)", "a "),
+        ('<img src=x onerror="alert(1)">', "<img src=x >"),
+        ("[x](javajavascript:script:alert(1))", "[x](alert(1))"),
+        ("<b>bold</b> `<i>` x < y", "<b>bold</b> `<i>` x < y"),
+    ],
+)
+def test_sanitize_markdown(content, expected):
+    assert sanitize_markdown(content) == expected
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('<a href="javascript:alert(1)">x</a>', "<a>x</a>"),
+        (
+            '<a href="https://example.com" onclick="x">x</a>',
+            '<a href="https://example.com" rel="nofollow noopener noreferrer">x</a>',
+        ),
+        ("<p>a<style>p{}</style>b<!-- c --></p>", "<p>ab</p>"),
+        ('<code class="language-py evil">x</code>', '<code class="language-py">x</code>'),
+        ("<marquee>x</marquee> 1 < 2", "x 1 &lt; 2"),
+    ],
+)
+def test_sanitize_html_allow_list(content, expected):
+    assert sanitize_html(content) == expected
+
+
+def test_render_escapes_raw_html():
+    rendered = render_markdown("# t\n\n<img src=x onerror=alert(1)>\n\n[a](javascript:x)")
+
+    assert "<h1>t</h1>" in rendered
+    assert "<img" not in rendered
+    # 링크로 만들지 않고 텍스트로 남긴다
+    assert "<a" not in rendered
+
+
+def test_fuzzed_input_keeps_invariants():
+    rng = random.Random(42)
+    for _ in range(2000):
+        sample = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 60)))
+        cleaned = sanitize_markdown(sample)
+
+        assert _violations(cleaned) == [], sample
+        assert sanitize_markdown(cleaned) == cleaned, sample
+        assert _violations(render_markdown(cleaned), rendered=True) == [], sample
+
+
+@pytest.mark.parametrize("unit", ["<a ", "<!", "<!--", "javajavascript:script:", "<script"])
+def test_pathological_input_is_linear(unit):
+    content = unit * (1_000_000 // len(unit))
+
+    started = time.perf_counter()
+    sanitize_markdown(content)
+    sanitize_html(content)
+    assert time.perf_counter() - started < 5
+
+
+@pytest.mark.anyio
+async def test_long_content_is_not_prerendered(monkeypatch):
+    monkeypatch.setattr(writeup_service.settings, "WRITEUP_RENDER_MAX_CHARS", 100)
+
+    assert await writeup_service.render_content("x" * 101) is None
+    assert await writeup_service.render_content("**x**") == "<p><strong>x</strong></p>\n"
@@ -0,0 +1,68 @@
+"""전문 검색 테스트 (검색어 변환, 커서, 생성 컬럼 정의)."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from app.core.exceptions import BadRequestException
+from app.core.pagination import encode_cursor
+from app.models import challenge, writeup
+from app.services import search_service
+
+
+@pytest.mark.parametrize(
+    ("term", "expected"),
+    [
+        ("SQL Injection", "sql:* & injection:*"),
+        ("buffer_overflow!!", "buffer:* & overflow:*"),
+        ("웹 해킹", "웹:* & 해킹:*"),
+        ("' & | ! :*", None),
+        (" ".join(f"t{i}" for i in range(20)), " & ".join(f"t{i}:*" for i in range(8))),
+    ],
+)
+def test_build_tsquery_text(term, expected):
+    assert search_service.build_tsquery_text(term) == expected
+
+
+def test_cursor_kind_is_bound_to_term_and_filters():
+    kind = search_service.cursor_kind("writeups", "sql", 1)
+
+    assert kind == search_service.cursor_kind("writeups", "sql", 1)
+    assert kind != search_service.cursor_kind("writeups", "sql", 2)
+    assert kind != search_service.cursor_kind("writeups", "xss", 1)
+    assert kind != search_service.cursor_kind("challenges", "sql", 1)
+
+
+def test_after_cursor_validates_values():
+    kind = search_service.cursor_kind("writeups", "sql")
+    rank = writeup.Writeup.id.cast(postgresql.DOUBLE_PRECISION)
+    search_service.after_cursor(rank, writeup.Writeup.id, encode_cursor(kind, [0.5, 3]), kind)
+
+    for values in ([0.5], ["0.5", 3], [0.5, 3.5]):
+        with pytest.raises(BadRequestException):
+            search_service.after_cursor(
+                rank, writeup.Writeup.id, encode_cursor(kind, values), kind
+            )
+
+
+@pytest.mark.parametrize(
+    ("module", "model"), [(challenge, challenge.Challenge), (writeup, writeup.Writeup)]
+)
+def test_search_vector_uses_shared_expression(module, model):
+    ddl = str(CreateTable(model.__table__).compile(dialect=postgresql.dialect()))
+
+    assert f"GENERATED ALWAYS AS ({module.SEARCH_VECTOR_SQL}) STORED" in ddl
+
+
+def test_search_vector_matches_migration():
+    path = Path(__file__).parents[1] / "alembic" / "versions" / "007_search_vectors.py"
+    spec = importlib.util.spec_from_file_location("migration_007", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    # 모델 식을 바꾸면 생성 컬럼을 다시 만드는 새 마이그레이션이 필요하다
+    assert migration.CHALLENGE_SEARCH_VECTOR_SQL == challenge.SEARCH_VECTOR_SQL
+    assert migration.WRITEUP_SEARCH_VECTOR_SQL == writeup.SEARCH_VECTOR_SQL
@@ -0,0 +1,69 @@
+"""JWT 생성/검증 및 claims 캐시 테스트."""
+
+from datetime import timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+from app.core import security
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(monkeypatch):
+    monkeypatch.setattr(security.settings, "JWT_CACHE_SIZE", 3)
+    security.clear_token_cache()
+    yield
+    security.clear_token_cache()
+
+
+@pytest.mark.parametrize("backend", ["jose", "pyjwt"])
+def test_decode_backends_agree(monkeypatch, backend):
+    monkeypatch.setattr(security.settings, "JWT_BACKEND", backend)
+    token = security.create_access_token({"sub": "42"})
+
+    payload = security.decode_token(token)
+    assert payload["sub"] == "42" and payload["type"] == "access"
+    assert security.decode_token(token + "x") is None
+
+
+def test_unknown_backend_rejected_at_startup():
+    with pytest.raises(ValidationError):
+        Settings(JWT_BACKEND="unknown")
+
+
+def test_cached_decode_skips_signature_check(monkeypatch):
+    token = security.create_access_token({"sub": "1"})
+    first = security.decode_token_cached(token)
+
+    monkeypatch.setattr(security, "decode_token", lambda _token: pytest.fail("cache miss"))
+    assert security.decode_token_cached(token) is first
+
+
+def test_invalid_tokens_are_not_cached():
+    assert security.decode_token_cached("not-a-jwt") is None
+    assert len(security._token_cache) == 0
+
+
+def test_expired_entries_are_dropped():
+    expired = security.create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=-1))
+    assert security.decode_token_cached(expired) is None
+
+    token = security.create_access_token({"sub": "2"})
+    payload = security.decode_token_cached(token)
+    # 캐시된 claims의 exp가 지나면 다시 검증한다
+    (key,) = security._token_cache
+    security._token_cache[key] = {**payload, "exp": 0}
+    assert security.decode_token_cached(token)["exp"] == payload["exp"]
+
+
+def test_cache_is_bounded_lru():
+    tokens = [security.create_access_token({"sub": str(i)}) for i in range(4)]
+    for token in tokens[:3]:
+        security.decode_token_cached(token)
+    security.decode_token_cached(tokens[0])  # 0번을 최근 사용으로 갱신
+    security.decode_token_cached(tokens[3])  # 가장 오래된 1번이 밀려난다
+
+    assert len(security._token_cache) == 3
+    cached_subs = {payload["sub"] for payload in security._token_cache.values()}
+    assert cached_subs == {"0", "2", "3"}
@@ -0,0 +1,167 @@
+"""풀이(solves) 테이블 기반 조회와 동시 정답 처리 테스트."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ConflictException
+from app.models.solve import Solve
+from app.models.submission import Submission
+from app.services import challenge_service, dashboard_service, scoring_service
+
+pytestmark = pytest.mark.anyio
+
+SOLVE_PREFIX = "pytest_solve_"
+
+
+def test_solves_table_keys_match_migration():
+    table = Solve.__table__
+
+    assert [column.name for column in table.primary_key] == ["user_id", "challenge_id"]
+    assert {index.name for index in table.indexes} == {
+        "ix_solves_user_solved_at",
+        "ix_solves_challenge_solved_at",
+    }
+
+
+@pytest.fixture
+def add_solve(pg_session):
+    async def add(user, challenge, days_ago: int = 0) -> None:
+        pg_session.add(
+            Solve(
+                user_id=user.id,
+                challenge_id=challenge.id,
+                points_awarded=challenge.points,
+                solved_at=datetime.now(UTC) - timedelta(days=days_ago),
+            )
+        )
+        await pg_session.flush()
+
+    return add
+
+
+@pytest.mark.postgres
+async def test_solved_lookups_read_solves(pg_session, make_user, make_challenge, add_solve):
+    user = await make_user()
+    solved, unsolved = await make_challenge(), await make_challenge()
+    await add_solve(user, solved)
+
+    assert await challenge_service.get_solved_challenge_ids(pg_session, user.id) == {solved.id}
+    assert await challenge_service.check_already_solved(pg_session, user.id, solved.id)
+    assert not await challenge_service.check_already_solved(pg_session, user.id, unsolved.id)
+
+
+@pytest.mark.postgres
+async def test_dashboard_reads_solves(pg_session, make_user, make_challenge, add_solve):
+    user = await make_user()
+    web = [await make_challenge(category="web") for _ in range(2)]
+    pwn = await make_challenge(category="pwn")
+    await add_solve(user, web[0], days_ago=0)
+    await add_solve(user, web[1], days_ago=1)
+    await add_solve(user, pwn, days_ago=3)
+
+    assert await dashboard_service.get_main_category(pg_session, user.id) == "web"
+    # 사흘 전 풀이는 하루 공백이 있어 연속 일수에 들어가지 않는다
+    assert await dashboard_service.get_streak_days(pg_session, user.id) == 2
+    recent = await dashboard_service.get_recent_activity(pg_session, user.id)
+    assert [item["challenge_id"] for item in recent] == [web[0].id, web[1].id, pwn.id]
+
+
+@pytest.mark.postgres
+async def test_scores_are_computed_from_solves(pg_session, make_user, make_challenge, add_solve):
+    user = await make_user()
+    crypto = await make_challenge(category="crypto", points=300)
+    misc = await make_challenge(category="misc", points=200)
+    await add_solve(user, crypto)
+    await add_solve(user, misc)
+
+    assert await scoring_service.recalculate_user_score(pg_session, user.id) == 500
+    board = await scoring_service.get_scoreboard(pg_session, category="crypto")
+    entry = next(e for e in board if e["user_id"] == user.id)
+    assert (entry["solved_count"], entry["total_score"]) == (1, 300)
+
+
+@pytest.mark.postgres
+async def test_concurrent_solves_keep_exact_order(pg_engine):
+    async with pg_engine.begin() as conn:
+        user_ids = list(
+            (
+                await conn.execute(
+                    text(
+                        """
+                        INSERT INTO users (username, email, password_hash)
+                        SELECT :prefix || i, :prefix || i || '@example.com', 'x'
+                        FROM generate_series(1, 20) AS i
+                        RETURNING id
+                        """
+                    ),
+                    {"prefix": SOLVE_PREFIX},
+                )
+            ).scalars()
+        )
+        challenge_id = await conn.scalar(
+            text(
+                """
+                INSERT INTO challenges (title, description, category, difficulty, flag_hash,
+                                        max_points, min_points, decay)
+                VALUES (:prefix, 'd', 'pwn', 1, 'x', 500, 50, 10)
+                RETURNING id
+                """
+            ),
+            {"prefix": SOLVE_PREFIX},
+        )
+
+    async def submit(user_id: int) -> tuple[int, bool] | None:
+        async with AsyncSession(pg_engine, expire_on_commit=False) as db:
+            db.add(
+                Submission(
+                    user_id=user_id,
+                    challenge_id=challenge_id,
+                    submitted_flag="FLAG{x}",
+                    is_correct=True,
+                )
+            )
+            try:
+                solved = await challenge_service.record_correct_solve(db, user_id, challenge_id)
+            except ConflictException:
+                solved = None
+            await db.commit()
+            return solved
+
+    try:
+        # 첫 유저는 같은 정답을 여섯 번 동시에 제출한다
+        results = await asyncio.gather(*(submit(uid) for uid in user_ids + [user_ids[0]] * 5))
+
+        solved = [result for result in results if result is not None]
+        assert len(solved) == 20
+        assert sum(first_blood for _, first_blood in solved) == 1
+        assert sorted(points for points, _ in solved) == sorted(
+            challenge_service.calculate_dynamic_points(500, 50, 10, rank)
+            for rank in range(1, 21)
+        )
+        async with pg_engine.connect() as conn:
+            counts = await conn.execute(
+                text(
+                    """
+                    SELECT c.solve_count,
+                           (SELECT count(*) FROM solves WHERE challenge_id = c.id),
+                           (SELECT count(*) FROM submissions WHERE challenge_id = c.id),
+                           (SELECT solved_count FROM users WHERE id = :uid)
+                    FROM challenges c WHERE c.id = :cid
+                    """
+                ),
+                {"cid": challenge_id, "uid": user_ids[0]},
+            )
+            # 중복 제출은 풀이로 기록되지 않지만 시도 로그에는 남는다
+            assert tuple(counts.one()) == (20, 20, 25, 1)
+    finally:
+        async with pg_engine.begin() as conn:
+            await conn.execute(
+                text("DELETE FROM challenges WHERE id = :cid"), {"cid": challenge_id}
+            )
+            await conn.execute(
+                text("DELETE FROM users WHERE username LIKE :p"), {"p": f"{SOLVE_PREFIX}%"}
+            )
@@ -0,0 +1,91 @@
+"""리프레시 토큰 패밀리 회전/폐기 테스트."""
+
+from types import SimpleNamespace
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.core import token_store
+from app.core.exceptions import ServiceUnavailableException, UnauthorizedException
+from app.core.security import create_refresh_token
+from app.services import auth_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch, fake_redis):
+    monkeypatch.setattr(token_store, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(token_store, "_rotate_script", None)
+    monkeypatch.setattr(token_store, "revocation_filter", token_store.RevocationFilter())
+    return fake_redis
+
+
+async def test_rotation_accepts_current_jti_once():
+    await token_store.start_family("fam1", 1, "jti-a")
+
+    assert await token_store.rotate("fam1", "jti-a", "jti-b") == token_store.ROTATED
+    assert await token_store.rotate("fam1", "jti-b", "jti-c") == token_store.ROTATED
+
+
+async def test_reuse_of_rotated_jti_revokes_family(store):
+    await token_store.start_family("fam1", 1, "jti-a")
+    await token_store.rotate("fam1", "jti-a", "jti-b")
+
+    assert await token_store.rotate("fam1", "jti-a", "jti-x") == token_store.REUSE_DETECTED
+    # 정상 토큰(jti-b)도 더 이상 쓸 수 없다
+    assert await token_store.rotate("fam1", "jti-b", "jti-y") == token_store.FAMILY_MISSING
+    assert await store.zscore(token_store.REVOKED_KEY, "fam1") is not None
+    assert await token_store.is_revoked({"fam": "fam1", "jti": "jti-b"})
+
+
+async def test_unknown_family_is_missing():
+    assert await token_store.rotate("nope", "jti", "new") == token_store.FAMILY_MISSING
+
+
+async def test_revoke_family_is_seen_by_other_workers():
+    await token_store.start_family("fam1", 1, "jti-a")
+    await token_store.revoke_family("fam1")
+
+    other_worker = token_store.RevocationFilter()
+    await other_worker.sync()
+    assert other_worker.might_be_revoked("fam1")
+    assert not other_worker.might_be_revoked("fam2")
+    assert await token_store.is_revoked({"fam": "fam1", "jti": "x"})
+    assert not await token_store.is_revoked({"fam": "fam2", "jti": "y"})
+
+
+async def test_redis_outage_fails_closed(monkeypatch):
+    server = FakeServer()
+    server.connected = False
+    broken = FakeAsyncRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(token_store, "get_redis_client", lambda: broken)
+
+    for call in (
+        token_store.start_family("fam1", 1, "jti"),
+        token_store.rotate("fam1", "jti", "new"),
+        token_store.revoke_family("fam1"),
+    ):
+        with pytest.raises(ServiceUnavailableException):
+            await call
+
+
+async def test_legacy_refresh_token_without_family_is_rejected():
+    class Session:
+        async def execute(self, _statement):
+            return SimpleNamespace(scalar_one_or_none=lambda: 1)
+
+    legacy = create_refresh_token({"sub": "1"})  # fam 없음
+    with pytest.raises(UnauthorizedException):
+        await auth_service.refresh_token(Session(), legacy)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = token_store.BloomFilter(size_bits=1 << 16, num_hashes=5)
+    members = [f"fam-{i}" for i in range(2000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 200
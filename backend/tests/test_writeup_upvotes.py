@@ -0,0 +1,106 @@
+"""Write-up 추천 수 집계/반영과 공개 Write-up 수 캐시 테스트."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select, text, update
+from sqlalchemy.orm import Session
+
+from app.core import post_commit
+from app.models.challenge import Challenge
+from app.models.writeup import Writeup, WriteupVote
+from app.services import writeup_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def redis(monkeypatch, fake_redis):
+    monkeypatch.setattr(writeup_service, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(writeup_service, "_take_script", None)
+    return fake_redis
+
+
+async def test_take_moves_pending_to_flushing(redis):
+    await redis.hincrby(writeup_service.PENDING_UPVOTES_KEY, "1", 2)
+    await redis.hincrby(writeup_service.PENDING_UPVOTES_KEY, "2", 1)
+
+    assert await writeup_service.take_pending_upvotes() == {1: 2, 2: 1}
+    assert not await redis.exists(writeup_service.PENDING_UPVOTES_KEY)
+    # 반영 중 증가분도 조회 값에 포함된다
+    assert await writeup_service._pending_upvotes([1, 3]) == {1: 2}
+
+
+async def test_unfinished_flush_is_taken_again_before_new_votes(redis):
+    await redis.hincrby(writeup_service.PENDING_UPVOTES_KEY, "1", 1)
+    await writeup_service.take_pending_upvotes()
+    await redis.hincrby(writeup_service.PENDING_UPVOTES_KEY, "2", 1)
+
+    assert await writeup_service.take_pending_upvotes() == {1: 1}
+    await writeup_service.clear_flushed_upvotes()
+    assert await writeup_service.take_pending_upvotes() == {2: 1}
+    await writeup_service.clear_flushed_upvotes()
+    assert await writeup_service.take_pending_upvotes() == {}
+
+
+async def test_vote_is_queued_without_bumping_response_cache(redis, monkeypatch):
+    bumped = []
+
+    async def bump(*namespaces):
+        bumped.extend(namespaces)
+
+    monkeypatch.setattr(writeup_service.response_cache, "bump", bump)
+    await writeup_service.record_upvote(None, 1)
+
+    assert await redis.hget(writeup_service.PENDING_UPVOTES_KEY, "1") == "1"
+    # 캐시 버전은 주기 태스크가 반영한 뒤에만 올린다
+    assert bumped == []
+
+
+async def test_count_cache_is_dropped_after_commit(redis):
+    await redis.set(writeup_service._count_key(None), 5)
+    await redis.set(writeup_service._count_key(7), 2)
+    await redis.set(writeup_service._count_key(8), 3)
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        session.execute(text("SELECT 1"))
+        writeup_service._invalidate_counts(SimpleNamespace(sync_session=session), 7)
+
+        # 커밋 전에는 지우지 않는다 (다른 요청이 옛 수를 다시 채우지 않도록)
+        assert await redis.get(writeup_service._count_key(7)) == "2"
+        session.commit()
+        await asyncio.gather(*post_commit._background_tasks)
+    engine.dispose()
+
+    assert await redis.get(writeup_service._count_key(None)) is None
+    assert await redis.get(writeup_service._count_key(7)) is None
+    assert await redis.get(writeup_service._count_key(8)) == "3"
+
+
+@pytest.mark.postgres
+async def test_recount_is_idempotent_and_keeps_legacy_votes(pg_session, make_user):
+    author, voter_a, voter_b = await make_user(), await make_user(), await make_user()
+    challenge = Challenge(
+        title="pytest upvotes", description="d", category="misc", difficulty=1, flag_hash="x"
+    )
+    pg_session.add(challenge)
+    await pg_session.flush()
+    writeup = Writeup(
+        user_id=author.id, challenge_id=challenge.id, content="x" * 20, legacy_upvotes=3
+    )
+    pg_session.add(writeup)
+    await pg_session.flush()
+    pg_session.add_all(
+        WriteupVote(user_id=voter.id, writeup_id=writeup.id) for voter in (voter_a, voter_b)
+    )
+    await pg_session.flush()
+
+    assert await writeup_service.recount_upvotes(pg_session, [writeup.id]) == 1
+    # 같은 반영을 다시 실행해도 값이 바뀌지 않는다
+    assert await writeup_service.recount_upvotes(pg_session, [writeup.id]) == 0
+    await pg_session.execute(update(Writeup).where(Writeup.id == writeup.id).values(upvotes=99))
+    await writeup_service.recount_upvotes(pg_session)
+
+    upvotes = await pg_session.scalar(select(Writeup.upvotes).where(Writeup.id == writeup.id))
+    assert upvotes == 5
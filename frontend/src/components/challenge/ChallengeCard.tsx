@@ -1,11 +1,11 @@
 import { Link } from "react-router-dom";
-import type { Challenge } from "../../types/challenge";
+import type { ChallengeSummary } from "../../types/challenge";
 import BrutalCard from "../ui/BrutalCard";
 import BrutalBadge from "../ui/BrutalBadge";
 import { getCategoryColor } from "../../utils/categoryColors";
 
 interface ChallengeCardProps {
-  challenge: Challenge;
+  challenge: ChallengeSummary;
 }
 
 function ChallengeCard({ challenge }: ChallengeCardProps) {
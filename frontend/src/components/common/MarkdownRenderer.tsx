@@ -1,15 +1,28 @@
+import { useEffect, useRef } from "react";
 import ReactMarkdown from "react-markdown";
 import remarkGfm from "remark-gfm";
 import rehypeSanitize from "rehype-sanitize";
 import rehypeHighlight from "rehype-highlight";
+import hljs from "highlight.js/lib/common";
 import "highlight.js/styles/github-dark.css";
 
 interface MarkdownRendererProps {
   content: string;
+  /** 서버에서 렌더링·sanitize한 HTML. 있으면 Markdown 렌더링을 건너뛴다. */
+  html?: string | null;
   className?: string;
 }
 
-function MarkdownRenderer({ content, className = "" }: MarkdownRendererProps) {
+function MarkdownRenderer({ content, html, className = "" }: MarkdownRendererProps) {
+  const htmlRef = useRef<HTMLDivElement>(null);
+
+  // 사전 렌더링된 HTML은 rehype-highlight를 거치지 않으므로 코드 블록을 직접 하이라이트한다
+  useEffect(() => {
+    htmlRef.current?.querySelectorAll<HTMLElement>("pre code").forEach((block) => {
+      hljs.highlightElement(block);
+    });
+  }, [html]);
+
   return (
     <div
       className={`prose dark:prose-invert prose-sm max-w-none
@@ -30,12 +43,16 @@ function MarkdownRenderer({ content, className = "" }: MarkdownRendererProps) {
         prose-hr:border-border
         ${className}`}
     >
-      <ReactMarkdown
-        remarkPlugins={[remarkGfm]}
-        rehypePlugins={[rehypeSanitize, rehypeHighlight]}
-      >
-        {content}
-      </ReactMarkdown>
+      {html ? (
+        <div ref={htmlRef} dangerouslySetInnerHTML={{ __html: html }} />
+      ) : (
+        <ReactMarkdown
+          remarkPlugins={[remarkGfm]}
+          rehypePlugins={[rehypeSanitize, rehypeHighlight]}
+        >
+          {content}
+        </ReactMarkdown>
+      )}
     </div>
   );
 }
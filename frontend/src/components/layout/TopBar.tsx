@@ -5,6 +5,8 @@ import {
   fetchNotifications,
   markAsRead,
   markAllAsRead,
+  markBroadcastAsRead,
+  subscribeNotifications,
   type Notification,
 } from "../../services/notifications";
 import BrutalButton from "../ui/BrutalButton";
@@ -17,6 +19,7 @@ function TopBar() {
   const [unreadCount, setUnreadCount] = useState(0);
   const [showDropdown, setShowDropdown] = useState(false);
   const dropdownRef = useRef<HTMLDivElement>(null);
+  const pushConnected = useRef(false);
 
   useEffect(() => {
     if (!user) return;
@@ -29,8 +32,38 @@ function TopBar() {
         .catch(() => {});
     };
     load();
-    const interval = setInterval(load, 30000);
-    return () => clearInterval(interval);
+    let wasDisconnected = false;
+    // WebSocket 푸시가 연결되어 있으면 폴링을 건너뛴다
+    const interval = setInterval(() => {
+      if (!pushConnected.current) load();
+    }, 30000);
+    const unsubscribe = subscribeNotifications(
+      (msg) => {
+        if (msg.type === "unread_count") {
+          setUnreadCount(msg.unread_count);
+        } else {
+          setNotifications((prev) =>
+            [
+              msg.item,
+              ...prev.filter(
+                (n) => n.id !== msg.item.id || n.broadcast !== msg.item.broadcast
+              ),
+            ].slice(0, 10)
+          );
+          setUnreadCount((prev) => prev + 1);
+        }
+      },
+      (connected) => {
+        // 재접속 시 끊긴 동안의 알림을 다시 불러온다
+        if (connected && wasDisconnected) load();
+        wasDisconnected = !connected;
+        pushConnected.current = connected;
+      }
+    );
+    return () => {
+      clearInterval(interval);
+      unsubscribe();
+    };
   }, [user]);
 
   useEffect(() => {
@@ -53,10 +86,24 @@ function TopBar() {
   };
 
   const handleNotifClick = async (notif: Notification) => {
-    if (!notif.is_read) {
+    if (!notif.is_read && notif.broadcast) {
+      // 브로드캐스트는 읽음 커서 방식이라 이전 브로드캐스트도 함께 읽음 처리된다
+      await markBroadcastAsRead(notif.id);
+      const cleared = notifications.filter(
+        (n) => n.broadcast && !n.is_read && n.id <= notif.id
+      ).length;
+      setNotifications((prev) =>
+        prev.map((n) =>
+          n.broadcast && n.id <= notif.id ? { ...n, is_read: true } : n
+        )
+      );
+      setUnreadCount((prev) => Math.max(0, prev - cleared));
+    } else if (!notif.is_read) {
       await markAsRead(notif.id);
       setNotifications((prev) =>
-        prev.map((n) => (n.id === notif.id ? { ...n, is_read: true } : n))
+        prev.map((n) =>
+          !n.broadcast && n.id === notif.id ? { ...n, is_read: true } : n
+        )
       );
       setUnreadCount((prev) => Math.max(0, prev - 1));
     }
@@ -136,7 +183,7 @@ function TopBar() {
                     ) : (
                       notifications.map((n, idx) => (
                         <button
-                          key={n.id}
+                          key={`${n.broadcast ? "b" : "n"}-${n.id}`}
                           onClick={() => handleNotifClick(n)}
                           className={`block w-full px-4 py-3 text-left hover:bg-neon/5 border-b border-border/30 ${
                             idx % 2 === 1 ? "bg-muted/30" : ""
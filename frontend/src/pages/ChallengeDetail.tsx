@@ -214,6 +214,16 @@ function ChallengeDetail() {
                   </BrutalButton>
                 </a>
               ))}
+              {challenge.files.length > 1 && (
+                <a
+                  href={`${API_BASE_URL}/challenges/${challenge.id}/bundle?format=zip`}
+                  download
+                >
+                  <BrutalButton variant="ghost" size="sm" className="border-2 border-border">
+                    Download all (.zip)
+                  </BrutalButton>
+                </a>
+              )}
             </div>
           </BrutalCard>
         )}
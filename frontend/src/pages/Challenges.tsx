@@ -1,5 +1,5 @@
 import { useEffect, useState } from "react";
-import type { Category, Challenge } from "../types/challenge";
+import type { Category, ChallengeSummary } from "../types/challenge";
 import { fetchChallenges } from "../services/challenges";
 import ChallengeCard from "../components/challenge/ChallengeCard";
 import BrutalTabs from "../components/ui/BrutalTabs";
@@ -27,7 +27,7 @@ const difficultyTabs = [
 ];
 
 function Challenges() {
-  const [challenges, setChallenges] = useState<Challenge[]>([]);
+  const [challenges, setChallenges] = useState<ChallengeSummary[]>([]);
   const [category, setCategory] = useState<string>("all");
   const [difficulty, setDifficulty] = useState<string>("all");
   const [search, setSearch] = useState("");
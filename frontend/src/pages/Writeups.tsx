@@ -1,9 +1,11 @@
 import { useEffect, useState, useCallback } from "react";
 import { Link } from "react-router-dom";
 import {
+  fetchWriteup,
   fetchWriteups,
   upvoteWriteup,
   type Writeup,
+  type WriteupSummary,
 } from "../services/writeups";
 import MarkdownRenderer from "../components/common/MarkdownRenderer";
 import BrutalTabs from "../components/ui/BrutalTabs";
@@ -19,9 +21,12 @@ const sortTabs = [
 ];
 
 function Writeups() {
-  const [writeups, setWriteups] = useState<Writeup[]>([]);
+  const [writeups, setWriteups] = useState<WriteupSummary[]>([]);
+  const [details, setDetails] = useState<Record<number, Writeup>>({});
   const [total, setTotal] = useState(0);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [sort, setSort] = useState<SortOption>("newest");
   const [expandedId, setExpandedId] = useState<number | null>(null);
 
@@ -31,11 +36,24 @@ function Writeups() {
       .then((res) => {
         setWriteups(res.items);
         setTotal(res.total);
+        setNextCursor(res.next_cursor);
       })
       .catch(() => setWriteups([]))
       .finally(() => setLoading(false));
   }, [sort]);
 
+  const loadMore = () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    fetchWriteups(undefined, sort, 20, nextCursor)
+      .then((res) => {
+        setWriteups((prev) => [...prev, ...res.items]);
+        setNextCursor(res.next_cursor);
+      })
+      .catch(() => {})
+      .finally(() => setLoadingMore(false));
+  };
+
   useEffect(() => {
     loadWriteups();
   }, [loadWriteups]);
@@ -54,7 +72,16 @@ function Writeups() {
   };
 
   const toggleExpand = (id: number) => {
-    setExpandedId(expandedId === id ? null : id);
+    if (expandedId === id) {
+      setExpandedId(null);
+      return;
+    }
+    setExpandedId(id);
+    if (!details[id]) {
+      fetchWriteup(id)
+        .then((full) => setDetails((prev) => ({ ...prev, [id]: full })))
+        .catch(() => {});
+    }
   };
 
   return (
@@ -87,6 +114,7 @@ function Writeups() {
         <div className="space-y-4">
           {writeups.map((w) => {
             const isExpanded = expandedId === w.id;
+            const detail = isExpanded ? details[w.id] : undefined;
             return (
               <BrutalCard key={w.id} className="p-5">
                 <div className="flex items-start justify-between">
@@ -118,7 +146,11 @@ function Writeups() {
                     isExpanded ? "" : "max-h-32"
                   }`}
                 >
-                  <MarkdownRenderer content={w.content} />
+                  {detail ? (
+                    <MarkdownRenderer content={detail.content} html={detail.content_html} />
+                  ) : (
+                    <MarkdownRenderer content={w.excerpt} />
+                  )}
                 </div>
 
                 <button
@@ -130,6 +162,15 @@ function Writeups() {
               </BrutalCard>
             );
           })}
+          {nextCursor && (
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="w-full border-2 border-border py-2 font-retro text-base text-foreground hover:bg-muted transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? "LOADING..." : "LOAD MORE"}
+            </button>
+          )}
         </div>
       )}
     </div>
@@ -9,6 +9,7 @@ export interface DashboardStats {
   total_challenges: number;
   category_distribution: Record<string, number>;
   daily_submissions: { date: string; count: number }[];
+  computed_at: string;
 }
 
 export interface AdminUser {
@@ -34,6 +34,10 @@ export async function postRefresh(
   return data;
 }
 
+export async function postLogout(refreshToken: string): Promise<void> {
+  await api.post("/auth/logout", { refresh_token: refreshToken });
+}
+
 export async function getMe(): Promise<User> {
   const { data } = await api.get<User>("/users/me");
   return data;
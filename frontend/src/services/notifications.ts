@@ -8,6 +8,7 @@ export interface Notification {
   challenge_id: number | null;
   is_read: boolean;
   created_at: string;
+  broadcast: boolean;
 }
 
 export interface NotificationListResponse {
@@ -29,6 +30,62 @@ export async function markAsRead(id: number): Promise<void> {
   await api.put(`/notifications/${id}/read`);
 }
 
+export async function markBroadcastAsRead(id: number): Promise<void> {
+  await api.put(`/notifications/broadcasts/${id}/read`);
+}
+
 export async function markAllAsRead(): Promise<void> {
   await api.put("/notifications/read-all");
 }
+
+export type NotificationPushMessage =
+  | { type: "notification"; item: Notification }
+  | { type: "unread_count"; unread_count: number };
+
+/**
+ * 알림 WebSocket에 접속하고 끊기면 재접속한다.
+ * 서버가 푸시를 지원하지 않거나(1013) 인증에 실패하면(4001) 재접속하지 않는다.
+ * 반환된 함수를 호출하면 연결을 종료한다.
+ */
+export function subscribeNotifications(
+  onMessage: (msg: NotificationPushMessage) => void,
+  onStatusChange: (connected: boolean) => void
+): () => void {
+  let ws: WebSocket | null = null;
+  let retryTimer: ReturnType<typeof setTimeout> | null = null;
+  let retryDelay = 1000;
+  let stopped = false;
+
+  const connect = () => {
+    const token = localStorage.getItem("access_token");
+    if (!token || stopped) return;
+    const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+    ws = new WebSocket(
+      `${protocol}//${window.location.host}/ws/notifications?token=${token}`
+    );
+    ws.onopen = () => {
+      retryDelay = 1000;
+      onStatusChange(true);
+    };
+    ws.onmessage = (event) => {
+      try {
+        onMessage(JSON.parse(event.data) as NotificationPushMessage);
+      } catch {
+        // 알 수 없는 메시지는 무시
+      }
+    };
+    ws.onclose = (event) => {
+      onStatusChange(false);
+      if (stopped || event.code === 1013 || event.code === 4001) return;
+      retryTimer = setTimeout(connect, retryDelay);
+      retryDelay = Math.min(retryDelay * 2, 30000);
+    };
+  };
+
+  connect();
+  return () => {
+    stopped = true;
+    if (retryTimer) clearTimeout(retryTimer);
+    ws?.close();
+  };
+}
@@ -7,6 +7,21 @@ export interface Writeup {
   challenge_id: number;
   challenge_title: string;
   content: string;
+  content_html: string | null;
+  is_public: boolean;
+  upvotes: number;
+  created_at: string;
+  updated_at: string;
+}
+
+/** 목록 항목 — 본문은 앞부분(excerpt)만 포함하며 전체는 fetchWriteup으로 가져온다. */
+export interface WriteupSummary {
+  id: number;
+  user_id: number;
+  username: string;
+  challenge_id: number;
+  challenge_title: string;
+  excerpt: string;
   is_public: boolean;
   upvotes: number;
   created_at: string;
@@ -14,18 +29,20 @@ export interface Writeup {
 }
 
 export interface WriteupListResponse {
-  items: Writeup[];
+  items: WriteupSummary[];
   total: number;
+  next_cursor: string | null;
 }
 
 export async function fetchWriteups(
   challengeId?: number,
   sort: "newest" | "oldest" | "most_upvoted" = "newest",
   limit = 20,
-  offset = 0
+  cursor?: string
 ): Promise<WriteupListResponse> {
-  const params: Record<string, string | number> = { sort, limit, offset };
+  const params: Record<string, string | number> = { sort, limit };
   if (challengeId) params.challenge_id = challengeId;
+  if (cursor) params.cursor = cursor;
   const { data } = await api.get<WriteupListResponse>("/writeups", { params });
   return data;
 }
@@ -1,6 +1,12 @@
 import { create } from "zustand";
 import type { User } from "../types/user";
-import { getMe, postLogin, postRefresh, postRegister } from "../services/auth";
+import {
+  getMe,
+  postLogin,
+  postLogout,
+  postRefresh,
+  postRegister,
+} from "../services/auth";
 
 interface AuthState {
   user: User | null;
@@ -39,6 +45,11 @@ const useAuthStore = create<AuthState>((set) => ({
   },
 
   logout: () => {
+    const refreshToken = localStorage.getItem("refresh_token");
+    if (refreshToken) {
+      // 서버 세션 폐기는 best-effort — 실패해도 로컬 로그아웃은 진행한다
+      postLogout(refreshToken).catch(() => undefined);
+    }
     localStorage.removeItem("access_token");
     localStorage.removeItem("refresh_token");
     set({ user: null });
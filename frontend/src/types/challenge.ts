@@ -11,16 +11,13 @@ export interface Hint {
   content: string;
 }
 
-export interface Challenge {
+export interface ChallengeSummary {
   id: number;
   title: string;
-  description: string;
   category: Category;
   difficulty: number;
   points: number;
   is_dynamic: boolean;
-  files: string[] | null;
-  hints: Hint[] | null;
   tags: string[] | null;
   solve_count: number;
   is_active: boolean;
@@ -29,8 +26,14 @@ export interface Challenge {
   is_solved: boolean;
 }
 
+export interface Challenge extends ChallengeSummary {
+  description: string;
+  files: string[] | null;
+  hints: Hint[] | null;
+}
+
 export interface ChallengeListResponse {
-  items: Challenge[];
+  items: ChallengeSummary[];
   next_cursor: number | null;
   total: number;
 }